@@ -0,0 +1,146 @@
+"""
+프레임 컨테이너 vs 캡처마다 파일 하나 벤치마크
+
+같은 인코딩 데이터(ROI 프레임)를 두 방식으로 저장
+- files: 기존 방식, 프레임마다 <elapsed>.png 파일 하나
+- container: frame_container.ContainerWriter, 파일 하나에 이어서 쓰고 끝에 인덱스
+
+측정 항목
+- write: 쓰기 시간, 초당 프레임 수, MB/s (인코딩 제외, --fsync면 끝에 fsync 포함)
+- copy: 세션 폴더를 다른 폴더로 복사하는 시간 (세션 옮기기)
+- random_read: 컨테이너에서 임의의 k번째 프레임 읽기 시간
+
+사용 예:
+    python benchmarks/bench_container.py --frames 10000
+    python benchmarks/bench_container.py --frames 10000 --dir /media/sdcard/bench --fsync --json
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from capture_codecs import OutputCodec
+from frame_container import CONTAINER_NAME, ContainerReader, ContainerWriter
+
+
+def make_payloads(shape, codec, count=16):
+    """프레임마다 내용이 바뀌도록 인코딩된 프레임 몇 장 준비 (돌려가며 사용)"""
+    rng = np.random.default_rng(0)
+    height, width = shape[:2]
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    payloads = []
+    for i in range(count):
+        frame = np.empty(shape, dtype=np.uint8)
+        frame[...] = ((x + i * 8) % 256)[None, :, None]
+        frame = np.clip(frame + rng.normal(0, 6, size=shape), 0, 255).astype(np.uint8)
+        payloads.append(codec.encode(frame))
+    return payloads
+
+
+def write_files(session_dir, payloads, frames, ext, fsync):
+    os.makedirs(session_dir)
+    t0 = time.perf_counter()
+    for k in range(frames):
+        with open(os.path.join(session_dir, f"{k * 0.05:.2f}{ext}"), 'wb') as f:
+            f.write(payloads[k % len(payloads)])
+    if fsync:
+        os.sync()  # 쓴 데이터를 디스크에 반영
+    return time.perf_counter() - t0
+
+
+def write_container(session_dir, payloads, frames, ext, codec, fsync):
+    os.makedirs(session_dir)
+    t0 = time.perf_counter()
+    container = ContainerWriter(os.path.join(session_dir, CONTAINER_NAME), codec=codec)
+    for k in range(frames):
+        container.append(f"{k * 0.05:.2f}{ext}", payloads[k % len(payloads)], timestamp_ns=k * 50_000_000)
+    container.close()
+    if fsync:
+        os.sync()  # 쓴 데이터를 디스크에 반영
+    return time.perf_counter() - t0
+
+
+def copy_time(session_dir, dest_dir, fsync):
+    t0 = time.perf_counter()
+    shutil.copytree(session_dir, dest_dir)
+    if fsync:
+        os.sync()
+    return time.perf_counter() - t0
+
+
+def dir_bytes(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def run(frames, shape, fmt, level, base_dir, fsync, reads):
+    """
+    두 방식의 쓰기/복사 시간, 컨테이너 임의 접근 시간 측정
+
+    Returns:
+        dict: 방식별 결과
+    """
+    codec = OutputCodec(fmt, level)
+    payloads = make_payloads(shape, codec)
+    results = {}
+    with tempfile.TemporaryDirectory(dir=base_dir) as tmp_dir:
+        for kind in ('files', 'container'):
+            session_dir = os.path.join(tmp_dir, kind)
+            if kind == 'files':
+                elapsed = write_files(session_dir, payloads, frames, codec.ext, fsync)
+            else:
+                elapsed = write_container(session_dir, payloads, frames, codec.ext, codec, fsync)
+            size = dir_bytes(session_dir)
+            copied = copy_time(session_dir, os.path.join(tmp_dir, f"{kind}_copy"), fsync)
+            results[kind] = {
+                'files': len(os.listdir(session_dir)),
+                'bytes': size,
+                'write_s': elapsed,
+                'write_frames_per_s': frames / elapsed,
+                'write_mb_per_s': size / elapsed / 1e6,
+                'copy_s': copied,
+            }
+
+        # 컨테이너 임의 접근 (k번째 프레임만 읽어서 디코딩)
+        with ContainerReader(os.path.join(tmp_dir, 'container', CONTAINER_NAME)) as reader:
+            rng = np.random.default_rng(1)
+            picks = rng.integers(0, len(reader), size=reads)
+            t0 = time.perf_counter()
+            for k in picks:
+                reader.read(int(k))
+            results['container']['random_read_ms'] = (time.perf_counter() - t0) / reads * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame container vs one-file-per-capture benchmark (write and copy time)")
+    parser.add_argument('--frames', type=int, default=10000)
+    parser.add_argument('--roi', default='260x200', help="ROI size WxH (default: 260x200)")
+    parser.add_argument('--format', default='png', help="output format (default: png)")
+    parser.add_argument('--level', type=int, help="png compression level or jpg/webp quality")
+    parser.add_argument('--dir', help="directory on the disk to test (default: system temp)")
+    parser.add_argument('--fsync', action='store_true', help="include syncing to disk in write/copy times")
+    parser.add_argument('--reads', type=int, default=200, help="random container reads to time")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    width, height = map(int, args.roi.lower().split('x'))
+    results = run(args.frames, (height, width, 3), args.format, args.level, args.dir, args.fsync, args.reads)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for kind, r in results.items():
+        print(f"{kind:>9}: {r['files']:>6} files  {r['bytes'] / 1e6:8.1f} MB  write {r['write_s']:6.2f}s "
+              f"({r['write_frames_per_s']:8.0f} frames/s, {r['write_mb_per_s']:6.1f} MB/s)  copy {r['copy_s']:6.2f}s")
+    print(f"container random read: {results['container']['random_read_ms']:.2f} ms/frame")
+    print(f"copy time reduced by {1 - results['container']['copy_s'] / results['files']['copy_s']:.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+단일 appsink vs 2갈래(tee) 파이프라인 CPU 사용량 비교 (videotestsrc, CSI 카메라 불필요)
+
+- single: 전체 해상도 1갈래, 미리보기는 Python에서 cv2.resize (기존 방식)
+- dual: tee로 캡처 갈래(전체 해상도) + 미리보기 갈래(저해상도, 낮은 fps) 분리
+
+두 방식 모두 캡처 갈래 프레임은 전부 읽고, 미리보기는 preview fps로 축소 이미지 준비
+OpenCV GStreamer 지원(single)과 PyGObject(dual)가 필요
+
+사용 예:
+    python benchmarks/bench_dual_branch.py --seconds 10
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gst_pipeline
+
+CAPTURE_SIZE = (1640, 1232)
+
+
+def run_single(seconds, preview_size, preview_fps):
+    """기존 방식: 전체 프레임을 읽고 미리보기 fps마다 Python에서 축소"""
+    cap = cv2.VideoCapture(gst_pipeline.test_pipeline(capture_width=CAPTURE_SIZE[0], capture_height=CAPTURE_SIZE[1]), cv2.CAP_GSTREAMER)
+    if not cap.isOpened():
+        raise SystemExit("Failed to open single-branch pipeline (is OpenCV built with GStreamer?)")
+    frames = previews = 0
+    next_preview = 0.0
+    try:
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        while time.perf_counter() - wall0 < seconds:
+            ret, frame = cap.read()
+            if not ret:
+                continue
+            frames += 1
+            now = time.perf_counter()
+            if now >= next_preview:
+                cv2.resize(frame, preview_size)
+                previews += 1
+                next_preview = now + 1.0 / preview_fps
+        cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    finally:
+        cap.release()
+    return {'capture_frames': frames, 'preview_frames': previews, 'cpu_percent': cpu / wall * 100}
+
+
+def run_dual(seconds, preview_size, preview_fps):
+    """2갈래 파이프라인: 미리보기 갈래가 이미 축소/감속되어 나옴"""
+    if gst_pipeline.Gst is None:
+        raise SystemExit("PyGObject GStreamer bindings are required for the dual-branch pipeline")
+    preview_branch = {'width': preview_size[0], 'height': preview_size[1], 'framerate': int(preview_fps)}
+    cap = gst_pipeline.AppSinkPipeline(gst_pipeline.dual_pipeline(capture_width=CAPTURE_SIZE[0], capture_height=CAPTURE_SIZE[1], preview_branch=preview_branch, test=True))
+    counts = {'capture': 0, 'preview': 0}
+    stop = threading.Event()
+
+    def reader(name):
+        while not stop.is_set():
+            ret, _, _ = cap.read(name, timeout=0.1)
+            if ret:
+                counts[name] += 1
+
+    threads = [threading.Thread(target=reader, args=(name,), daemon=True) for name in counts]
+    try:
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    finally:
+        cap.release()
+    return {'capture_frames': counts['capture'], 'preview_frames': counts['preview'], 'cpu_percent': cpu / wall * 100}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single appsink vs tee'd capture/preview branches: CPU usage")
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--preview-size', default='264x352', help="preview branch WxH (default: 264x352)")
+    parser.add_argument('--preview-fps', type=float, default=10.0)
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    preview_size = tuple(map(int, args.preview_size.lower().split('x')))
+    results = {
+        'single': run_single(args.seconds, preview_size, args.preview_fps),
+        'dual': run_dual(args.seconds, preview_size, args.preview_fps),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, r in results.items():
+        print(f"{name:>6}: {r['capture_frames']} capture frames, {r['preview_frames']} preview frames, CPU {r['cpu_percent']:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
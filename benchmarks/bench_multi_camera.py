@@ -0,0 +1,119 @@
+"""
+카메라 수에 따른 CPU/메모리 사용량: 한 프로세스 N카메라 vs 카메라당 프로세스 1개
+
+합성 프레임 소스(SyntheticSource)로 같은 캡처 세션을 실행
+- single-process: 한 프로세스에서 N카메라를 하나의 캡처 엔진(스케줄러 1개, 저장 풀 1개)으로
+- multi-process: 카메라마다 별도 프로세스 (기존 main_0.py/main_1.py 방식)
+CPU는 사용자+시스템 시간 합, 메모리는 프로세스별 최대 RSS 합
+
+사용 예:
+    python benchmarks/bench_multi_camera.py --max-cameras 4 --seconds 10
+"""
+import argparse
+import contextlib
+import copy
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from capture_engine import DEFAULT_SESSION, CaptureEngine
+from frame_sources import SyntheticSource
+
+
+def run_session(camera_ids, seconds, interval, fps, out_dir):
+    """
+    현재 프로세스에서 camera_ids 카메라로 캡처 세션 1회 실행
+
+    Returns:
+        dict: 'cpu_s', 'max_rss_mb', 'written'
+    """
+    sources = [SyntheticSource(camera_id=camera_id, fps=fps) for camera_id in camera_ids]
+    for source in sources:
+        source.start()
+    for source in sources:
+        source.wait_for_frame(timeout=5)
+
+    cameras = []
+    for source in sources:
+        spec = copy.deepcopy(DEFAULT_SESSION)
+        spec.update(base_path=out_dir, target=f"camera{source.camera_id}", cap_time=[{'end_point': seconds, 'interval': interval}])
+        cameras.append((source, spec))
+
+    cpu0 = time.process_time()
+    engine = CaptureEngine(cameras)
+    stats = engine.run()
+    cpu = time.process_time() - cpu0
+    for source in sources:
+        source.stop()
+
+    return {
+        'cpu_s': cpu,
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'written': stats['writer']['written'] if stats['writer'] else 0,
+    }
+
+
+def run_child(camera_ids, args, out_dir):
+    """
+    별도 프로세스에서 camera_ids 카메라로 세션 실행
+
+    Returns:
+        subprocess.Popen: 결과 JSON을 stdout 마지막 줄에 출력하는 프로세스
+    """
+    return subprocess.Popen([sys.executable, os.path.abspath(__file__), '--child', *map(str, camera_ids), '--seconds', str(args.seconds),
+                             '--interval', str(args.interval), '--fps', str(args.fps), '--out', out_dir],
+                            stdout=subprocess.PIPE, text=True)
+
+
+def collect(procs):
+    """
+    자식 프로세스 결과 합산
+    """
+    results = [json.loads(proc.communicate()[0].strip().splitlines()[-1]) for proc in procs]
+    return {key: sum(r[key] for r in results) for key in ('cpu_s', 'max_rss_mb', 'written')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU and memory vs camera count: one process for N cameras vs one process per camera")
+    parser.add_argument('--max-cameras', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10.0, help="session length")
+    parser.add_argument('--interval', type=float, default=0.1, help="capture interval per camera")
+    parser.add_argument('--fps', type=float, default=21.0, help="synthetic camera frame rate")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    parser.add_argument('--child', type=int, nargs='+', help=argparse.SUPPRESS)
+    parser.add_argument('--out', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        # 자식 프로세스: 세션 결과만 JSON으로 출력 (캡처 로그는 버림)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = run_session(args.child, args.seconds, args.interval, args.fps, args.out)
+        print(json.dumps(result))
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        for count in range(1, args.max_cameras + 1):
+            # 측정마다 새 프로세스에서 실행 (최대 RSS가 이전 측정의 영향을 받지 않도록)
+            results.append({
+                'cameras': count,
+                'single_process': collect([run_child(range(count), args, out_dir)]),
+                'multi_process': collect([run_child([i], args, out_dir) for i in range(count)]),
+            })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'cameras':>7} | {'1 process: CPU s':>16} {'RSS MB':>8} {'frames':>6} | {'N processes: CPU s':>18} {'RSS MB':>8} {'frames':>6}")
+    for r in results:
+        s, m = r['single_process'], r['multi_process']
+        print(f"{r['cameras']:>7} | {s['cpu_s']:>16.2f} {s['max_rss_mb']:>8.0f} {s['written']:>6} | {m['cpu_s']:>18.2f} {m['max_rss_mb']:>8.0f} {m['written']:>6}")
+
+
+if __name__ == '__main__':
+    main()
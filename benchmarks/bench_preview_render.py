@@ -0,0 +1,122 @@
+"""
+미리보기 렌더링 벤치마크 (Tk 디스플레이 필요)
+
+- legacy: 기존 update_preview_display 방식
+  (프레임마다 resize, cvtColor, 새 PhotoImage, canvas.delete("all"), create_image)
+- renderer: PreviewRenderer (UI fps 제한, PhotoImage/캔버스 아이템 재사용)
+
+합성 프레임을 카메라 속도로 넣고, 그리기 1회당 시간(ms)과 프로세스 CPU 사용률(%) 측정
+
+사용 예:
+    python benchmarks/bench_preview_render.py --seconds 10 --camera-fps 21 --ui-fps 15
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tkinter as tk
+
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from preview_renderer import PreviewRenderer
+
+ROI = (240, 100, 260, 800)
+
+
+def make_frames(shape, count=8):
+    """프레임마다 내용이 바뀌도록 합성 프레임 몇 장 준비"""
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, size=shape, dtype=np.uint8) for _ in range(count)]
+
+
+class LegacyRenderer:
+    """기존 update_preview_display와 같은 방식으로 그림"""
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.rendered = 0
+        self.render_time = 0.0
+
+    def submit(self, frame, frame_id=None, roi=None):
+        t0 = time.perf_counter()
+        canvas_width, canvas_height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        height, width = frame.shape[:2]
+        scale = min(canvas_width / width, canvas_height / height)
+        new_width, new_height = int(width * scale), int(height * scale)
+        resized = cv2.resize(frame, (new_width, new_height))
+        xmin, ymin, roi_width, roi_height = roi
+        x0, y0 = int(xmin * scale), int(ymin * scale)
+        cv2.rectangle(resized, (x0, y0), (x0 + int(roi_width * scale), y0 + int(roi_height * scale)), (0, 255, 0), 2)
+        rgb_frame = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+        self.photo = ImageTk.PhotoImage(image=Image.fromarray(rgb_frame))
+        self.canvas.delete("all")
+        self.canvas.create_image(canvas_width / 2, canvas_height / 2, anchor=tk.CENTER, image=self.photo)
+        self.rendered += 1
+        self.render_time += time.perf_counter() - t0
+
+    def stats(self):
+        return {'rendered': self.rendered, 'skipped': 0, 'ms_per_frame': self.render_time / self.rendered * 1000 if self.rendered else 0.0}
+
+
+def run(kind, frames, seconds, camera_fps, ui_fps):
+    """
+    한 가지 방식으로 seconds초 동안 미리보기 실행
+
+    Returns:
+        dict: 그린 프레임 수, 프레임당 ms, CPU %
+    """
+    root = tk.Tk()
+    root.geometry("420x380")
+    canvas = tk.Canvas(root, bg='black', width=400, height=350)
+    canvas.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    renderer = LegacyRenderer(canvas) if kind == 'legacy' else PreviewRenderer(canvas, ui_fps=ui_fps)
+
+    state = {'seq': 0}
+    period_ms = max(1, int(1000 / camera_fps))
+
+    def feed():
+        # 미리보기 스레드처럼 프레임마다 after_idle로 그리기 요청
+        seq = state['seq']
+        state['seq'] += 1
+        root.after_idle(lambda: renderer.submit(frames[seq % len(frames)], frame_id=seq, roi=ROI))
+        root.after(period_ms, feed)
+
+    root.after(period_ms, feed)
+    root.after(int(seconds * 1000), root.quit)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    root.mainloop()
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    root.destroy()
+
+    result = renderer.stats()
+    result.update({'frames_in': state['seq'], 'cpu_percent': cpu / wall * 100})
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preview rendering benchmark (ms/frame and CPU%, before/after)")
+    parser.add_argument('--frame', default='958x720', help="frame size HxW (default: 958x720)")
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--camera-fps', type=float, default=21.0)
+    parser.add_argument('--ui-fps', type=float, default=15.0)
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    height, width = map(int, args.frame.lower().split('x'))
+    frames = make_frames((height, width, 3))
+    results = {kind: run(kind, frames, args.seconds, args.camera_fps, args.ui_fps) for kind in ('legacy', 'renderer')}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for kind, r in results.items():
+        print(f"{kind:>8}: {r['frames_in']} frames in, {r['rendered']} drawn, {r['skipped']} skipped, "
+              f"{r['ms_per_frame']:.2f} ms/frame, CPU {r['cpu_percent']:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+캡처 1회당 복사량/시간 비교 벤치마크
+
+- full: 기존 방식, 전체 프레임 copy() 후 ROI 슬라이스
+- roi: 링 버퍼에서 ROI 영역만 재사용 버퍼로 복사 (FrameRingBuffer.read(region, out))
+
+--contention 옵션을 주면 별도 스레드가 미리보기처럼 계속 링 버퍼에 프레임을 씀
+
+사용 예:
+    python benchmarks/bench_roi_copy.py --iterations 2000 --contention
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from frame_buffer import FrameRingBuffer, FrameStamper, RoiBufferPool
+
+
+def _producer(ring, stamper, frame, stop, fps):
+    """미리보기 스레드 흉내: fps 간격으로 링 버퍼 슬롯에 프레임 씀"""
+    period = 1.0 / fps
+    while not stop.is_set():
+        slot, buf = ring.begin_write()
+        np.copyto(buf, frame)
+        seq, ts_ns, _ = stamper.stamp(0, time.monotonic_ns())
+        ring.commit(slot, seq, ts_ns)
+        time.sleep(period)
+
+
+def run(frame_shape, roi, iterations, contention, fps):
+    """
+    두 방식의 캡처 1회당 복사 바이트 수와 소요 시간 측정
+
+    Returns:
+        dict: 방식별 결과
+    """
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, size=frame_shape, dtype=np.uint8)
+    ring = FrameRingBuffer(capacity=8)
+    stamper = FrameStamper()
+    ring.push(frame, *stamper.stamp(0, time.monotonic_ns())[:2])
+
+    stop = threading.Event()
+    producer = None
+    if contention:
+        producer = threading.Thread(target=_producer, args=(ring, stamper, frame, stop, fps), daemon=True)
+        producer.start()
+
+    xmin, ymin, w, h = roi
+    pool = RoiBufferPool((h, w, frame_shape[2]), count=4)
+    results = {}
+    try:
+        # 기존 방식: 전체 프레임 복사 후 ROI 슬라이스
+        copied = 0
+        retries = 0
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            while True:
+                slot, seq, _ = ring.latest()
+                full = ring.read(slot, seq)
+                if full is not None:
+                    break
+                retries += 1
+            save_frame = full[ymin:ymin+h, xmin:xmin+w]
+            copied += full.nbytes
+        elapsed = time.perf_counter() - t0
+        results['full'] = {'bytes_per_capture': copied // iterations, 'us_per_capture': elapsed / iterations * 1e6, 'retries': retries}
+
+        # ROI만 재사용 버퍼로 복사
+        copied = 0
+        retries = 0
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            buf = pool.acquire()
+            while True:
+                slot, seq, _ = ring.latest()
+                save_frame = ring.read(slot, seq, region=roi, out=buf)
+                if save_frame is not None:
+                    break
+                retries += 1
+            copied += save_frame.nbytes
+            pool.release(buf)
+        elapsed = time.perf_counter() - t0
+        results['roi'] = {'bytes_per_capture': copied // iterations, 'us_per_capture': elapsed / iterations * 1e6, 'retries': retries}
+    finally:
+        stop.set()
+        if producer:
+            producer.join()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ROI copy benchmark (bytes copied per capture, before/after)")
+    parser.add_argument('--frame', default='958x720', help="frame size HxW (default: 958x720)")
+    parser.add_argument('--roi', default='240,100,260,800', help="xmin,ymin,width,height (default: 240,100,260,800)")
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--contention', action='store_true', help="write frames into the ring buffer from another thread")
+    parser.add_argument('--fps', type=float, default=21.0, help="producer frame rate with --contention")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    height, width = map(int, args.frame.lower().split('x'))
+    roi = tuple(map(int, args.roi.split(',')))
+    results = run((height, width, 3), roi, args.iterations, args.contention, args.fps)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, r in results.items():
+        print(f"{name:>5}: {r['bytes_per_capture']:>9,d} bytes/capture  {r['us_per_capture']:8.1f} us/capture  ({r['retries']} retries)")
+    saved = 1 - results['roi']['bytes_per_capture'] / results['full']['bytes_per_capture']
+    print(f"bytes copied reduced by {saved:.1%}")
+
+
+if __name__ == '__main__':
+    main()
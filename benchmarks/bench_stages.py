@@ -0,0 +1,291 @@
+"""
+캡처 파이프라인 단계별 마이크로 벤치마크 (디스플레이/카메라 없이 실행)
+
+합성 프레임으로 각 단계를 따로 반복 측정
+- acquire: 프레임 소스에서 링 버퍼 슬롯으로 읽기 + 번호/촬영 시각 부여 (SyntheticSource, 속도 제한 없음)
+- roi_copy: 링 버퍼에서 ROI만 재사용 버퍼로 복사 (FrameRingBuffer.read)
+- color_convert: 전체 프레임 BGR → RGB
+- preview_resize: 미리보기 캔버스 크기로 축소
+- photoimage: 축소한 RGB 프레임 → PIL Image → PhotoImage 갱신 (Tk 디스플레이 없으면 PIL 변환까지만)
+- gate_mad / gate_hist: ROI 변화 감지 비교 1회 (change_gate.ChangeGate)
+- roi_stats / roi_profile: ROI 색 통계 계산 (roi_stats.colour_stats, 긴 축 줄별 평균 roi_stats.row_profile)
+- png_encode / jpeg_encode: ROI 인코딩
+- file_write: 인코딩된 PNG 바이트를 파일로 쓰기
+
+결과는 JSON으로 저장하고 (--save), 이전 결과와 비교 가능 (--compare)
+중앙값(p50)이 tolerance 이상 느려진 단계가 있으면 종료 코드 1
+
+사용 예:
+    python benchmarks/bench_stages.py --save baseline.json
+    python benchmarks/bench_stages.py --compare baseline.json --tolerance 0.15
+    python benchmarks/bench_stages.py --stages roi_copy png_encode --json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from change_gate import ChangeGate
+from frame_buffer import FrameRingBuffer, FrameStamper, RoiBufferPool
+from frame_sources import SyntheticSource
+from roi_stats import colour_stats, row_profile
+
+STAGES = ('acquire', 'roi_copy', 'color_convert', 'preview_resize', 'photoimage', 'gate_mad', 'gate_hist', 'roi_stats', 'roi_profile', 'png_encode', 'jpeg_encode', 'file_write')
+
+
+def measure(fn, iterations, warmup):
+    """
+    fn을 반복 실행하면서 1회 소요 시간 측정
+
+    Returns:
+        dict: 반복 횟수, 평균/p50/p95/최대 시간(ms), 초당 처리 횟수
+    """
+    for _ in range(warmup):
+        fn()
+    times = np.empty(iterations)
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        times[i] = time.perf_counter() - t0
+    times *= 1000
+    return {
+        'iterations': iterations,
+        'mean_ms': float(times.mean()),
+        'p50_ms': float(np.percentile(times, 50)),
+        'p95_ms': float(np.percentile(times, 95)),
+        'max_ms': float(times.max()),
+        'per_s': float(1000 / times.mean()) if times.mean() > 0 else 0.0,
+    }
+
+
+def preview_size(frame_size, canvas_size):
+    """프레임을 캔버스에 비율 유지해서 넣을 때 크기 (PreviewRenderer.layout과 같은 계산)"""
+    scale = min(canvas_size[0] / frame_size[0], canvas_size[1] / frame_size[1])
+    return max(1, int(frame_size[0] * scale)), max(1, int(frame_size[1] * scale))
+
+
+def make_photo_target():
+    """
+    PhotoImage 갱신 대상 준비
+
+    Returns:
+        tuple: (Tk root, ImageTk 모듈), 디스플레이가 없으면 (None, None)
+    """
+    try:
+        import tkinter as tk
+        from PIL import ImageTk
+        root = tk.Tk()
+        root.withdraw()
+        return root, ImageTk
+    except Exception:
+        return None, None
+
+
+def run(stages, frame_size, roi, canvas_size, iterations, warmup, png_compression, jpeg_quality, fsync):
+    """
+    선택한 단계 측정
+
+    Args:
+        stages (list): 측정할 단계 이름
+        frame_size (tuple): 프레임 크기 (w, h)
+        roi (tuple): (xmin, ymin, width, height)
+        canvas_size (tuple): 미리보기 캔버스 크기 (w, h)
+
+    Returns:
+        dict: 단계별 결과 (측정하지 못한 단계는 'skipped' 사유)
+    """
+    width, height = frame_size
+    xmin, ymin, roi_width, roi_height = roi
+
+    # 합성 프레임을 링 버퍼에 채워 둠
+    source = SyntheticSource(width=width, height=height, fps=None)
+    source._open()
+    ring = FrameRingBuffer(capacity=8)
+    stamper = FrameStamper()
+    _, frame, _ = source._read(None)
+    ring.push(frame, *stamper.stamp(0, time.monotonic_ns())[:2])
+
+    pool = RoiBufferPool((roi_height, roi_width, 3), count=4)
+    rgb = np.empty_like(frame)
+    size = preview_size(frame_size, canvas_size)
+    resized = np.empty((size[1], size[0], 3), dtype=np.uint8)
+    resized_rgb = np.empty_like(resized)
+    cv2.resize(frame, size, dst=resized)
+    cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=resized_rgb)
+    save_frame = np.ascontiguousarray(frame[ymin:ymin + roi_height, xmin:xmin + roi_width])
+    png_params = [cv2.IMWRITE_PNG_COMPRESSION, png_compression]
+    jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+    encoded = cv2.imencode('.png', save_frame, png_params)[1]
+
+    def acquire():
+        slot, buf = ring.begin_write()
+        ret, frame, pos_msec = source._read(buf)
+        seq, ts_ns, _ = stamper.stamp(pos_msec, time.monotonic_ns())
+        ring.commit(slot, seq, ts_ns)
+
+    def roi_copy():
+        buf = pool.acquire()
+        slot, seq, _ = ring.latest()
+        ring.read(slot, seq, region=roi, out=buf)
+        pool.release(buf)
+
+    def color_convert():
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+
+    def preview_resize():
+        cv2.resize(frame, size, dst=resized)
+
+    # 변화 감지: 기준 프레임을 정해 두고 매번 비교 (threshold가 커서 기준은 바뀌지 않음)
+    gates = {method: ChangeGate(method, threshold=float('inf')) for method in ('mad', 'hist')}
+    for gate in gates.values():
+        gate.check(save_frame, 0)
+
+    def png_encode():
+        cv2.imencode('.png', save_frame, png_params)
+
+    def jpeg_encode():
+        cv2.imencode('.jpg', save_frame, jpeg_params)
+
+    results = {}
+    root = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        counter = [0]
+
+        def file_write():
+            # 파일마다 새 이름 (덮어쓰기는 페이지 캐시 재사용으로 더 빠름)
+            counter[0] += 1
+            with open(os.path.join(tmp_dir, f"{counter[0]:06d}.png"), 'wb') as f:
+                f.write(encoded)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+        funcs = {
+            'acquire': acquire,
+            'roi_copy': roi_copy,
+            'color_convert': color_convert,
+            'preview_resize': preview_resize,
+            'gate_mad': lambda: gates['mad'].check(save_frame, 0),
+            'gate_hist': lambda: gates['hist'].check(save_frame, 0),
+            'roi_stats': lambda: colour_stats(save_frame),
+            'roi_profile': lambda: row_profile(save_frame),
+            'png_encode': png_encode,
+            'jpeg_encode': jpeg_encode,
+            'file_write': file_write,
+        }
+
+        try:
+            for stage in stages:
+                if stage == 'photoimage':
+                    if root is None:
+                        root, ImageTk = make_photo_target()
+                    if root is None:
+                        # 디스플레이 없음: PhotoImage 전 단계(PIL 변환)만 측정
+                        results[stage] = measure(lambda: Image.fromarray(resized_rgb), iterations, warmup)
+                        results[stage]['note'] = "no Tk display, PIL conversion only"
+                    else:
+                        photo = ImageTk.PhotoImage(image=Image.fromarray(resized_rgb))
+                        results[stage] = measure(lambda: photo.paste(Image.fromarray(resized_rgb)), iterations, warmup)
+                    continue
+                results[stage] = measure(funcs[stage], iterations, warmup)
+        finally:
+            if root is not None:
+                root.destroy()
+
+    # 인코딩/쓰기 단계는 파일 1개 크기도 기록
+    for stage in ('png_encode', 'file_write'):
+        if stage in results:
+            results[stage]['bytes'] = int(encoded.nbytes)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    이전 결과와 단계별 p50 비교
+
+    Returns:
+        list: (단계, 이전 p50, 현재 p50, 변화율, 느려졌는지) 목록
+    """
+    rows = []
+    for stage, r in results.items():
+        old = baseline.get('stages', {}).get(stage)
+        if not old or not old.get('p50_ms'):
+            continue
+        change = r['p50_ms'] / old['p50_ms'] - 1
+        rows.append((stage, old['p50_ms'], r['p50_ms'], change, change > tolerance))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage capture pipeline micro-benchmarks on synthetic frames")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--frame', default='958x720', help="frame size HxW (default: 958x720)")
+    parser.add_argument('--roi', default='240,100,260,800', help="xmin,ymin,width,height (default: 240,100,260,800)")
+    parser.add_argument('--canvas', default='480x640', help="preview canvas size HxW (default: 480x640)")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--png-compression', type=int, default=3, help="cv2 PNG compression level 0-9 (default: 3)")
+    parser.add_argument('--jpeg-quality', type=int, default=95)
+    parser.add_argument('--fsync', action='store_true', help="fsync every file in the file_write stage")
+    parser.add_argument('--save', help="write results to this JSON file")
+    parser.add_argument('--compare', help="compare against a JSON file written by --save")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="allowed p50 slowdown before a stage counts as a regression")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    height, width = map(int, args.frame.lower().split('x'))
+    canvas_height, canvas_width = map(int, args.canvas.lower().split('x'))
+    roi = tuple(map(int, args.roi.split(',')))
+
+    stages = run(args.stages, (width, height), roi, (canvas_width, canvas_height), args.iterations, args.warmup,
+                 args.png_compression, args.jpeg_quality, args.fsync)
+    report = {
+        'config': {
+            'frame': [height, width], 'roi': list(roi), 'canvas': [canvas_height, canvas_width],
+            'iterations': args.iterations, 'warmup': args.warmup,
+            'png_compression': args.png_compression, 'jpeg_quality': args.jpeg_quality, 'fsync': args.fsync,
+        },
+        'env': {
+            'python': platform.python_version(), 'machine': platform.machine(),
+            'opencv': cv2.__version__, 'numpy': np.__version__, 'threads': cv2.getNumThreads(),
+        },
+        'stages': stages,
+    }
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare(stages, baseline, args.tolerance)
+        report['compare'] = {stage: {'baseline_p50_ms': old, 'p50_ms': new, 'change': change, 'regression': slower}
+                             for stage, old, new, change, slower in rows}
+        regressions = [row[0] for row in rows if row[4]]
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for stage, r in stages.items():
+            note = f"  ({r['note']})" if 'note' in r else ""
+            print(f"{stage:>15}: p50 {r['p50_ms']:8.3f} ms  p95 {r['p95_ms']:8.3f} ms  {r['per_s']:10.1f}/s{note}")
+        if args.compare:
+            print(f"compared with {args.compare} (tolerance {args.tolerance:.0%}):")
+            for stage, old, new, change, slower in rows:
+                print(f"{stage:>15}: {old:8.3f} -> {new:8.3f} ms  {change:+.1%}{'  REGRESSION' if slower else ''}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
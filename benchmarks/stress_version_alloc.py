@@ -0,0 +1,131 @@
+"""
+세션 버전 폴더 할당 동시성 테스트 + 속도 비교
+
+여러 프로세스가 같은 titer 폴더에서 동시에 버전 폴더를 할당 (main_0.py, main_1.py가 같이 시작하는 상황)
+- locked: session_versions.next_version_path (카운터 파일 잠금 + mkdir)
+- legacy: 예전 방식 (폴더 목록 최대값 + 1, makedirs exist_ok) - 같은 번호를 받는 충돌 수 확인용
+
+확인 항목
+- 모든 프로세스가 받은 번호가 겹치지 않는지, 만들어진 폴더 수 = 할당 수인지
+- 카운터 파일 값 = 다음 번호인지
+- 기존 세션 폴더가 많을 때 할당 1회 시간 (locked vs legacy)
+
+문제가 있으면 종료 코드 1
+
+사용 예:
+    python benchmarks/stress_version_alloc.py --processes 16 --per-process 50
+    python benchmarks/stress_version_alloc.py --existing 5000 --dir /media/sdcard/bench --json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from session_versions import COUNTER_NAME, next_version_path, scan_next_version
+
+
+def legacy_version_path(save_path):
+    """예전 방식: 폴더 목록을 보고 최대값 + 1 (잠금 없음)"""
+    os.makedirs(save_path, exist_ok=True)
+    version_path = os.path.join(save_path, str(scan_next_version(save_path)))
+    os.makedirs(version_path, exist_ok=True)
+    return version_path
+
+
+ALLOCATORS = {'locked': next_version_path, 'legacy': legacy_version_path}
+
+
+def allocate_many(args):
+    """
+    프로세스 하나: 시작 시각까지 대기 후 count번 할당
+
+    Returns:
+        list: 받은 버전 번호
+    """
+    save_path, count, start_at, kind = args
+    allocate = ALLOCATORS[kind]
+    while time.time() < start_at:
+        time.sleep(0.001)
+    return [int(os.path.basename(allocate(save_path))) for _ in range(count)]
+
+
+def stress(base_dir, kind, processes, per_process):
+    """
+    processes개 프로세스가 동시에 per_process번씩 할당
+
+    Returns:
+        dict: 할당 수, 중복 번호 수, 만들어진 폴더 수, 카운터 값, 걸린 시간
+    """
+    with tempfile.TemporaryDirectory(dir=base_dir) as tmp_dir:
+        save_path = os.path.join(tmp_dir, 'target', 'titer')
+        start_at = time.time() + 0.5  # 모든 프로세스가 뜬 뒤 같이 시작
+        t0 = time.perf_counter()
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(allocate_many, [(save_path, per_process, start_at, kind)] * processes)
+        elapsed = time.perf_counter() - t0 - 0.5
+        versions = [v for result in results for v in result]
+        duplicates = sum(n - 1 for n in Counter(versions).values() if n > 1)
+        folders = [d for d in os.listdir(save_path) if d.isdigit()]
+        counter = None
+        if os.path.exists(os.path.join(save_path, COUNTER_NAME)):
+            with open(os.path.join(save_path, COUNTER_NAME)) as f:
+                counter = int(f.read())
+    return {
+        'allocations': len(versions),
+        'duplicates': duplicates,
+        'folders': len(folders),
+        'counter': counter,
+        'elapsed_s': max(elapsed, 0.0),
+    }
+
+
+def time_allocation(base_dir, kind, existing, repeats=50):
+    """
+    기존 세션 폴더가 existing개 있을 때 할당 1회 평균 시간 (ms)
+    """
+    with tempfile.TemporaryDirectory(dir=base_dir) as tmp_dir:
+        save_path = os.path.join(tmp_dir, 'target', 'titer')
+        os.makedirs(save_path)
+        for i in range(existing):
+            os.mkdir(os.path.join(save_path, str(i)))
+        ALLOCATORS[kind](save_path)  # 카운터 파일 생성 (첫 할당만 폴더 목록 확인)
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            ALLOCATORS[kind](save_path)
+        return (time.perf_counter() - t0) / repeats * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress-test session version allocation across concurrent processes")
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--per-process', type=int, default=50, help="allocations per process")
+    parser.add_argument('--existing', type=int, default=2000, help="existing session folders for the timing test")
+    parser.add_argument('--dir', help="directory on the disk to test (default: system temp)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for kind in ALLOCATORS:
+        results[kind] = stress(args.dir, kind, args.processes, args.per_process)
+        results[kind]['alloc_ms'] = time_allocation(args.dir, kind, args.existing)
+
+    locked = results['locked']
+    ok = (locked['duplicates'] == 0 and locked['folders'] == locked['allocations'] and locked['counter'] == locked['allocations'])
+
+    if args.json:
+        print(json.dumps(dict(results, ok=ok), indent=2))
+    else:
+        for kind, r in results.items():
+            print(f"{kind:>7}: {r['allocations']} allocations, {r['duplicates']} duplicate versions, {r['folders']} folders, "
+                  f"{r['elapsed_s']:.2f}s; {r['alloc_ms']:.3f} ms/allocation with {args.existing} existing sessions")
+        print("locked allocator OK" if ok else "locked allocator FAILED")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""
+버스트 구간 RAM 스테이징
+
+빠른 구간(예: start_delay 직후 짧은 간격 구간)은 비동기 저장으로도 디스크가 따라가지 못하므로
+지정한 구간의 캡처는 인코딩/쓰기 없이 미리 할당한 메모리(또는 tmpfs 파일) 칸에 ROI만 복사해 두고
+버스트 구간이 아닐 때(느린 구간, 세션 종료 후) 저장 풀로 넘겨서 버전 폴더에 저장
+
+- 버스트 구간 캡처 수만큼(메모리 예산 budget_bytes 이내) 칸을 미리 할당, 칸이 모두 차면 스테이징하지 않고 바로 저장 큐로
+- 스테이징한 프레임은 세션 매니페스트에 'staged'로 표시 (session_manifest)
+"""
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+def burst_windows(start_delay, cap_time, phases):
+    """
+    버스트 구간의 세션 기준 시간 범위
+
+    Args:
+        start_delay (float): 캡처 시작 전 대기 시간 (초)
+        cap_time (list): 캡처 구간 설정
+        phases (list): 버스트 구간 번호 (cap_time 인덱스, 0부터)
+
+    Returns:
+        list: [(시작 ns, 종료 ns), ...]
+    """
+    windows = []
+    start = start_delay
+    for i, phase_data in enumerate(cap_time):
+        if i in phases:
+            windows.append((round(start * 1e9), round(phase_data['end_point'] * 1e9)))
+        start = phase_data['end_point']
+    return windows
+
+
+class BurstStage:
+    """
+    카메라별 프레임 칸 배열 + 저장 대기 목록
+
+    캡처 스레드가 acquire/stage, 저장 스레드(start)가 버스트 구간 밖에서 저장 풀로 넘김
+    칸은 저장 풀이 프레임을 다 쓰면(on_done) 반납
+    """
+    def __init__(self, shapes, budget_bytes, windows=(), tmp_dir=None, max_frames=None):
+        """
+        Args:
+            shapes (dict): 카메라 key → 프레임 shape (h, w, 3)
+            budget_bytes (int): 전체 메모리 예산 상한, 카메라 수로 나눠서 칸 수 결정
+            max_frames (dict): 카메라 key → 버스트 구간 캡처 수 (칸을 이보다 많이 할당하지 않음, 0이면 할당 안 함), None이면 예산만큼
+            windows (list): 버스트 구간 시간 범위 (burst_windows), 이 구간에서는 저장 풀로 넘기지 않음
+            tmp_dir (str): 지정하면 칸 배열을 이 폴더(tmpfs 권장, 예: /dev/shm)의 메모리 맵 파일로, None이면 프로세스 메모리
+
+        Raises:
+            ValueError: 예산이 프레임 한 장보다 작을 때
+        """
+        self.budget_bytes = int(budget_bytes)
+        self.windows = list(windows)
+        self._frames = {}
+        self._free = {}
+        self._paths = []
+        self.capacity = {}  # 카메라별 칸 수
+        self.nbytes = 0  # 할당한 칸 전체 크기
+        share = self.budget_bytes // max(1, len(shapes))
+        for key, shape in shapes.items():
+            frame_bytes = int(np.prod(shape))
+            capacity = share // frame_bytes
+            needed = None if max_frames is None else max_frames.get(key, 0)
+            if needed == 0:  # 이 카메라는 버스트 구간 없음
+                self._free[key] = []
+                self.capacity[key] = 0
+                continue
+            if capacity < 1:
+                raise ValueError(f"Burst memory budget {self.budget_bytes / 1e6:.1f} MB cannot hold one {shape[1]}x{shape[0]} frame per camera")
+            if needed is not None:
+                capacity = min(capacity, needed)
+            self.nbytes += capacity * frame_bytes
+            if tmp_dir:
+                fd, path = tempfile.mkstemp(dir=tmp_dir, prefix='burst_', suffix='.npy')
+                os.close(fd)
+                self._paths.append(path)
+                self._frames[key] = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=(capacity,) + tuple(shape))
+            else:
+                self._frames[key] = np.empty((capacity,) + tuple(shape), dtype=np.uint8)
+                self._frames[key].fill(0)  # 페이지를 미리 할당 (버스트 중 page fault 방지)
+            self._free[key] = list(range(capacity - 1, -1, -1))
+            self.capacity[key] = capacity
+
+        self._lock = threading.Lock()
+        self._pending = deque()  # (key, 칸 번호, 파일명, 촬영 시각 ns, on_saved)
+        self._thread = None
+        self._running = False
+        self._t0_ns = None
+
+        # 통계
+        self._staged = 0
+        self._overflowed = 0
+        self._max_used = 0
+
+    @property
+    def pending(self):
+        """저장 풀로 아직 안 넘긴 프레임 수"""
+        return len(self._pending)
+
+    def acquire(self, key):
+        """
+        빈 칸 하나 꺼냄
+
+        Returns:
+            tuple: (칸 번호, (h, w, 3) view), 예산이 다 찼으면 None
+        """
+        with self._lock:
+            free = self._free[key]
+            if not free:
+                self._overflowed += 1
+                return None
+            k = free.pop()
+            used = sum(self.capacity[other] - len(slots) for other, slots in self._free.items())
+            self._max_used = max(self._max_used, used)
+        return k, self._frames[key][k]
+
+    def release(self, key, k):
+        """
+        칸 반납 (저장이 끝났거나 복사에 실패했을 때)
+        """
+        with self._lock:
+            self._free[key].append(k)
+
+    def stage(self, key, k, filename, timestamp_ns, on_saved=None):
+        """
+        칸에 복사한 프레임을 저장 대기 목록에 추가
+
+        Args:
+            key: 카메라 key
+            k (int): acquire()로 받은 칸 번호
+            filename (str): 저장할 파일 경로
+            timestamp_ns (int): 촬영 시각 (monotonic ns)
+            on_saved: 저장 결과 콜백 (CaptureWriter.submit 참고)
+        """
+        with self._lock:
+            self._pending.append((key, k, filename, timestamp_ns, on_saved))
+            self._staged += 1
+
+    def in_burst(self, now_ns=None):
+        """
+        지금 버스트 구간인지 (start() 전이면 False)
+        """
+        if self._t0_ns is None:
+            return False
+        elapsed_ns = (now_ns if now_ns is not None else time.monotonic_ns()) - self._t0_ns
+        return any(start_ns <= elapsed_ns < end_ns for start_ns, end_ns in self.windows)
+
+    def drain(self, writer, limit=None):
+        """
+        저장 대기 프레임을 저장 풀로 넘김 (오래된 것부터)
+
+        Args:
+            writer (CaptureWriter): 저장 풀
+            limit (int): 최대 개수, None이면 모두
+
+        Returns:
+            int: 넘긴 프레임 수
+        """
+        count = 0
+        while limit is None or count < limit:
+            with self._lock:
+                if not self._pending:
+                    break
+                key, k, filename, timestamp_ns, on_saved = self._pending.popleft()
+            writer.submit(filename, self._frames[key][k], on_done=lambda _frame, key=key, k=k: self.release(key, k),
+                          timestamp_ns=timestamp_ns, on_saved=on_saved)
+            count += 1
+        return count
+
+    def start(self, writer, t0_ns, poll=0.005):
+        """
+        저장 스레드 시작: 버스트 구간이 아니고 저장 큐가 절반 이하일 때 대기 프레임을 넘김
+
+        Args:
+            writer (CaptureWriter): 저장 풀
+            t0_ns (int): 세션 시작 시각 (스케줄러 t0, monotonic ns)
+            poll (float): 확인 간격 (초)
+        """
+        self._t0_ns = t0_ns
+        self._running = True
+
+        def worker():
+            while self._running:
+                room = writer.max_queue // 2 - writer.queue_depth
+                if self._pending and room > 0 and not self.in_burst():
+                    self.drain(writer, room)
+                else:
+                    time.sleep(poll)
+
+        self._thread = threading.Thread(target=worker, name="burst-drain", daemon=True)
+        self._thread.start()
+
+    def flush(self, writer, poll=0.005):
+        """
+        저장 스레드를 멈추고 남은 프레임을 모두 저장 풀로 넘김 (세션 종료 시, 버스트 구간 여부와 관계없이)
+
+        저장 큐가 차면 자리가 날 때까지 대기 (overflow 정책으로 버려지지 않게)
+        """
+        self._running = False
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        while self._pending:
+            room = writer.max_queue - writer.queue_depth
+            if room > 0:
+                self.drain(writer, room)
+            else:
+                time.sleep(poll)
+
+    def stats(self):
+        """
+        스테이징 통계
+
+        Returns:
+            dict: 예산, 카메라별 칸 수, 스테이징/예산 초과로 바로 저장한 프레임 수, 최대 사용 칸 수, 대기 중 프레임 수
+        """
+        with self._lock:
+            return {
+                'budget_mb': self.budget_bytes / 1e6,
+                'capacity': self.capacity,
+                'staged': self._staged,
+                'overflowed': self._overflowed,
+                'max_used': self._max_used,
+                'pending': len(self._pending),
+            }
+
+    def close(self):
+        """
+        칸 배열 해제 (tmpfs 파일이면 삭제), 저장 풀을 닫은 뒤 호출
+        """
+        self._running = False
+        self._frames = {}
+        for path in self._paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._paths = []
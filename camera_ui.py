@@ -0,0 +1,1044 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import threading
+import os
+import time
+
+from capture_codecs import OUTPUT_FORMATS, OutputCodec, benchmark_codecs, benchmark_options, format_benchmark, required_rate
+from capture_engine import CaptureEngine, save_buffered_frames, validate_session_spec
+from frame_sources import CameraSource
+import gst_pipeline
+from preview_renderer import FrameMailbox, PreviewRenderer
+
+class CameraUI:
+    """
+    젯슨나노 스크린샷 자동화
+    
+    카메라 미리보기, ROI 설정, 
+    시간 기반 자동 캡처 기능 제공
+
+    master 없이 만들면 자체 윈도우, master를 주면 그 안에 패널로 배치 (여러 카메라를 한 윈도우에)
+    """
+    def __init__(self, camera_id=0, master=None, source=None):
+        """
+        CameraUI 인스턴스 초기화
+        
+        Args:
+            camera_id (int): 사용할 카메라 ID (기본값: 0)
+            master: 패널을 배치할 부모 위젯 (없으면 새 윈도우 생성)
+            source (CameraSource): 사용할 프레임 소스 (없으면 camera_id의 CSI 카메라)
+        """
+        self.camera_id = camera_id # 카메라 식별자
+
+        if master is None:
+            # 메인 윈도우 생성 및 설정
+            self.root = tk.Tk()
+            self.root.title(f"Camera {camera_id} Control Panel")
+            self.root.geometry("850x800") # 초기 윈도우 크기
+            self.root.resizable(True, True) # 크기 조절 가능
+            self.root.minsize(800, 800) # 최소 크기 제한
+            self.container = self.root
+        else:
+            # 다른 윈도우 안의 패널
+            self.root = master.winfo_toplevel()
+            self.container = master
+        self.embedded = master is not None  # 여러 패널이 한 윈도우를 공유하는지
+
+        # 캡처 관련 기본값 설정 Variables
+        self.start_delay = 0.0 # 캡처 시작 전 대기 시간 (초)
+
+        # 캡처 타이밍 설정 List 및 default value
+        self.cap_time = [
+            {'end_point': 10.0, 'interval': 1.0}, # end_point: 해당 구간의 종료 시점 (누적 시간), interval: 해당 구간에서의 캡처 간격
+            {'end_point': 20.0, 'interval': 1.0}
+        ]
+        self.crop = {'xmin': 240, 'ymin': 100, 'width': 260, 'height': 800} # ROI default value
+        
+        # folder default name
+        self.target = 'target' 
+        self.titer = 'titer'
+        self.base_path = './sample'
+
+        # ROI 선택 관련 상태 변수
+        self.roi_selecting = False  # ROI 선택 중인지
+        self.roi_start = None  # ROI 선택 시작점
+        self.roi_widgets = []  # ROI 관련 위젯들 (활성화/비활성화 제어용)
+        
+        # 카메라 및 미리보기 관련 변수
+        self.camera_source = 'csi'  # 영상 소스: 'csi'(nvarguscamerasrc), 'test'(videotestsrc)
+        self.sensor_crop = False  # 캡처 중 ROI를 카메라 파이프라인에서 잘라낼지
+        self.dual_branch = False  # tee로 미리보기/캡처 갈래를 나눈 파이프라인 사용 (PyGObject 필요)
+        self.capture_branch = dict(gst_pipeline.CAPTURE_BRANCH)  # 캡처 갈래 해상도/fps/큐 설정
+        self.preview_branch = dict(gst_pipeline.PREVIEW_BRANCH)  # 미리보기 갈래 설정 (캔버스 크기 정도)
+        self.preview_fps = 15  # 미리보기 화면 최대 갱신 속도 (카메라 fps와 별개)
+        self.preview_mailbox = FrameMailbox()  # 미리보기 스레드 → 메인 루프 최신 프레임 전달 (슬롯 1개)
+        self.preview_pump_id = None  # 미리보기 펌프 after() id
+
+        # 최근 프레임 링 버퍼 (촬영 시각 기준 선택, 트리거 이전 프레임 저장용)
+        self.ring_buffer_frames = 64  # 보관할 최대 프레임 수
+        self.ring_buffer_max_mb = 256  # 링 버퍼 최대 메모리 (MB)
+        self.pretrigger_seconds = 2.0  # F5: 트리거 이전 몇 초를 저장할지
+
+        # 카메라 프레임 수집기 (프레임 읽기 스레드, 링 버퍼)
+        if source is None:
+            source = CameraSource(camera_id=camera_id, camera_source=self.camera_source, dual_branch=self.dual_branch,
+                                  capture_branch=self.capture_branch, preview_branch=self.preview_branch,
+                                  ring_buffer_frames=self.ring_buffer_frames, ring_buffer_max_mb=self.ring_buffer_max_mb)
+        source.on_preview = self.preview_mailbox.post
+        self.source = source
+        
+        # 캡처 프로세스 관련 변수
+        self.is_capturing = False  # 캡처 진행 중 여부
+
+        # 캡처 저장(인코딩/쓰기) 관련 설정
+        self.writer_workers = 2  # 인코딩/쓰기 워커 스레드 수
+        self.writer_queue_size = 32  # 저장 대기 큐 최대 길이
+        self.writer_overflow = 'block'  # 큐가 가득 찼을 때 정책: 'block', 'drop_oldest', 'spill'
+        self.missed_deadline_policy = 'catchup'  # deadline 놓쳤을 때 정책: 'catchup', 'skip', 'reanchor'
+        self.output_format = 'png'  # 저장 형식: 'png', 'jpg', 'webp', 'tiff', 'ppm', 'npy'
+        self.output_level = None  # png 압축 수준 0-9, jpg/webp 품질 0-100, None이면 형식 기본값
+        self.output_mode = 'files'  # 'files': 캡처마다 파일, 'container': 파일 하나에 이어서, 'memmap': 인코딩 없이 미리 만든 배열 파일
+        self.engine = None  # 현재 세션의 CaptureEngine
+        
+        # UI 관련 변수
+        self.timing_vars = []  # 캡쳐 타이밍 설정 UI 변수들
+        self.timing_frame_container = None  # 캡쳐 타이밍 위젯 컨테이너
+        self.add_button = None  # 캡쳐 구간 추가 버튼
+        self.remove_button = None  # 캡쳐 구간 제거 버튼
+
+        # UI 구성 및 미리보기 시작
+        self.setup_ui()
+        self.start_preview()
+        self._pump_preview()
+
+        # 키보드 이벤트 바인딩 (ROI 위치 미세조정용, 패널이 여러 개면 모두 받음)
+        self.root.bind("<Up>", self._on_key_press, add="+")     # ↑: y 감소
+        self.root.bind("<Down>", self._on_key_press, add="+")   # ↓: y 증가
+        self.root.bind("<Left>", self._on_key_press, add="+")   # ←: x 감소
+        self.root.bind("<Right>", self._on_key_press, add="+")  # →: x 증가
+        self.root.bind("<F5>", lambda event: self.save_recent_frames(self.pretrigger_seconds), add="+")  # F5: 최근 프레임 저장 (모든 카메라)
+
+    def _on_key_press(self, event):
+        """
+        방향키로 ROI 위치 조정 핸들러
+        
+        방향키로 ROI 위치를 1픽셀씩 이동
+        Shift + 방향키로 10픽셀씩 이동
+        
+        Args:
+            event: 키보드 이벤트 객체
+        """
+
+        # 캡쳐 중 방향키 반영 X
+        if self.is_capturing:
+            return
+
+        # 패널이 여러 개면 마우스 포인터가 있는 패널만 반영
+        if self.embedded and not self._pointer_inside():
+            return
+        
+        # 현재 ROI values 가져옴
+        try:
+            xmin = int(self.xmin_var.get())
+            ymin = int(self.ymin_var.get())
+            width = int(self.width_var.get())
+            height = int(self.height_var.get())
+        except (ValueError, tk.TclError):
+            return # 유효하지 않은 값이면 return
+        
+        # Shift 키 눌려있으면 10픽셀 이동, 아님 1픽셀 이동
+        step = 10 if (event.state & 0x0001) else 1
+
+        # 방향키에 따라 ROI 위치 이동
+        if event.keysym == 'Up': ymin -= step
+        elif event.keysym == 'Down': ymin += step
+        elif event.keysym == 'Left': xmin -= step
+        elif event.keysym == 'Right': xmin += step
+
+        # 프레임 경계 안벗어나도록
+        if self.source.preview_frame is not None:
+            frame_h, frame_w = self.source.preview_frame.shape[:2]
+            xmin = max(0, min(xmin, frame_w - width))
+            ymin = max(0, min(ymin, frame_h - height))
+
+        # UI 업데이트
+        self.xmin_var.set(str(xmin))
+        self.ymin_var.set(str(ymin))
+
+    def _pointer_inside(self):
+        """
+        마우스 포인터가 이 패널 위에 있는지
+        """
+        widget = self.root.winfo_containing(*self.root.winfo_pointerxy())
+        while widget is not None:
+            if widget is self.container:
+                return True
+            widget = widget.master
+        return False
+
+    def setup_ui(self):
+        """
+        전체 UI 레이아웃 구성
+    
+        좌측: 설정 컨트롤 패널
+        우측: 카메라 미리보기 화면
+        PanedWindow 사용해 크기 조절 가능한 2열 레이아웃 생성
+        """
+
+        # 수평 분할 윈도우(좌우 나누기)
+        main_paned = ttk.PanedWindow(self.container, orient=tk.HORIZONTAL)
+        main_paned.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # 좌측 프레임: 설정 컨트롤들
+        left_frame = ttk.Frame(main_paned)
+        main_paned.add(left_frame, weight=1)
+        
+        # 우측 프레임: 미리보기 화면
+        right_frame = ttk.Frame(main_paned)
+        main_paned.add(right_frame, weight=1)
+        
+        # 각 프레임에 내용 추가
+        self.setup_controls(left_frame) # 좌측엔 컨트롤 패널
+        self.setup_preview(right_frame) # 우측엔 미리보기 화면
+
+    def setup_controls(self, parent):
+        """
+        좌측 컨트롤 패널 구성
+        스크롤 가능한 영역에 모든 설정 위젯들 배치
+    
+        Args:
+            parent: 컨트롤들 배치될 부모 프레임
+        """
+        
+        canvas = tk.Canvas(parent, width=350)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        scrollable_frame = ttk.Frame(canvas)
+        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        main_frame = ttk.Frame(scrollable_frame, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        title_label = ttk.Label(main_frame, text=f"Camera {self.camera_id} Settings", font=("Arial", 14, "bold"))
+        title_label.pack(pady=(0, 20))
+        self.setup_path_settings(main_frame)
+        self.setup_roi_settings(main_frame)
+        self.setup_timing_settings(main_frame)
+        self.setup_output_settings(main_frame)
+        self.setup_status_and_button(main_frame)
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        def _on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+    def setup_path_settings(self, parent):
+        """
+        파일 저장 경로 설정 UI구성
+   
+        구성 요소:
+        - 기본 경로 입력 및 탐색 버튼
+        - Target과 Titer 이름 입력 필드
+        - 최종 저장 경로 미리보기
+   
+        Args:
+            parent: 위젯들이 배치될 부모 프레임
+        """
+        path_frame = ttk.LabelFrame(parent, text="Save Path Settings", padding="10")
+        path_frame.pack(fill=tk.X, pady=(0, 10))
+        base_path_frame = ttk.Frame(path_frame)
+        base_path_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(base_path_frame, text="Base Path:").pack(side=tk.LEFT)
+        self.base_path_var = tk.StringVar(value=self.base_path)
+        base_path_entry = ttk.Entry(base_path_frame, textvariable=self.base_path_var, width=20)
+        base_path_entry.pack(side=tk.LEFT, padx=(5, 5), fill=tk.X, expand=True)
+        browse_button = ttk.Button(base_path_frame, text="Browse", command=self.browse_base_path)
+        browse_button.pack(side=tk.RIGHT)
+        target_frame = ttk.Frame(path_frame)
+        target_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(target_frame, text="Target:").grid(row=0, column=0, sticky=tk.W)
+        self.target_var = tk.StringVar(value=self.target)
+        ttk.Entry(target_frame, textvariable=self.target_var, width=12).grid(row=0, column=1, padx=(5, 10), sticky=(tk.W, tk.E))
+        ttk.Label(target_frame, text="Titer:").grid(row=0, column=2, sticky=tk.W)
+        self.titer_var = tk.StringVar(value=self.titer)
+        ttk.Entry(target_frame, textvariable=self.titer_var, width=12).grid(row=0, column=3, padx=5, sticky=(tk.W, tk.E))
+        # 컬럼 크기 조정 (입력 필드가 늘어나도록)
+        target_frame.columnconfigure(1, weight=1)
+        target_frame.columnconfigure(3, weight=1)
+        self.path_preview = tk.StringVar(value=f"{self.base_path}/{self.target}/{self.titer}/")
+        ttk.Label(path_frame, text="Full Save Path:").pack(anchor=tk.W, pady=(10, 0))
+        path_preview_label = ttk.Label(path_frame, textvariable=self.path_preview, foreground="blue", font=("Arial", 8), relief="sunken", padding="3")
+        path_preview_label.pack(fill=tk.X, pady=(5, 0))
+        self.base_path_var.trace('w', self.update_path_preview)
+        self.target_var.trace('w', self.update_path_preview)
+        self.titer_var.trace('w', self.update_path_preview)
+
+    def browse_base_path(self):
+        """
+        폴더 선택 다이얼로그 열어 기본 경로 선택
+   
+        현재 설정된 경로를 초기 위치로 사용, 없으면 사용자 홈 디렉토리 표시
+        """
+        selected_path = filedialog.askdirectory(initialdir=self.base_path_var.get() or os.path.expanduser("~"))
+        if selected_path:
+            self.base_path_var.set(selected_path)
+
+    def update_path_preview(self, *args):
+        """
+        경로 미리보기를 업데이트
+   
+        base_path, target, titer를 조합하여 실제 저장될 전체 경로를 표시
+   
+        Args:
+           *args: trace 콜백에서 전달되는 인자들 (사용하지 않음)
+        """
+        path = f"{self.base_path_var.get()}/{self.target_var.get()}/{self.titer_var.get()}/"
+        self.path_preview.set(path)
+
+
+    def setup_roi_settings(self, parent):
+        """
+        ROI 설정 UI 구성
+   
+        구성 요소:
+        - X Min, Y Min: ROI 시작점 좌표
+        - Width, Height: ROI 크기
+        - Reset ROI: 기본값으로 초기화
+        - Full Size: 전체 프레임 크기로 설정
+        - 도움말 텍스트
+   
+        Args:
+           parent: 위젯들이 배치될 부모 프레임
+        """
+        roi_frame = ttk.LabelFrame(parent, text="ROI Settings", padding="10")
+        roi_frame.pack(fill=tk.X, pady=(0, 10))
+        roi_grid = ttk.Frame(roi_frame)
+        roi_grid.pack(fill=tk.X)
+        
+        ttk.Label(roi_grid, text="X Min:").grid(row=0, column=0, sticky=tk.W)
+        self.xmin_var = tk.StringVar(value=str(self.crop['xmin']))
+        xmin_entry = ttk.Entry(roi_grid, textvariable=self.xmin_var, width=8)
+        xmin_entry.grid(row=0, column=1, padx=(5, 10))
+
+        ttk.Label(roi_grid, text="Y Min:").grid(row=0, column=2, sticky=tk.W)
+        self.ymin_var = tk.StringVar(value=str(self.crop['ymin']))
+        ymin_entry = ttk.Entry(roi_grid, textvariable=self.ymin_var, width=8)
+        ymin_entry.grid(row=0, column=3, padx=5)
+
+        ttk.Label(roi_grid, text="Width:").grid(row=1, column=0, sticky=tk.W, pady=(8, 0))
+        self.width_var = tk.StringVar(value=str(self.crop['width']))
+        width_entry = ttk.Entry(roi_grid, textvariable=self.width_var, width=8)
+        width_entry.grid(row=1, column=1, padx=(5, 10), pady=(8, 0))
+
+        ttk.Label(roi_grid, text="Height:").grid(row=1, column=2, sticky=tk.W, pady=(8, 0))
+        self.height_var = tk.StringVar(value=str(self.crop['height']))
+        height_entry = ttk.Entry(roi_grid, textvariable=self.height_var, width=8)
+        height_entry.grid(row=1, column=3, padx=5, pady=(8, 0))
+
+        button_frame = ttk.Frame(roi_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+
+        reset_button = ttk.Button(button_frame, text="Reset ROI", command=self.reset_roi)
+        reset_button.pack(side=tk.LEFT)
+        
+        full_size_button = ttk.Button(button_frame, text="Full Size", command=self.set_full_roi)
+        full_size_button.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # 캡처 중 ROI를 파이프라인에서 잘라내기 (ROI 픽셀만 CPU로 넘어옴, 캡처 중 미리보기는 ROI만 표시)
+        self.sensor_crop_var = tk.BooleanVar(value=self.sensor_crop)
+        sensor_crop_check = ttk.Checkbutton(roi_frame, text="Crop ROI in camera pipeline while capturing", variable=self.sensor_crop_var)
+        sensor_crop_check.pack(anchor=tk.W, pady=(5, 0))
+
+        self.roi_widgets = [xmin_entry, ymin_entry, width_entry, height_entry, reset_button, full_size_button, sensor_crop_check]
+        help_text = f"마우스 드래그로 ROI 선택, 방향키로 위치 이동 (Shift+방향키: 10px)\nF5: 최근 {self.pretrigger_seconds:g}초 프레임 저장"
+        help_label = ttk.Label(roi_frame, text=help_text, font=("Arial", 8), foreground="gray")
+        help_label.pack(pady=(5, 0))
+    
+    def reset_roi(self):
+        """
+        ROI 기본값으로 초기화
+   
+        기본값:
+        - xmin: 240, ymin: 100
+        - width: 260, height: 800
+        """
+        self.xmin_var.set("240")
+        self.ymin_var.set("100")
+        self.width_var.set("260")
+        self.height_var.set("800")
+
+    def set_full_roi(self):
+        """
+        ROI를 전체 프레임 크기로 설정
+   
+        현재 미리보기 프레임의 전체 크기를 ROI로 설정
+        프레임이 없으면 아무 동작 안 함
+        """
+        if self.source.preview_frame is not None:
+            height, width = self.source.preview_frame.shape[:2]
+            self.xmin_var.set("0")
+            self.ymin_var.set("0")
+            self.width_var.set(str(width))
+            self.height_var.set(str(height))
+
+    def setup_timing_settings(self, parent):
+        """
+        캡처 타이밍 설정 UI 구성
+   
+        구성 요소:
+        - 구간 추가/제거 버튼 (+, -)
+        - Start Delay: 캡처 시작 전 대기 시간
+        - 각 구간별 Interval과 End Point 설정
+        - 최대 3개 구간까지 설정 가능
+   
+        Args:
+            parent: 위젯들이 배치될 부모 프레임
+        """
+        timing_frame = ttk.LabelFrame(parent, text="Capture Timing (seconds)", padding="10")
+        timing_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # ===== 구간 추가/제거 버튼 섹션 =====
+        button_frame = ttk.Frame(timing_frame)
+        button_frame.pack(fill=tk.X, pady=(0, 5))
+
+        # + 버튼: 새로운 구간 추가 (최대 3개)
+        self.add_button = ttk.Button(button_frame, text="+", width=3, command=self._add_interval)
+        self.add_button.pack(side=tk.LEFT)
+
+        # - 버튼: 마지막 구간 제거 (최소 1개 유지)
+        self.remove_button = ttk.Button(button_frame, text="-", width=3, command=self._remove_interval)
+        self.remove_button.pack(side=tk.LEFT, padx=5)
+
+        info_label = ttk.Label(timing_frame, text="Info: Middle/End 값은 '누적 종료 시점'입니다.", font=("Arial", 8), foreground="gray")
+        info_label.pack(anchor=tk.W, pady=(0, 10))
+        
+        # 타이밍 위젯들 동적으로 생성될 컨테이너
+        self.timing_frame_container = ttk.Frame(timing_frame)
+        self.timing_frame_container.pack(fill=tk.X)
+        
+        # 초기 타이밍 위젯들 생성
+        self._redraw_timing_widgets()
+
+    def _redraw_timing_widgets(self):
+        """
+        타이밍 설정 위젯들 다시 그림
+   
+        구간이 추가/제거될 때마다 호출되어
+        현재 self.cap_time 데이터에 맞춰 UI를 재구성
+        """
+
+        # 기존 위젯들 모두 제거
+        for widget in self.timing_frame_container.winfo_children():
+            widget.destroy()
+        
+        # timing_vars 리스트 초기화
+        self.timing_vars.clear()
+
+        # ===== Start Delay 입력 필드 =====
+        start_frame = ttk.Frame(self.timing_frame_container)
+        start_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(start_frame, text="Start Delay:", width=10).grid(row=0, column=0, sticky=tk.W)
+        
+        # Start Delay 값 저장할 변수
+        start_var = tk.StringVar(value=str(self.start_delay))
+        ttk.Entry(start_frame, textvariable=start_var, width=8).grid(row=0, column=1, padx=5)
+        
+        # timing_vars에 추가 (나중에 값 읽기 위해)
+        self.timing_vars.append({'type': 'start', 'var': start_var})
+        
+        # 구분선
+        ttk.Separator(self.timing_frame_container, orient='horizontal').pack(fill='x', pady=5)
+
+        # ===== 각 구간(Phase)별 설정 =====
+        num_phases = len(self.cap_time)
+        for i, phase_data in enumerate(self.cap_time):
+            phase_frame = ttk.Frame(self.timing_frame_container)
+            phase_frame.pack(fill=tk.X, pady=(0, 5))
+            
+            # 마지막 구간인지 확인 (마지막은 "End Point", 중간은 "Middle X at")
+            is_last_phase = (i == num_phases - 1)
+            label_text = f"End Point:" if is_last_phase else f"Middle {i+1} at:"
+            
+            # Interval 입력 필드 (캡처 간격)
+            ttk.Label(phase_frame, text=f"Interval {i+1}:", width=10).grid(row=0, column=0, sticky=tk.W)
+            interval_var = tk.StringVar(value=str(phase_data['interval']))
+            ttk.Entry(phase_frame, textvariable=interval_var, width=8).grid(row=0, column=1, padx=5)
+            
+            # End Point 입력 필드 (구간 종료 시점 - 누적 시간)
+            ttk.Label(phase_frame, text=label_text).grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
+            endpoint_var = tk.StringVar(value=str(phase_data['end_point']))
+            ttk.Entry(phase_frame, textvariable=endpoint_var, width=8).grid(row=0, column=3, padx=5)
+
+            # 새 프레임마다 저장 (interval마다 그동안 들어온 프레임 모두)
+            every_frame_var = tk.BooleanVar(value=phase_data.get('every_frame', False))
+            ttk.Checkbutton(phase_frame, text="Every frame", variable=every_frame_var).grid(row=0, column=4, padx=5)
+
+            # ROI 색이 변할 때만 interval 간격, 아니면 드물게 저장
+            triggered_var = tk.BooleanVar(value=phase_data.get('triggered', False))
+            ttk.Checkbutton(phase_frame, text="On change", variable=triggered_var).grid(row=0, column=5, padx=5)
+
+            # timing_vars에 추가
+            self.timing_vars.append({'type': 'phase', 'endpoint_var': endpoint_var, 'interval_var': interval_var,
+                                     'every_frame_var': every_frame_var, 'triggered_var': triggered_var})
+        
+        # 버튼 상태 업데이트
+        self._update_timing_buttons_state()
+
+    @staticmethod
+    def _phase_setting(var_dict):
+        """
+        구간 입력 필드 값으로 cap_time 항목 만들기
+
+        Returns:
+            dict: {'end_point', 'interval', 'every_frame'/'triggered'(체크했을 때만)}
+        """
+        phase = {'end_point': float(var_dict['endpoint_var'].get()), 'interval': float(var_dict['interval_var'].get())}
+        if var_dict['every_frame_var'].get():
+            phase['every_frame'] = True
+        if var_dict['triggered_var'].get():
+            phase['triggered'] = True
+        return phase
+
+    def _update_timing_buttons_state(self):
+        """
+        구간 추가/제거 버튼 활성화 상태 업데이트
+   
+        - 구간이 3개면 추가 버튼 비활성화
+        - 구간이 1개면 제거 버튼 비활성화
+        """
+        num_phases = len(self.cap_time)
+        self.add_button.config(state=tk.NORMAL if num_phases < 3 else tk.DISABLED)
+        self.remove_button.config(state=tk.NORMAL if num_phases > 1 else tk.DISABLED)
+        
+    def _add_interval(self):
+        """
+        새로운 캡처 구간 추가
+   
+        마지막 구간의 종료 시점 + 10초를 새 구간의 종료 시점으로 설정
+        최대 3개까지만 추가 가능
+        """
+        if len(self.cap_time) < 3:
+            last_endpoint = self.cap_time[-1]['end_point'] if self.cap_time else 0
+            self.cap_time.append({'end_point': last_endpoint + 10.0, 'interval': 1.0})
+            self._redraw_timing_widgets()
+    
+    def _remove_interval(self):
+        """
+        마지막 캡처 구간 제거
+   
+        최소 1개 구간은 유지되어야 함
+        """
+        if len(self.cap_time) > 1:
+            self.cap_time.pop()
+            self._redraw_timing_widgets()
+
+    def setup_output_settings(self, parent):
+        """
+        저장 형식 설정 UI 구성
+
+        구성 요소:
+        - Format: 저장 형식 선택
+        - Level: png 압축 수준(0-9) 또는 jpg/webp 품질(0-100), 비우면 기본값
+        - Measure 버튼: 현재 ROI 크기로 형식별 초당 캡처 수 측정
+
+        Args:
+            parent: 위젯들이 배치될 부모 프레임
+        """
+        output_frame = ttk.LabelFrame(parent, text="Output Format", padding="10")
+        output_frame.pack(fill=tk.X, pady=(0, 10))
+
+        format_grid = ttk.Frame(output_frame)
+        format_grid.pack(fill=tk.X)
+        ttk.Label(format_grid, text="Format:").grid(row=0, column=0, sticky=tk.W)
+        self.output_format_var = tk.StringVar(value=self.output_format)
+        format_combo = ttk.Combobox(format_grid, textvariable=self.output_format_var, values=list(OUTPUT_FORMATS), state="readonly", width=6)
+        format_combo.grid(row=0, column=1, padx=(5, 10))
+        ttk.Label(format_grid, text="Level:").grid(row=0, column=2, sticky=tk.W)
+        self.output_level_var = tk.StringVar(value="" if self.output_level is None else str(self.output_level))
+        level_entry = ttk.Entry(format_grid, textvariable=self.output_level_var, width=5)
+        level_entry.grid(row=0, column=3, padx=5)
+        measure_button = ttk.Button(format_grid, text="Measure", command=self.measure_output_formats)
+        measure_button.grid(row=0, column=4, padx=(5, 0))
+        self.roi_widgets.append(measure_button)  # 캡처 중엔 측정 안 함 (저장 워커와 CPU/디스크 경쟁)
+
+        # 저장 방식 (container: frame_container.py export로 PNG 변환, memmap: Format/Level 무시, np.load로 바로 읽기)
+        mode_frame = ttk.Frame(output_frame)
+        mode_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(mode_frame, text="Save as:").pack(side=tk.LEFT)
+        self.output_mode_var = tk.StringVar(value=self.output_mode)
+        for mode, text in (('files', "Files"), ('container', "One container"), ('memmap', "Raw array")):
+            radio = ttk.Radiobutton(mode_frame, text=text, value=mode, variable=self.output_mode_var)
+            radio.pack(side=tk.LEFT, padx=(5, 0))
+            self.roi_widgets.append(radio)
+
+        # 형식별 측정 결과 (초당 캡처 수)
+        self.output_report_var = tk.StringVar(value="Measure: 현재 ROI 크기로 형식별 초당 캡처 수 측정")
+        ttk.Label(output_frame, textvariable=self.output_report_var, font=("Courier", 8), foreground="gray", justify=tk.LEFT).pack(anchor=tk.W, pady=(5, 0))
+
+    def _output_level(self):
+        """
+        Level 입력값 (비어 있으면 None)
+        """
+        level = self.output_level_var.get().strip()
+        return int(level) if level else None
+
+    def measure_output_formats(self):
+        """
+        현재 ROI 크기로 저장 형식별 초당 캡처 수 측정 (별도 스레드, 결과는 라벨에 표시)
+        """
+        try:
+            width, height = int(self.width_var.get()), int(self.height_var.get())
+            selected = OutputCodec(self.output_format_var.get(), self._output_level())
+            cap_time = [self._phase_setting(v) for v in self.timing_vars if v['type'] == 'phase']
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.output_report_var.set(f"Measuring {width}x{height}...")
+        threading.Thread(target=self._measure_output_formats_worker, args=((height, width, 3), selected, required_rate(cap_time, frame_rate=self.source.fps)), daemon=True).start()
+
+    def _measure_output_formats_worker(self, shape, selected, required):
+        """
+        저장 형식 측정 스레드 (세션 시작 전 엔진 측정과 같은 형식 목록/표)
+        """
+        results = benchmark_codecs(shape, options=benchmark_options(selected), workers=self.writer_workers)
+        self.root.after(0, self.output_report_var.set, format_benchmark(results, required=required, selected=selected.name))
+
+    def setup_status_and_button(self, parent):
+        """
+        상태 표시 라벨과 캡처 시작/정지 버튼을 구성합니다.
+   
+        구성 요소:
+        - Status 라벨: 현재 상태 표시 (Ready/Capturing...)
+        - Start Capture 버튼: 캡처 시작
+        - Stop Capture 버튼: 캡처 중지
+   
+        Args:
+            parent: 위젯들이 배치될 부모 프레임
+        """
+
+        # ===== 상태 표시 =====
+        status_frame = ttk.Frame(parent)
+        status_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(status_frame, text="Status:").pack(side=tk.LEFT)
+        
+        # 상태 메시지를 저장
+        self.status_var = tk.StringVar(value="Ready")
+
+        # 상태 표시 라벨 (녹색 텍스트)
+        status_label = ttk.Label(status_frame, textvariable=self.status_var, foreground="green")
+        status_label.pack(side=tk.LEFT, padx=(10, 0))
+
+        # ===== 캡처 시작 버튼 =====
+        self.start_button = ttk.Button(parent, text="Start Capture", command=self.start_camera)
+        self.start_button.pack(pady=15, fill=tk.X)
+
+        # ===== 캡처 정지 버튼 (초기에는 비활성화) =====
+        self.stop_button = ttk.Button(parent, text="Stop Capture", command=self.stop_camera, state=tk.DISABLED)
+        self.stop_button.pack(pady=(5, 0), fill=tk.X)
+
+    def setup_preview(self, parent):
+        """
+        카메라 미리보기 화면을 구성합니다.
+   
+        구성 요소:
+        - 미리보기 캔버스: 실시간 카메라 영상과 ROI 표시
+        - 정보 라벨: 해상도 등 미리보기 정보 표시
+        - 마우스 이벤트 바인딩: ROI 선택 기능
+   
+        Args:
+            parent: 미리보기가 배치될 부모 프레임
+        """
+        preview_frame = ttk.LabelFrame(parent, text="Camera Preview & ROI Selection", padding="10")
+        preview_frame.pack(fill=tk.BOTH, expand=True)
+        self.preview_canvas = tk.Canvas(preview_frame, bg='black', width=400, height=350)
+        self.preview_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.preview_renderer = PreviewRenderer(self.preview_canvas, ui_fps=self.preview_fps)
+
+        # 마우스 이벤트 바인딩 (ROI 선택용)
+        # Button-1: 마우스 왼쪽 버튼
+        self.preview_canvas.bind("<Button-1>", self.on_mouse_press)
+        self.preview_canvas.bind("<B1-Motion>", self.on_mouse_drag)
+        self.preview_canvas.bind("<ButtonRelease-1>", self.on_mouse_release)
+        
+        # 미리보기 정보 표시
+        info_frame = ttk.Frame(preview_frame)
+        info_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        # 미리보기 정보 텍스트 (해상도 등)
+        self.preview_info = tk.StringVar(value="미리보기 로딩중...")
+        ttk.Label(info_frame, textvariable=self.preview_info, font=("Arial", 9)).pack()
+
+    def validate_inputs(self):
+        """
+        사용자 입력값들 유효성 검증
+   
+        검증 항목:
+        - ROI가 프레임 경계 내에 있는지
+        - 타이밍 값들이 유효한지 (양수, 순차적)
+        - Target과 Titer 이름이 입력되었는지
+   
+        Returns:
+            bool: 모든 입력이 유효하면 True, 아니면 False
+        """
+        
+        try:
+            # 미리보기 프레임이 없으면 검증 불가
+            if self.source.preview_frame is None: raise ValueError("Preview not available.")
+            
+            # 현재 프레임 크기 가져오기
+            frame_h, frame_w = self.source.preview_frame.shape[:2]
+
+            # UI 값들로 세션 설정 만들어서 엔진과 같은 기준으로 검증
+            spec = self.session_spec()
+            spec['crop'] = {'xmin': int(self.xmin_var.get()), 'ymin': int(self.ymin_var.get()), 'width': int(self.width_var.get()), 'height': int(self.height_var.get())}
+            spec['cap_time'] = []
+            for var_dict in self.timing_vars:
+                if var_dict['type'] == 'start':
+                    spec['start_delay'] = float(var_dict['var'].get())
+                elif var_dict['type'] == 'phase':
+                    spec['cap_time'].append(self._phase_setting(var_dict))
+            spec['target'], spec['titer'] = self.target_var.get(), self.titer_var.get()
+            spec['output_format'], spec['output_level'] = self.output_format_var.get(), self._output_level()
+            spec['output_mode'], spec['sensor_crop'] = self.output_mode_var.get(), self.sensor_crop_var.get()
+            validate_session_spec(spec, frame_size=(frame_w, frame_h))
+            return True
+        except (ValueError, tk.TclError) as e:
+            # 아니면 오류 표시
+            messagebox.showerror("Input Error", str(e))
+            return False
+
+    def update_variables(self):
+        """
+        UI의 현재 값들 인스턴스 변수에 저장
+        캡처 시작 전에 호출, UI의 설정값들을 실제 캡처에 사용할 변수들로 복사
+        """
+        # ROI 설정 업데이트
+        self.crop = {'xmin': int(self.xmin_var.get()), 'ymin': int(self.ymin_var.get()), 'width': int(self.width_var.get()), 'height': int(self.height_var.get())}
+        
+        # 캡쳐 타이밍 설정 업데이트
+        self.cap_time.clear()
+        for var_dict in self.timing_vars:
+            if var_dict['type'] == 'start':
+                # Start Delay 업데이트
+                self.start_delay = float(var_dict['var'].get())
+            elif var_dict['type'] == 'phase':
+                # 각 구간 설정
+                self.cap_time.append(self._phase_setting(var_dict))
+        self.sensor_crop = self.sensor_crop_var.get()
+        self.output_format = self.output_format_var.get()
+        self.output_level = self._output_level()
+        self.output_mode = self.output_mode_var.get()
+
+        # 경로 설정 업데이트
+        self.target = self.target_var.get().strip()
+        self.titer = self.titer_var.get().strip()
+        self.base_path = self.base_path_var.get().strip()
+
+    def start_preview(self):
+        """
+        미리보기 시작
+   
+        CameraSource가 별도 스레드에서 카메라 영상을 지속적으로 읽어와 전달함에 넣음
+        """
+        self.source.start()
+
+    def _pump_preview(self):
+        """
+        미리보기 펌프 (메인 스레드, 1/preview_fps초마다)
+
+        전달함에 새 프레임이 있으면 꺼내서 그림, 그 사이 덮어써진 프레임 수는 정보 라벨에 표시
+        """
+        item = self.preview_mailbox.take()
+        if item is not None:
+            if item['frame'] is not None:
+                self.update_preview_display(item['frame'], item['seq'], item['frame_size'], item['full_view'])
+                info = f"{item['info']} | coalesced {self.preview_mailbox.coalesced}"
+            else:
+                info = item['info']
+            if self.preview_info.get() != info:
+                self.preview_info.set(info)
+        self.preview_pump_id = self.root.after(max(1, int(1000 / self.preview_fps)), self._pump_preview)
+
+    def update_preview_display(self, frame=None, seq=None, frame_size=None, full_view=None):
+        """
+        미리보기 캔버스 업데이트
+   
+        현재 프레임을 캔버스 크기에 맞게 리사이즈, ROI 영역 녹색 사각형으로 표시
+
+        Args:
+            frame (np.ndarray): 그릴 프레임 (없으면 self.source.preview_frame)
+            seq (int): 프레임 번호
+            frame_size (tuple): ROI 좌표 기준 전체 프레임 크기 (w, h), 미리보기 갈래 프레임일 때
+            full_view (bool): 프레임이 전체 화면인지 (False면 파이프라인에서 잘라낸 ROI만 있음)
+        """
+        if frame is None:
+            frame, seq = self.source.preview_frame, self.source.preview_seq
+        if full_view is None:
+            full_view = self.source.roi is None
+
+        # 프레임이 없거나 미리보기가 중지되었으면 종료
+        if frame is None or not self.source.running: return
+
+        # ROI 값 가져오기 (프레임에 ROI만 있으면 프레임 전체가 ROI라 생략)
+        roi = None
+        if full_view:
+            try:
+                roi = (int(self.xmin_var.get()), int(self.ymin_var.get()), int(self.width_var.get()), int(self.height_var.get()))
+            except (ValueError, tk.TclError): pass # ROI 값이 유효하지 않으면 무시
+
+        self.preview_renderer.render(frame, frame_id=seq, roi=roi, frame_size=frame_size)
+
+    def start_camera(self):
+        """
+        카메라 캡처 시작
+   
+        1. 입력값 유효성 검증
+        2. UI 값들을 인스턴스 변수에 저장
+        3. 캡처 엔진 시작
+        4. UI 상태 업데이트 (버튼 비활성화 등)
+        """
+        # 이미 캡처 중이면 무시
+        if self.is_capturing: return
+
+        # 입력값 유효성 검증 실패시 종료
+        if not self.validate_inputs(): return
+
+        # UI의 현재 값들 인스턴스 변수에 저장
+        self.update_variables()
+
+        # 캡처 엔진 생성 (센서 측 crop, 저장, 통계 출력은 엔진이 처리)
+        # 세션이 끝나면 메인 스레드에서 stop_camera 호출
+        engine = CaptureEngine([(self.source, self.session_spec())], on_finished=lambda engine: self.root.after(0, self.stop_camera))
+        self.begin_capture(engine)
+        engine.start()
+
+    def begin_capture(self, engine):
+        """
+        캡처 중 UI 상태로 전환 (버튼, 상태 메시지, ROI 위젯)
+
+        Args:
+            engine (CaptureEngine): 이 카메라를 포함한 캡처 엔진 (여러 카메라가 공유할 수 있음)
+        """
+        # 캡처 상태 플래그 설정
+        self.is_capturing = True
+        self.engine = engine
+
+        # 시작 버튼 비활성화, 정지 버튼 활성화
+        self.start_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+
+        # 상태 메시지 최신화
+        self.status_var.set("Capturing... (Live)")
+        
+        # ROI 관련 위젯들 비활성화(캡쳐 중 변경하는거 막을라고)
+        for widget in self.roi_widgets:
+            widget.config(state=tk.DISABLED)
+
+    def session_spec(self):
+        """
+        현재 설정값으로 캡처 엔진 세션 설정 생성
+
+        Returns:
+            dict: 세션 설정 (capture_engine.DEFAULT_SESSION 항목)
+        """
+        return {
+            'base_path': self.base_path,
+            'target': self.target,
+            'titer': self.titer,
+            'start_delay': self.start_delay,
+            'cap_time': [dict(phase) for phase in self.cap_time],
+            'crop': dict(self.crop),
+            'sensor_crop': self.sensor_crop,
+            'writer_workers': self.writer_workers,
+            'writer_queue_size': self.writer_queue_size,
+            'writer_overflow': self.writer_overflow,
+            'missed_deadline_policy': self.missed_deadline_policy,
+            'output_format': self.output_format,
+            'output_level': self.output_level,
+            'output_mode': self.output_mode,
+        }
+
+    def save_recent_frames(self, seconds_before=2.0, seconds_after=0.0):
+        """
+        트리거 시점 전후 프레임 저장 (링 버퍼에서)
+
+        호출 시점 기준 seconds_before초 전부터 seconds_after초 후까지의 프레임을
+        base_path/target/titer/pretrigger_<시각>/ 에 ROI만 잘라서 저장
+        파일명은 트리거 기준 상대 시간 (예: -1.250.png)
+
+        Args:
+            seconds_before (float): 트리거 이전 저장 구간 (초)
+            seconds_after (float): 트리거 이후 저장 구간 (초)
+        """
+        trigger_ns = time.monotonic_ns()
+        try:
+            crop = (int(self.xmin_var.get()), int(self.ymin_var.get()), int(self.width_var.get()), int(self.height_var.get()))
+        except (ValueError, tk.TclError):
+            crop = None # ROI 값이 유효하지 않으면 전체 프레임 저장
+        if self.source.roi is not None:
+            crop = None # 파이프라인에서 이미 ROI만 잘라서 나옴
+        save_path = os.path.join(self.base_path_var.get().strip(), self.target_var.get().strip(), self.titer_var.get().strip(), time.strftime("pretrigger_%Y%m%d_%H%M%S"))
+        threading.Thread(target=self._save_recent_frames_worker, args=(trigger_ns, seconds_before, seconds_after, crop, save_path), daemon=True).start()
+
+    def _save_recent_frames_worker(self, trigger_ns, seconds_before, seconds_after, crop, save_path):
+        """
+        트리거 전후 프레임 저장 스레드
+        """
+        saved = save_buffered_frames(self.source.frame_buffer, trigger_ns, seconds_before, seconds_after, crop, save_path,
+                                     writer_workers=self.writer_workers, writer_queue_size=self.writer_queue_size,
+                                     codec=OutputCodec(self.output_format, self.output_level))
+        if saved:
+            print(f"Saved {saved} buffered frames to {save_path}")
+        else:
+            print("No buffered frames to save")
+
+    def stop_camera(self):
+        """
+        카메라 캡처 중지
+   
+        1. 캡처 플래그 해제
+        2. UI 상태를 원래대로 복원
+        3. 비활성화했던 위젯들 재활성화
+        """
+
+        # 이미 정지 상태면 무시
+        if not self.is_capturing: return
+
+        # 캡처 중지 플래그 설정 (엔진은 남은 프레임 저장, 센서 측 crop 복귀 후 종료)
+        self.is_capturing = False
+        if self.engine: self.engine.stop()
+
+        # 시작 버튼 활성화, 정지 버튼 비활성화
+        self.start_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+
+        # 상태 메시지 Ready로
+        self.status_var.set("Ready")
+
+        # ROI 관련 위젯들 재활성화
+        for widget in self.roi_widgets:
+            widget.config(state=tk.NORMAL)
+
+    def on_mouse_press(self, event):
+        """
+        ROI 선택 시작, 클릭 위치를 저장
+        캔버스 좌표를 실제 프레임 좌표로 변환 위한 오프셋 계산
+   
+        Args:
+            event: 마우스 이벤트 객체 (x, y 좌표 포함)
+        """
+
+        # 캡처 중에는 ROI 변경 불가
+        if self.is_capturing: return
+
+        # 미리보기가 실행 중이고 프레임이 있을 때만 동작
+        if not self.source.running or self.source.preview_frame is None: return
+
+        # ROI 선택 시작 플래그 설정
+        self.roi_selecting = True
+
+        # 이미지가 캔버스에 맞게 스케일링된 배치 (미리보기와 같은 값)
+        height, width = self.source.preview_frame.shape[:2]
+        layout = self.preview_renderer.layout(width, height)
+        if layout is None:
+            self.roi_selecting = False
+            return
+
+        # (캔버스 크기 - 스케일된 이미지 크기) / 2 (이미지가 캔버스 중앙에 위치하므로)
+        self.x_offset = layout['x_offset']
+        self.y_offset = layout['y_offset']
+
+        # ROI 선택 시작점
+        self.roi_start = (event.x, event.y)
+
+    def on_mouse_drag(self, event):
+        """
+        마우스 드래그 중 호출
+        드래그 중인 ROI 영역을 빨간색 사각형으로
+   
+        Args:
+            event: 마우스 이벤트 객체 (현재 x, y 좌표 포함)
+        """
+        # 캡처 중에는 ROI 변경 불가
+        if self.is_capturing: return
+        # ROI 선택이 시작되었고 시작점이 있을 때
+        if self.roi_selecting and self.roi_start:
+            # 이전에 그린 임시 ROI 삭제
+            # "temp_roi" 태그 달린 모든 도형 삭제
+            self.preview_canvas.delete("temp_roi")
+
+            # 새로운 임시 ROI 사각형
+            # 시작점부터 현재 마우스 위치까지
+            self.preview_canvas.create_rectangle(self.roi_start[0], self.roi_start[1], event.x, event.y, outline="red", width=2, tags="temp_roi")
+
+    def on_mouse_release(self, event):
+        """
+        마우스 왼쪽 버튼 릴리즈 시 호출
+   
+        ROI 선택 완료, 캔버스 좌표를 실제 프레임 좌표로 변환, ROI 설정값 업데이트
+   
+        Args:
+            event: 마우스 이벤트 객체 (릴리즈 위치 x, y 좌표 포함)
+        """
+
+        # 캡처 중에는 ROI 변경 불가
+        if self.is_capturing: return
+
+        # ROI 선택이 진행 중이고 필요한 정보가 없다면 리턴
+        if not (self.roi_selecting and self.roi_start and self.source.preview_frame is not None): return
+        
+        # 좌표 변환 준비
+        height, width = self.source.preview_frame.shape[:2]
+        layout = self.preview_renderer.layout(width, height)
+        if layout is None: return
+        
+        # 캔버스에서 프레임으로의 스케일
+        scale = layout['scale']
+        
+        # 캔버스 좌표에서 ROI 영역 계산(시작점과 끝점 중 작은 값이 좌상단, 큰 값이 우하단)
+        start_x_canvas, start_y_canvas = min(self.roi_start[0], event.x), min(self.roi_start[1], event.y)
+        end_x_canvas, end_y_canvas = max(self.roi_start[0], event.x), max(self.roi_start[1], event.y)
+        
+        # 캔버스 좌표를 원본 프레임 좌표로(오프셋 제거 및 원본 크기로 역변환)
+        start_x_orig, start_y_orig = int((start_x_canvas - self.x_offset) / scale), int((start_y_canvas - self.y_offset) / scale)
+        end_x_orig, end_y_orig = int((end_x_canvas - self.x_offset) / scale), int((end_y_canvas - self.y_offset) / scale)
+        
+        # 프레임 경계 체크(좌표가 프레임 범위를 벗어나지 않도록)
+        xmin, ymin, xmax, ymax = max(0, start_x_orig), max(0, start_y_orig), min(width, end_x_orig), min(height, end_y_orig)
+        
+        # UI 업데이트
+        self.xmin_var.set(str(xmin))
+        self.ymin_var.set(str(ymin))
+        self.width_var.set(str(xmax - xmin))
+        self.height_var.set(str(ymax - ymin))
+
+        # temp_roi 태그 떼기
+        self.preview_canvas.delete("temp_roi")
+
+        # # ROI 선택 종료
+        self.roi_selecting = False
+
+    def run(self):
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.mainloop()
+
+    def on_closing(self):
+        """
+        윈도우 종료 시 호출
+
+        1. 모든 스레드 종료
+        2. 카메라 리소스 해제
+        3. 윈도우 디스트로이
+        """
+        print("Closing application...")
+        self.shutdown()
+        self.root.destroy() 
+
+    def shutdown(self):
+        """
+        미리보기 펌프, 캡처 엔진, 카메라 스레드 종료 (윈도우는 그대로)
+        """
+        if self.preview_pump_id: self.root.after_cancel(self.preview_pump_id)
+        self.is_capturing = False
+        if self.engine: self.engine.stop()
+        self.source.stop(timeout=2)
+        if self.engine: self.engine.wait(timeout=2)
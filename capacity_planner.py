@@ -0,0 +1,286 @@
+"""
+세션 용량 계획 (세션 시작 전 확인)
+
+캡처 구간 설정을 실제 캡처 수로 펼치고, 측정한 인코딩/디스크 속도로
+- 구간별 캡처 수, 초당 캡처 수, 초당 바이트 수
+- 세션 전체 바이트 수와 base_path 디스크 남은 공간
+- 인코더/디스크가 구간 속도를 따라갈 수 있는지 (짧은 구간은 저장 큐가 흡수할 수 있는지)
+를 계산해서 세션이 가능한지 알려줌
+
+필요하면 세션 크기만큼 디스크 공간을 미리 잡아 둠 (SpaceReservation)
+
+사용 예 (카메라 없이 세션 설정 파일만으로):
+    python capacity_planner.py session.json
+    python capacity_planner.py session.json --cameras 2 --json
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import numpy as np
+
+from capture_codecs import OutputCodec, benchmark_codecs, estimate_frame_bytes
+from capture_scheduler import DEFAULT_FRAME_RATE, compile_deadlines, phase_rate
+
+_disk_rates = {}  # 디스크 쓰기 속도 측정 결과 캐시 (폴더 → bytes/s)
+
+
+def existing_parent(path):
+    """
+    path 또는 가장 가까운 존재하는 상위 폴더 (아직 안 만든 base_path의 디스크 확인용)
+    """
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def measure_disk_rate(path, size_mb=16, block_kb=1024):
+    """
+    디스크 순차 쓰기 속도 측정 (fsync 포함)
+
+    같은 폴더는 프로세스에서 한 번만 측정
+
+    Args:
+        path (str): 측정할 폴더 (저장할 디스크)
+        size_mb (int): 쓸 크기 (MB)
+        block_kb (int): 한 번에 쓰는 크기 (KB)
+
+    Returns:
+        float: bytes/s
+    """
+    folder = existing_parent(path)
+    if folder in _disk_rates:
+        return _disk_rates[folder]
+    block = os.urandom(block_kb * 1024)
+    blocks = max(1, size_mb * 1024 // block_kb)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.disk_rate_')
+    try:
+        t0 = time.perf_counter()
+        for _ in range(blocks):
+            os.write(fd, block)
+        os.fsync(fd)
+        elapsed = time.perf_counter() - t0
+    finally:
+        os.close(fd)
+        os.remove(tmp_path)
+    _disk_rates[folder] = len(block) * blocks / elapsed
+    return _disk_rates[folder]
+
+
+def phase_counts(start_delay, cap_time, frame_rate=None, dedupe=False):
+    """
+    캡처 구간별 실제 캡처 수 (스케줄러와 같은 계산, every_frame 구간은 구간 길이 × fps)
+
+    Args:
+        frame_rate (float): 카메라 fps (every_frame 구간), None이면 기본 fps
+        dedupe (bool): 같은 프레임을 다시 저장하지 않으면 구간별 저장 수는 fps를 넘지 않음
+
+    Returns:
+        list: 구간별 dict ('phase', 'start_s', 'end_s', 'interval_s', 'captures')
+    """
+    counts = Counter(phase for _, phase in compile_deadlines(start_delay, cap_time))
+    phases = []
+    start = start_delay
+    for i, phase_data in enumerate(cap_time):
+        rate = phase_rate(phase_data, frame_rate)
+        captures = counts.get(i, 0)
+        fps = frame_rate or DEFAULT_FRAME_RATE
+        if phase_data.get('every_frame') or (dedupe and rate > fps):
+            rate = fps
+            captures = int(round((phase_data['end_point'] - start) * rate))
+        phases.append({
+            'phase': i,
+            'start_s': start,
+            'end_s': phase_data['end_point'],
+            'interval_s': 1.0 / rate,
+            'captures': captures,
+        })
+        start = phase_data['end_point']
+    return phases
+
+
+def plan_session(spec, cameras=1, codec_report=None, disk_rate=None, measure=True, frame_rate=None):
+    """
+    세션 용량 계획
+
+    Args:
+        spec (dict): 세션 설정 (capture_engine.DEFAULT_SESSION 항목)
+        cameras (int): 같은 설정으로 같은 디스크에 저장하는 카메라 수
+        codec_report (list): capture_codecs.benchmark_codecs() 결과 (없으면 선택한 형식만 측정)
+        disk_rate (float): 디스크 쓰기 속도 bytes/s (없으면 측정)
+        measure (bool): False면 측정하지 않고 알 수 없는 값은 None으로 둠
+        frame_rate (float): 카메라 fps (every_frame 구간 캡처 수), None이면 기본 fps
+
+    Returns:
+        dict: 'phases'(구간별 캡처 수/속도/바이트/밀리는 프레임 수/버스트 스테이징 여부), 'captures', 'bytes_per_frame', 'total_bytes', 'peak_bytes_per_s',
+              'encoder_captures_per_s', 'capacity_captures_per_s'(인코더/디스크 중 느린 쪽), 'disk_bytes_per_s', 'free_bytes', 'feasible', 'problems'(문제 설명 목록)
+    """
+    crop = spec['crop']
+    raw_bytes = crop['width'] * crop['height'] * 3
+    workers = spec['writer_workers']
+    queue_size = spec['writer_queue_size']
+
+    # 프레임당 바이트 수, 인코더 속도 (memmap은 인코딩 없이 raw 그대로)
+    encoder_rate = None
+    if spec['output_mode'] == 'memmap':
+        bytes_per_frame = raw_bytes
+    else:
+        codec = OutputCodec(spec['output_format'], spec['output_level'])
+        selected = next((r for r in codec_report or [] if r['name'] == codec.name), None)
+        if selected is None and measure:
+            os.makedirs(spec['base_path'], exist_ok=True)
+            report = benchmark_codecs((crop['height'], crop['width'], 3), options=[(codec.format, codec.level)], workers=workers,
+                                      out_dir=spec['base_path'])
+            selected = report[0] if report else None
+        # 측정하지 않으면 한 번 인코딩한 크기로 추정 (raw 크기로 두면 공간 확보가 압축 형식에서 몇 배로 커짐)
+        bytes_per_frame = selected['bytes'] if selected else estimate_frame_bytes(codec, (crop['height'], crop['width'], 3))
+        encoder_rate = selected['captures_per_s'] if selected else None
+
+    if disk_rate is None and measure:
+        disk_rate = measure_disk_rate(spec['base_path'])
+    free = shutil.disk_usage(existing_parent(spec['base_path'])).free
+
+    # 구간별 요구 속도, 따라가지 못하면 밀리는 프레임 수 (저장 큐가 흡수할 수 있는지)
+    # 초당 저장할 수 있는 캡처 수 = 인코더, 디스크 중 느린 쪽
+    limits = [rate for rate in (encoder_rate, disk_rate / bytes_per_frame if disk_rate else None) if rate]
+    capacity = min(limits) if limits else None
+
+    # 버스트 구간은 스테이징 칸(메모리 예산)도 밀리는 프레임을 받아 줌
+    staging_slots = int(spec['burst_memory_mb'] * 1e6 // raw_bytes) if spec['output_mode'] != 'memmap' else 0
+
+    problems = []
+    phases = phase_counts(spec['start_delay'], spec['cap_time'], frame_rate, dedupe=spec['dedupe_frames'])
+    for phase in phases:
+        rate = cameras / phase['interval_s']
+        phase['captures'] *= cameras
+        phase['captures_per_s'] = rate
+        phase['bytes_per_s'] = rate * bytes_per_frame
+        phase['bytes'] = phase['captures'] * bytes_per_frame
+        phase['backlog'] = 0 if capacity is None or rate <= capacity else int(np.ceil((rate - capacity) * (phase['end_s'] - phase['start_s'])))
+        phase['staged'] = phase['phase'] in spec['burst_phases'] and staging_slots > 0
+        holds = queue_size + (staging_slots if phase['staged'] else 0)
+        if phase['backlog'] > holds:
+            problems.append(f"Phase {phase['phase'] + 1} needs {rate:.1f} captures/s but about {capacity:.1f}/s can be saved; "
+                            f"{phase['backlog']} frames would back up ({'queue and burst staging hold' if phase['staged'] else 'queue holds'} {holds})")
+
+    total_captures = sum(phase['captures'] for phase in phases)
+    total_bytes = total_captures * bytes_per_frame
+    if total_bytes > free:
+        problems.append(f"Session needs about {total_bytes / 1e9:.2f} GB but only {free / 1e9:.2f} GB is free on {existing_parent(spec['base_path'])}")
+
+    return {
+        'phases': phases,
+        'captures': total_captures,
+        'bytes_per_frame': bytes_per_frame,
+        'total_bytes': total_bytes,
+        'peak_bytes_per_s': max((phase['bytes_per_s'] for phase in phases), default=0.0),
+        'encoder_captures_per_s': encoder_rate,
+        'capacity_captures_per_s': capacity,
+        'disk_bytes_per_s': disk_rate,
+        'free_bytes': free,
+        'feasible': not problems,
+        'problems': problems,
+    }
+
+
+def format_plan(plan):
+    """
+    plan_session() 결과를 표 문자열로
+
+    Returns:
+        str: 여러 줄 문자열
+    """
+    lines = [f"{'phase':>5} {'time (s)':>13} {'captures':>9} {'/s':>7} {'MB/s':>7} {'MB':>9}"]
+    for phase in plan['phases']:
+        lines.append(f"{phase['phase'] + 1:>5} {phase['start_s']:6.1f}-{phase['end_s']:<6.1f} {phase['captures']:>9} "
+                     f"{phase['captures_per_s']:7.1f} {phase['bytes_per_s'] / 1e6:7.2f} {phase['bytes'] / 1e6:9.1f}"
+                     f"{'  backlog ' + str(phase['backlog']) if phase['backlog'] else ''}{'  staged' if phase['staged'] else ''}")
+    encoder = f"{plan['encoder_captures_per_s']:.1f} captures/s" if plan['encoder_captures_per_s'] else "no encoding"
+    disk = f"{plan['disk_bytes_per_s'] / 1e6:.1f} MB/s" if plan['disk_bytes_per_s'] else "not measured"
+    lines.append(f"total {plan['captures']} captures, {plan['total_bytes'] / 1e6:.1f} MB ({plan['bytes_per_frame'] / 1024:.1f} KB/frame), "
+                 f"peak {plan['peak_bytes_per_s'] / 1e6:.2f} MB/s")
+    lines.append(f"encoder {encoder}, disk {disk}, free {plan['free_bytes'] / 1e9:.2f} GB")
+    lines.append("feasible" if plan['feasible'] else "NOT feasible:\n  " + "\n  ".join(plan['problems']))
+    return "\n".join(lines)
+
+
+class SpaceReservation:
+    """
+    세션 크기만큼 디스크 공간 미리 확보
+
+    자리 파일을 fallocate로 만들어 두고, 캡처를 저장할 때마다 그만큼 줄여서 공간을 넘겨줌
+    (세션 중 다른 프로그램이 디스크를 채워서 저장이 실패하는 것 방지)
+    """
+    NAME = '.reserved'
+
+    def __init__(self, folder, nbytes):
+        """
+        Args:
+            folder (str): 자리 파일을 만들 폴더 (버전 폴더)
+            nbytes (int): 확보할 바이트 수
+
+        Raises:
+            OSError: 공간이 부족할 때
+        """
+        self.path = os.path.join(folder, self.NAME)
+        self.size = int(nbytes)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if self.size > 0:
+                if hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(self._fd, 0, self.size)
+                else:
+                    os.ftruncate(self._fd, self.size)  # 실제 블록은 확보되지 않음
+        except OSError:
+            self.close()
+            raise
+
+    def release(self, nbytes):
+        """
+        nbytes만큼 자리 파일을 줄여서 공간 반납
+        """
+        if self._fd is None:
+            return
+        self.size = max(0, self.size - int(nbytes))
+        os.ftruncate(self._fd, self.size)
+
+    def close(self):
+        """
+        남은 자리 파일 삭제
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            os.remove(self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check whether a session spec fits the encoder, disk speed and free space")
+    parser.add_argument('spec', help="session spec JSON file")
+    parser.add_argument('--cameras', type=int, default=1, help="cameras saving with this spec to the same disk")
+    parser.add_argument('--fps', type=float, default=DEFAULT_FRAME_RATE, help=f"camera frame rate for every-frame phases (default: {DEFAULT_FRAME_RATE})")
+    parser.add_argument('--json', action='store_true', help="print the plan as JSON")
+    args = parser.parse_args()
+
+    from capture_engine import load_session_spec, validate_session_spec
+    try:
+        spec = load_session_spec(args.spec)
+        validate_session_spec(spec)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Invalid session spec: {e}")
+    plan = plan_session(spec, cameras=args.cameras, frame_rate=args.fps)
+    print(json.dumps(plan, indent=2) if args.json else format_plan(plan))
+    sys.exit(0 if plan['feasible'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+캡처 세션 CLI (Tk 없이 실행)
+
+세션 설정 JSON 파일을 읽어 카메라를 열고 캡처 세션을 실행
+SSH 접속 상태나 스크립트로 여러 세션을 연속 실행할 때 사용
+세션마다 base_path/target/titer/ 아래에 새 버전 폴더 생성
+
+세션 설정 파일 예 (빠진 항목은 capture_engine.DEFAULT_SESSION 값):
+    {
+        "base_path": "./sample", "target": "target", "titer": "titer",
+        "start_delay": 0.0,
+        "cap_time": [{"end_point": 10.0, "interval": 1.0}, {"end_point": 20.0, "interval": 0.5}],
+        "crop": {"xmin": 240, "ymin": 100, "width": 260, "height": 800},
+        "output_format": "jpg", "output_level": 90
+    }
+
+사용 예:
+    python capture_cli.py session.json --camera-id 0
+    python capture_cli.py session.json --source test --repeat 10 --json
+    python capture_cli.py session.json --source synthetic --size 1280x720 --fps 30
+    python capture_cli.py session.json --source video --path recording.mp4
+    python capture_cli.py session.json --source images --path ./frames --fps 21
+    python capture_cli.py session.json --source v4l2 --path /dev/video1 --size 1920x1080
+"""
+import argparse
+import json
+import sys
+
+from capture_engine import CaptureEngine, load_session_spec, validate_session_spec
+from frame_sources import SOURCE_TYPES, make_source
+
+
+def source_options(args):
+    """
+    명령행 인자에서 프레임 소스별 추가 인자 만들기
+
+    Returns:
+        dict: make_source()에 넘길 인자
+    """
+    size = None
+    if args.size:
+        width, height = args.size.lower().split('x')
+        size = {'width': int(width), 'height': int(height)}
+
+    if args.source in ('csi', 'test'):
+        return {'dual_branch': args.dual}
+    if args.source == 'v4l2':
+        options = dict(size or {}, fps=args.fps)
+        if args.path:
+            options['device'] = args.path
+        return options
+    if args.source in ('video', 'images'):
+        if not args.path:
+            raise ValueError(f"--source {args.source} needs --path")
+        options = {'path': args.path, 'loop': not args.once}
+        if args.fps:
+            options['fps'] = args.fps
+        return options
+    # synthetic
+    options = dict(size or {})
+    if args.fps:
+        options['fps'] = args.fps
+    return options
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run capture sessions from a session spec file without the Tk UI")
+    parser.add_argument('spec', help="session spec JSON file")
+    parser.add_argument('--camera-id', type=int, default=0)
+    parser.add_argument('--source', choices=SOURCE_TYPES, default='csi',
+                        help="'csi' (nvarguscamerasrc), 'test' (videotestsrc), 'v4l2' (USB camera), 'video' (video file), "
+                             "'images' (image directory) or 'synthetic' (generated frames, no GStreamer)")
+    parser.add_argument('--path', help="video file, image directory or V4L2 device for --source video/images/v4l2")
+    parser.add_argument('--fps', type=float, help="frame rate for synthetic/images/v4l2 sources (video defaults to the file's)")
+    parser.add_argument('--size', help="WIDTHxHEIGHT for synthetic/v4l2 sources")
+    parser.add_argument('--once', action='store_true', help="play a video/image source once instead of looping")
+    parser.add_argument('--dual', action='store_true', help="use the tee'd capture/preview pipeline (needs PyGObject)")
+    parser.add_argument('--repeat', type=int, default=1, help="number of sessions to run back to back")
+    parser.add_argument('--open-timeout', type=float, default=10.0, help="seconds to wait for the first camera frame")
+    parser.add_argument('--json', action='store_true', help="print per-session stats as JSON lines")
+    args = parser.parse_args()
+
+    try:
+        spec = load_session_spec(args.spec)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Invalid session spec: {e}")
+
+    try:
+        options = source_options(args)
+    except ValueError as e:
+        sys.exit(f"Invalid source options: {e}")
+    source = make_source(camera_id=args.camera_id, camera_source=args.source, **options)
+    source.start()
+    try:
+        if not source.wait_for_frame(timeout=args.open_timeout):
+            sys.exit(f"Camera {args.camera_id} did not deliver frames within {args.open_timeout:.0f}s")
+        try:
+            validate_session_spec(spec, frame_size=source.frame_size)
+        except ValueError as e:
+            sys.exit(f"Invalid session spec: {e}")
+
+        failed = 0
+        for _ in range(args.repeat):
+            engine = CaptureEngine([(source, spec)])
+            engine.start()
+            try:
+                # 메인 스레드는 Ctrl+C만 받음 (짧게 끊어서 대기)
+                while not engine.wait(timeout=0.5):
+                    pass
+            except KeyboardInterrupt:
+                print("Interrupted, finishing pending writes...")
+                engine.stop()
+                engine.wait()
+                break
+            finally:
+                if args.json:
+                    print(json.dumps(engine.stats()))
+            if engine.error:
+                failed += 1
+    finally:
+        source.stop()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
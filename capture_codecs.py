@@ -0,0 +1,277 @@
+"""
+캡처 저장 형식 (코덱)
+
+세션마다 저장 형식과 압축 수준 선택
+- 'png': 무손실, level = 압축 수준 0-9 (None이면 OpenCV 기본값)
+- 'jpg', 'webp': 손실 압축, level = 품질 0-100
+- 'tiff': 무압축 TIFF
+- 'ppm': 무압축 binary PPM
+- 'npy': 인코딩 없이 numpy 배열 그대로 (가장 빠름, 나중에 변환 필요)
+
+benchmark_codecs()로 현재 ROI 크기에서 형식별 저장 속도(초당 캡처 수)를 측정해서
+스케줄이 요구하는 속도와 비교할 수 있음
+"""
+import io
+import os
+import tempfile
+import time
+import zlib
+
+import cv2
+import numpy as np
+
+from capture_scheduler import phase_rate
+
+# 형식별 확장자, 수준 인자(cv2 imwrite 플래그), 수준 범위, 기본 수준
+OUTPUT_FORMATS = {
+    'png': {'ext': '.png', 'flag': cv2.IMWRITE_PNG_COMPRESSION, 'range': (0, 9), 'default': None},
+    'jpg': {'ext': '.jpg', 'flag': cv2.IMWRITE_JPEG_QUALITY, 'range': (0, 100), 'default': 95},
+    'webp': {'ext': '.webp', 'flag': cv2.IMWRITE_WEBP_QUALITY, 'range': (1, 100), 'default': 90},
+    'tiff': {'ext': '.tiff', 'flag': None, 'range': None, 'default': None},
+    'ppm': {'ext': '.ppm', 'flag': None, 'range': None, 'default': None},
+    'npy': {'ext': '.npy', 'flag': None, 'range': None, 'default': None},
+}
+
+# 시작할 때 측정하는 (형식, 수준) 목록
+BENCHMARK_OPTIONS = [('png', None), ('png', 1), ('png', 0), ('jpg', 95), ('jpg', 85), ('webp', 90), ('tiff', None), ('ppm', None), ('npy', None)]
+
+
+def checksum(data):
+    """
+    저장한 데이터 체크섬 (crc32, 8자리 16진수)
+
+    Args:
+        data: bytes 또는 연속 배열 (np.ndarray)
+    """
+    return f"{zlib.crc32(data):08x}"
+
+
+def validate_output(fmt, level=None):
+    """
+    저장 형식/수준 확인
+
+    Raises:
+        ValueError: 모르는 형식이거나 수준이 범위를 벗어났을 때
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {fmt} (choose from {', '.join(OUTPUT_FORMATS)})")
+    if level is None:
+        return
+    level_range = OUTPUT_FORMATS[fmt]['range']
+    if level_range is None:
+        raise ValueError(f"Output format {fmt} has no compression level")
+    if not isinstance(level, int) or not level_range[0] <= level <= level_range[1]:
+        raise ValueError(f"Output level for {fmt} must be an integer in {level_range[0]}-{level_range[1]}")
+
+
+class OutputCodec:
+    """
+    캡처 프레임 인코딩 + 파일 쓰기
+
+    CaptureWriter 워커 스레드에서 여러 개가 동시에 write() 호출 가능 (상태 없음)
+    """
+    def __init__(self, fmt='png', level=None):
+        """
+        Args:
+            fmt (str): 저장 형식 (OUTPUT_FORMATS 키)
+            level (int): 압축 수준/품질, None이면 형식 기본값
+        """
+        validate_output(fmt, level)
+        info = OUTPUT_FORMATS[fmt]
+        self.format = fmt
+        self.level = info['default'] if level is None else level
+        self.ext = info['ext']
+        if info['flag'] is not None and self.level is not None:
+            self.params = [info['flag'], self.level]
+        elif fmt == 'tiff':
+            self.params = [cv2.IMWRITE_TIFF_COMPRESSION, 1]  # 1 = 압축 없음
+        elif fmt == 'ppm':
+            self.params = [cv2.IMWRITE_PXM_BINARY, 1]
+        else:
+            self.params = []
+
+    @property
+    def name(self):
+        """표시용 이름 (예: 'png-1', 'jpg-95', 'tiff')"""
+        return self.format if self.level is None else f"{self.format}-{self.level}"
+
+    def write(self, filename, frame, timestamp_ns=None):
+        """
+        프레임을 파일로 저장
+
+        Args:
+            filename (str): 저장할 파일 경로 (확장자 포함)
+            frame (np.ndarray): BGR 이미지
+            timestamp_ns (int): 촬영 시각 (파일 하나씩 저장할 때는 사용 안 함, 컨테이너와 같은 인터페이스)
+
+        Returns:
+            bool: 성공하면 True
+        """
+        if self.format == 'npy':
+            # np.save는 확장자가 없으면 .npy를 붙이므로 파일 객체로 저장
+            with open(filename, 'wb') as f:
+                np.save(f, frame)
+            return True
+        return cv2.imwrite(filename, frame, self.params)
+
+    def save(self, filename, frame, timestamp_ns=None):
+        """
+        프레임을 메모리에서 인코딩해서 파일로 저장 (CaptureWriter에서 사용, 매니페스트에 크기/체크섬 기록)
+
+        Returns:
+            dict: 'bytes'(저장한 크기), 'checksum'(crc32)
+        """
+        data = self.encode(frame)
+        with open(filename, 'wb') as f:
+            f.write(data)
+        return {'bytes': len(data), 'checksum': checksum(data)}
+
+    def encode(self, frame):
+        """
+        프레임을 메모리에서 인코딩 (파일 쓰기 없이)
+
+        Returns:
+            bytes: 인코딩된 파일 내용
+        """
+        if self.format == 'npy':
+            buf = io.BytesIO()
+            np.save(buf, frame)
+            return buf.getvalue()
+        ok, data = cv2.imencode(self.ext, frame, self.params)
+        if not ok:
+            raise ValueError(f"Failed to encode frame as {self.name}")
+        return data.tobytes()
+
+
+def required_rate(cap_time, cameras=1, frame_rate=None):
+    """
+    스케줄이 요구하는 최대 저장 속도
+
+    Args:
+        cap_time (list): 캡처 구간 설정 [{'end_point', 'interval'}, ...]
+        cameras (int): 같은 저장 풀을 쓰는 카메라 수
+        frame_rate (float): 카메라 fps (every_frame 구간), None이면 기본 fps
+
+    Returns:
+        float: 초당 캡처 수 (가장 빠른 구간 기준)
+    """
+    if not cap_time:
+        return 0.0
+    return cameras * max(phase_rate(phase, frame_rate) for phase in cap_time)
+
+
+def benchmark_options(codec):
+    """
+    선택한 형식을 맨 앞에 두고 나머지 BENCHMARK_OPTIONS를 붙인 측정 목록 (엔진과 UI가 같은 목록으로 측정)
+
+    Args:
+        codec (OutputCodec): 선택한 저장 형식
+
+    Returns:
+        list: (형식, 수준) 목록
+    """
+    options = [(codec.format, codec.level)]
+    return options + [option for option in BENCHMARK_OPTIONS if option != options[0]]
+
+
+def synthetic_frame(shape):
+    """
+    측정용 합성 프레임 (그라데이션 + 노이즈, 실제 영상과 비슷한 압축률)
+
+    Args:
+        shape (tuple): (h, w, 3)
+
+    Returns:
+        np.ndarray: BGR uint8
+    """
+    height, width = shape[:2]
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width)), (x + y) / 2], axis=-1)
+    return np.clip(base + rng.normal(0, 6, size=base.shape), 0, 255).astype(np.uint8)
+
+
+def estimate_frame_bytes(codec, shape):
+    """
+    합성 프레임을 메모리에서 한 번 인코딩한 크기 (파일 쓰기/디스크 측정 없이 프레임당 저장 크기 추정)
+
+    Args:
+        codec (OutputCodec): 저장 형식
+        shape (tuple): 저장할 프레임 shape (h, w, 3)
+
+    Returns:
+        int: 바이트 수
+    """
+    return len(codec.encode(synthetic_frame(shape)))
+
+
+def benchmark_codecs(shape, options=None, frames=8, workers=1, out_dir=None):
+    """
+    저장 형식별 인코딩 + 쓰기 속도 측정
+
+    합성 프레임(synthetic_frame)을 frames장 저장해서 측정
+
+    Args:
+        shape (tuple): 저장할 프레임 shape (h, w, 3), 보통 ROI 크기
+        options (list): 측정할 (형식, 수준) 목록, None이면 BENCHMARK_OPTIONS
+        frames (int): 형식마다 저장할 프레임 수
+        workers (int): 저장 워커 스레드 수 (초당 캡처 수 추정에 곱함)
+        out_dir (str): 측정 파일을 쓸 폴더 (저장할 디스크와 같은 곳 권장), None이면 임시 폴더
+
+    Returns:
+        list: 형식별 dict ('format', 'name', 'ms_per_frame', 'bytes', 'captures_per_s')
+    """
+    frame = synthetic_frame(shape)
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp_dir:
+        for fmt, level in options or BENCHMARK_OPTIONS:
+            codec = OutputCodec(fmt, level)
+            try:
+                codec.write(os.path.join(tmp_dir, f"warmup{codec.ext}"), frame)
+                size = 0
+                t0 = time.perf_counter()
+                for i in range(frames):
+                    filename = os.path.join(tmp_dir, f"{codec.name}_{i}{codec.ext}")
+                    if not codec.write(filename, frame):
+                        raise ValueError("imwrite returned False")
+                    size += os.path.getsize(filename)
+                elapsed = (time.perf_counter() - t0) / frames
+            except Exception as e:
+                print(f"Codec benchmark failed for {codec.name}: {e}")
+                continue
+            results.append({
+                'format': fmt,
+                'level': codec.level,
+                'name': codec.name,
+                'ms_per_frame': elapsed * 1000,
+                'bytes': size // frames,
+                'captures_per_s': workers / elapsed if elapsed > 0 else float('inf'),
+            })
+    return results
+
+
+def format_benchmark(results, required=None, selected=None):
+    """
+    benchmark_codecs() 결과를 표 문자열로
+
+    Args:
+        results (list): benchmark_codecs() 결과
+        required (float): 스케줄이 요구하는 초당 캡처 수 (있으면 따라갈 수 있는지 표시)
+        selected (str): 현재 선택한 형식 이름 (표시용)
+
+    Returns:
+        str: 여러 줄 문자열
+    """
+    lines = [f"{'format':>8} {'ms/frame':>9} {'KB':>8} {'captures/s':>11}"]
+    for r in results:
+        mark = ''
+        if required:
+            mark = '  ok' if r['captures_per_s'] >= required else '  too slow'
+        if r['name'] == selected:
+            mark += '  <- selected'
+        lines.append(f"{r['name']:>8} {r['ms_per_frame']:9.2f} {r['bytes'] / 1024:8.1f} {r['captures_per_s']:11.1f}{mark}")
+    if required:
+        lines.append(f"schedule needs {required:.1f} captures/s")
+    return "\n".join(lines)
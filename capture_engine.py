@@ -0,0 +1,897 @@
+"""
+캡처 엔진 (Tk 없이 동작)
+
+- CaptureEngine: 세션 설정에 따라 예정 시각의 프레임을 골라 ROI만 비동기 저장
+  (여러 카메라를 하나의 스케줄러/저장 풀로 처리 가능)
+
+프레임 소스(카메라, 동영상/이미지 재생, 합성 프레임)는 frame_sources 참고
+CameraUI와 capture_cli.py가 같은 엔진을 사용
+"""
+import copy
+import csv
+import json
+import os
+import threading
+
+import numpy as np
+
+from burst_stage import BurstStage, burst_windows
+from capacity_planner import SpaceReservation, format_plan, phase_counts, plan_session
+from capture_codecs import OutputCodec, benchmark_codecs, benchmark_options, checksum, format_benchmark, required_rate, validate_output
+from capture_scheduler import DeadlineScheduler, compile_deadlines
+from capture_writer import CaptureWriter
+from change_gate import GATE_MAX_SCORES, GATE_METHODS, ChangeGate
+from event_trigger import TRIGGER_SPACES, ColourTrigger
+from frame_buffer import RoiBufferPool
+from frame_container import CONTAINER_NAME, ContainerSet
+from session_array import FRAMES_NAME, SessionArray
+from roi_stats import STATS_NAME, RoiStatsWriter
+from session_manifest import SessionManifest
+from session_versions import next_version_path
+
+# 세션 설정 기본값 (세션 설정 파일에서 빠진 항목에 사용)
+DEFAULT_SESSION = {
+    'base_path': './sample',
+    'target': 'target',
+    'titer': 'titer',
+    'start_delay': 0.0,  # 캡처 시작 전 대기 시간 (초)
+    'cap_time': [  # end_point: 해당 구간의 종료 시점 (누적 시간), interval: 해당 구간에서의 캡처 간격
+                   # every_frame: True면 interval마다 그동안 들어온 새 프레임을 모두 저장 (카메라 fps로 빠짐없이)
+                   # triggered: True면 interval은 dense 간격, ROI 색 변화가 없으면 trigger_sparse_interval 간격으로만 저장
+        {'end_point': 10.0, 'interval': 1.0},
+        {'end_point': 20.0, 'interval': 1.0},
+    ],
+    'crop': {'xmin': 240, 'ymin': 100, 'width': 260, 'height': 800},  # ROI
+    'sensor_crop': False,  # 캡처 중 ROI를 카메라 파이프라인에서 잘라낼지
+    'writer_workers': 2,  # 인코딩/쓰기 워커 스레드 수
+    'writer_queue_size': 32,  # 저장 대기 큐 최대 길이
+    'writer_overflow': 'block',  # 큐가 가득 찼을 때 정책: 'block', 'drop_oldest', 'spill'
+    'missed_deadline_policy': 'catchup',  # deadline 놓쳤을 때 정책: 'catchup', 'skip', 'reanchor'
+    'output_format': 'png',  # 저장 형식: 'png', 'jpg', 'webp', 'tiff', 'ppm', 'npy' (capture_codecs 참고)
+    'output_level': None,  # png 압축 수준 0-9, jpg/webp 품질 0-100, None이면 형식 기본값
+    'codec_benchmark': False,  # 세션 시작 전 ROI 크기로 저장 형식별 속도 측정해서 출력 (형식 9개, 시작이 몇 초 늦어짐)
+    'output_mode': 'files',  # 'files': 캡처마다 파일 하나, 'container': 버전 폴더의 frames.jfc 하나에 이어서 저장 (frame_container 참고),
+                             # 'memmap': 인코딩 없이 미리 만든 (N, h, w, 3) 배열 frames.npy에 저장 (session_array 참고)
+    'capacity_check': 'off',  # 시작 전 용량 계획: 'off', 'warn'(출력만), 'strict'(불가능하면 시작 안 함), 켜면 인코더/디스크 속도 측정으로 시작이 늦어짐
+    'reserve_space': False,  # 세션 크기만큼 디스크 공간을 미리 확보 (png/jpg/webp는 합성 프레임 한 번 인코딩한 크기로 추정, 저장할 때마다 그만큼 반납)
+    'burst_phases': [],  # 메모리에 모아 두고 나중에 저장할 캡처 구간 (cap_time 인덱스, 0부터), burst_stage 참고
+    'burst_memory_mb': 512,  # 버스트 스테이징 메모리 예산 상한 (모든 카메라 합계, 버스트 구간 캡처 수만큼만 할당)
+    'dedupe_frames': True,  # 직전에 저장한 프레임이 다시 골라지면 저장하지 않고 매니페스트에 'duplicate'로 기록
+    'burst_dir': None,  # 스테이징 칸을 둘 tmpfs 폴더 (예: /dev/shm), None이면 프로세스 메모리
+    'change_gate': 'off',  # 변화 없는 프레임 저장 안 함: 'off', 'mad'(평균 절대 차이), 'hist'(채널별 히스토그램 거리), change_gate 참고
+    'change_threshold': None,  # 이 값 이상 달라져야 저장 ('mad': 0-255, 'hist': 0-1), None이면 방식별 기본값 (mad 2.0, hist 0.05)
+    'change_step': 8,  # 비교용으로 ROI를 줄일 때 건너뛸 픽셀 간격
+    'change_keyframe_s': 60.0,  # 변화가 없어도 이 시간(초)마다 한 번은 저장, None이면 안 함
+    'trigger_space': 'lab',  # triggered 구간 색 변화 측정 색 공간: 'lab', 'hsv' (event_trigger 참고)
+    'trigger_bands': 8,  # ROI 긴 축을 나눌 띠 수 (띠별 평균 색 변화 중 최댓값 사용)
+    'trigger_threshold': 5.0,  # dense로 바꿀 색 변화 속도 (색 공간 단위/초)
+    'trigger_hold_s': 5.0,  # 변화가 멈춘 뒤 dense를 유지할 시간 (초)
+    'trigger_sparse_interval': 10.0,  # 변화가 없을 때 저장 간격 (초)
+    'roi_stats': False,  # 저장하는 ROI마다 인코딩 전에 색 통계(채널별 평균/표준편차, HSV/Lab 평균)를 roi_stats.npy에 기록 (roi_stats 참고)
+    'roi_stats_profile': False,  # ROI 긴 축 줄별 평균도 roi_profile.npy에 기록
+    'roi_stats_step': 2,  # HSV/Lab 평균을 낼 때 건너뛸 픽셀 간격
+}
+
+OUTPUT_MODES = ('files', 'container', 'memmap')
+CAPACITY_CHECKS = ('off', 'warn', 'strict')
+
+
+def load_session_spec(path):
+    """
+    세션 설정 JSON 파일 읽기
+
+    빠진 항목은 DEFAULT_SESSION 값으로 채움
+
+    Args:
+        path (str): 세션 설정 파일 경로
+
+    Returns:
+        dict: 세션 설정
+    """
+    with open(path) as f:
+        spec = json.load(f)
+    unknown = set(spec) - set(DEFAULT_SESSION)
+    if unknown:
+        raise ValueError(f"Unknown session settings: {', '.join(sorted(unknown))}")
+    return complete_session_spec(spec)
+
+
+def complete_session_spec(spec):
+    """
+    빠진 항목을 DEFAULT_SESSION 값으로 채운 세션 설정 사본
+
+    Returns:
+        dict: 세션 설정
+    """
+    merged = copy.deepcopy(DEFAULT_SESSION)
+    merged.update(copy.deepcopy(spec))
+    return merged
+
+
+def validate_session_spec(spec, frame_size=None):
+    """
+    세션 설정 유효성 검증
+
+    검증 항목:
+    - ROI가 프레임 경계 내에 있는지 (frame_size가 있을 때)
+    - 타이밍 값들이 유효한지 (양수, 순차적)
+    - Target과 Titer 이름이 입력되었는지
+
+    Args:
+        spec (dict): 세션 설정
+        frame_size (tuple): 전체 프레임 크기 (w, h)
+
+    Raises:
+        ValueError: 유효하지 않은 값이 있을 때
+    """
+    spec = complete_session_spec(spec)
+    crop = spec['crop']
+    if crop['xmin'] < 0 or crop['ymin'] < 0 or crop['width'] <= 0 or crop['height'] <= 0:
+        raise ValueError("ROI must have a non-negative origin and a positive size")
+    if frame_size is not None:
+        frame_w, frame_h = frame_size
+        if (crop['xmin'] + crop['width']) > frame_w or (crop['ymin'] + crop['height']) > frame_h:
+            raise ValueError(f"ROI exceeds image bounds ({frame_w}x{frame_h})")
+
+    last_endpoint = spec['start_delay']
+    if last_endpoint < 0: raise ValueError("Start Delay must be non-negative")
+    if not spec['cap_time']: raise ValueError("At least one capture phase is required")
+    for phase in spec['cap_time']:
+        # 간격은 양수여야 함
+        if phase['interval'] <= 0:
+            raise ValueError("Intervals must be positive (e.g. > 0)")
+        # 종료 시점은 이전 시점보다 커야 함 (순차적)
+        if phase['end_point'] <= last_endpoint:
+            raise ValueError("Each end point must be greater than the previous time point.")
+        # every_frame 구간은 캡처 수가 카메라 fps에 따라 달라서 미리 만드는 배열에 저장 불가
+        if phase.get('every_frame') and spec['output_mode'] == 'memmap':
+            raise ValueError("Every-frame phases need output_mode 'files' or 'container'")
+        if phase.get('every_frame') and phase.get('triggered'):
+            raise ValueError("A phase cannot be both every-frame and triggered")
+        last_endpoint = phase['end_point']
+
+    if not str(spec['target']).strip() or not str(spec['titer']).strip(): raise ValueError("Target and Titer names cannot be empty")
+    if spec['writer_overflow'] not in CaptureWriter.OVERFLOW_POLICIES:
+        raise ValueError(f"Unknown overflow policy: {spec['writer_overflow']}")
+    if spec['missed_deadline_policy'] not in DeadlineScheduler.MISSED_POLICIES:
+        raise ValueError(f"Unknown missed-deadline policy: {spec['missed_deadline_policy']}")
+    validate_output(spec['output_format'], spec['output_level'])
+    if spec['output_mode'] not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode: {spec['output_mode']}")
+    if spec['capacity_check'] not in CAPACITY_CHECKS:
+        raise ValueError(f"Unknown capacity check: {spec['capacity_check']}")
+    if spec['burst_phases']:
+        if spec['output_mode'] == 'memmap':
+            raise ValueError("Burst staging needs output_mode 'files' or 'container' (memmap frames are not encoded)")
+        if any(not isinstance(i, int) or not 0 <= i < len(spec['cap_time']) for i in spec['burst_phases']):
+            raise ValueError(f"Burst phases must be capture phase indices 0-{len(spec['cap_time']) - 1}")
+        if spec['burst_memory_mb'] <= 0:
+            raise ValueError("Burst memory budget must be positive")
+    if spec['change_gate'] not in GATE_METHODS:
+        raise ValueError(f"Unknown change gate: {spec['change_gate']}")
+    if spec['change_step'] < 1:
+        raise ValueError("Change step must be at least 1")
+    if spec['change_gate'] != 'off' and spec['change_threshold'] is not None:
+        max_score = GATE_MAX_SCORES[spec['change_gate']]
+        if not 0 <= spec['change_threshold'] <= max_score:
+            raise ValueError(f"Change threshold for '{spec['change_gate']}' must be between 0 and {max_score:g}")
+    if any(phase.get('triggered') for phase in spec['cap_time']):
+        if spec['trigger_space'] not in TRIGGER_SPACES:
+            raise ValueError(f"Unknown trigger colour space: {spec['trigger_space']}")
+        if spec['trigger_bands'] < 1 or spec['trigger_threshold'] < 0 or spec['trigger_hold_s'] < 0 or spec['trigger_sparse_interval'] <= 0:
+            raise ValueError("Trigger bands must be at least 1, threshold and hold non-negative and sparse interval positive")
+    if spec['roi_stats'] and spec['roi_stats_step'] < 1:
+        raise ValueError("ROI stats step must be at least 1")
+
+
+class CaptureEngine:
+    """
+    캡처 세션 실행기
+
+    세션 설정(ROI, start_delay, cap_time, base_path/target/titer)에 따라
+    예정 시각에 촬영 시각이 가장 가까운 프레임을 프레임 소스 링 버퍼에서 골라
+    ROI만 잘라 CaptureWriter로 비동기 저장
+    저장 경로: base_path/target/titer/버전번호/순번_경과시간.png
+    캡처마다 버전 폴더의 manifest.jsonl에 한 줄 기록 (session_manifest 참고)
+    roi_stats를 켜면 저장하는 ROI의 색 통계를 roi_stats.npy에 기록 (roi_stats 참고)
+
+    여러 카메라를 한 세션으로 돌리면 모든 카메라의 deadline을 하나의 스케줄러로,
+    저장은 하나의 CaptureWriter 풀로 처리 (저장/스케줄 정책은 첫 번째 카메라 설정 사용)
+
+    sync=True면 첫 번째 카메라의 타이밍 설정 하나로 모든 카메라를 동시에 캡처
+    deadline마다 카메라별로 예정 시각에 가장 가까운 프레임을 골라 저장하고,
+    첫 번째 카메라 버전 폴더의 sync_pairs.csv에 프레임 쌍과 카메라 간 촬영 시각 차이(skew) 기록
+    (CSI 센서 간 하드웨어 트리거는 없으므로 같은 monotonic 시계 기준 촬영 시각으로 맞춤)
+    """
+    SYNC_RECORD = 'sync_pairs.csv'
+
+    def __init__(self, cameras, on_finished=None, sync=False):
+        """
+        Args:
+            cameras (list): [(FrameSource, 세션 설정 dict), ...] 카메라별 프레임 소스와 세션 설정
+            on_finished: 세션이 끝나면 엔진을 인자로 호출 (캡처 스레드에서 호출)
+            sync (bool): 모든 카메라를 같은 deadline에 동시 캡처하고 프레임 쌍 기록
+
+        Raises:
+            ValueError: 카메라가 없거나 세션 설정이 유효하지 않을 때 (validate_session_spec)
+        """
+        if not cameras:
+            raise ValueError("At least one camera is required")
+        for _, spec in cameras:
+            validate_session_spec(complete_session_spec(spec))
+        self.cameras = [{'source': source, 'spec': complete_session_spec(spec), 'version_path': None, 'residuals': [], 'array': None,
+                         'manifest': None, 'seq': 0, 'last': None, 'duplicates': 0,
+                         'gate': None, 'unchanged': 0, 'trigger': None, 'roi_stats': None} for source, spec in cameras]
+        self.on_finished = on_finished
+        self.sync = sync
+        self.sync_path = None  # 프레임 쌍 기록 파일 (sync 모드)
+        self.skews = []  # deadline별 카메라 간 촬영 시각 차이 (최대 - 최소, ns)
+
+        self.is_capturing = False  # 캡처 진행 중 여부
+        self.thread = None  # 캡처 스레드
+        self.writer = None  # 현재 세션의 CaptureWriter (모든 카메라 공유)
+        self.scheduler = None  # 현재 세션의 DeadlineScheduler (모든 카메라 공유)
+        self.codec = None  # 저장 형식 (저장 풀을 공유하므로 첫 번째 카메라 설정)
+        self.codec_report = None  # 세션 시작 전 저장 형식별 속도 측정 결과
+        self.container = None  # 컨테이너 저장이면 카메라(버전 폴더)별 컨테이너 (ContainerSet)
+        self._slots = None  # 'memmap' 저장: deadline 번호 → 카메라 배열의 칸 번호
+        self.plan = None  # 시작 전 용량 계획 (capacity_planner.plan_session)
+        self.reservation = None  # 미리 확보한 디스크 공간 (files/container 저장)
+        self.burst = None  # 버스트 구간 RAM 스테이징 (BurstStage)
+        self._trigger_tick = None  # 동시 캡처 triggered 구간: 첫 번째 카메라의 (deadline 번호, 저장 여부, 변화 속도, dense)
+        self.error = None  # 세션을 중단시킨 예외
+
+    @property
+    def version_paths(self):
+        """카메라별 이번 세션 저장 폴더"""
+        return [camera['version_path'] for camera in self.cameras]
+
+    def start(self):
+        """
+        캡처 스레드 시작
+        """
+        self.is_capturing = True
+        self.thread = threading.Thread(target=self.run, name="capture-engine", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        캡처 중지 요청 (저장 대기 중인 프레임은 모두 저장된 뒤 세션 종료)
+        """
+        self.is_capturing = False
+
+    def wait(self, timeout=None):
+        """
+        캡처 스레드 종료 대기
+
+        Returns:
+            bool: 종료되었으면 True
+        """
+        if self.thread:
+            self.thread.join(timeout)
+            return not self.thread.is_alive()
+        return True
+
+    def _prepare_camera(self, camera, pool_size):
+        """
+        카메라별 세션 준비: 센서 측 crop, 버전 폴더, ROI 복사 영역/버퍼 풀
+        """
+        source, spec = camera['source'], camera['spec']
+        crop = spec['crop']
+
+        # 센서 측 crop: ROI만 나오도록 파이프라인 다시 열고 첫 프레임까지 대기
+        if spec['sensor_crop'] and source.roi != crop:
+            source.restart(roi=dict(crop))
+
+        # 전체 경로: base_path/target/titer/버전번호/
+        camera['version_path'] = next_version_path(os.path.join(spec['base_path'], spec['target'], spec['titer']))
+        camera['manifest'] = SessionManifest(camera['version_path'])
+        camera['seq'] = 0
+        camera['last'] = None  # 마지막으로 저장한 (프레임 번호, 파일명, 매니페스트 path)
+        camera['duplicates'] = 0
+        camera['unchanged'] = 0
+        if spec['change_gate'] != 'off':
+            camera['gate'] = ChangeGate(spec['change_gate'], spec['change_threshold'], spec['change_step'], spec['change_keyframe_s'])
+
+        # triggered 구간 색 변화 감시 (동시 캡처면 첫 번째 카메라가 모든 카메라의 저장 여부를 정함)
+        if any(phase.get('triggered') for phase in spec['cap_time']) and (not self.sync or camera is self.cameras[0]):
+            camera['trigger'] = ColourTrigger(spec['trigger_space'], spec['trigger_bands'], spec['trigger_threshold'], spec['trigger_hold_s'],
+                                              spec['trigger_sparse_interval'])
+            camera['trigger_buf'] = np.empty((crop['height'], crop['width'], 3), dtype=np.uint8)
+        if spec['roi_stats']:
+            camera['roi_stats'] = RoiStatsWriter(camera['version_path'], (crop['height'], crop['width'], 3), spec['roi_stats_profile'], spec['roi_stats_step'])
+        print(f"--------- Capture Start: Camera {source.camera_id} saving to {camera['version_path']} ---------")
+
+        # ROI 복사용 버퍼 풀 (저장 대기 중인 프레임 수만큼 미리 할당)
+        camera['roi'] = (crop['xmin'], crop['ymin'], crop['width'], crop['height'])
+        if source.roi is not None:
+            # 파이프라인에서 이미 ROI만 잘라서 나옴, 다시 열린 파이프라인의 첫 프레임까지 대기
+            camera['roi'] = (0, 0, crop['width'], crop['height'])
+            if not source.wait_for_frame(timeout=10):
+                raise RuntimeError(f"No frames from the ROI-cropped pipeline of camera {source.camera_id}")
+        camera['pool'] = RoiBufferPool((crop['height'], crop['width'], 3), count=pool_size)
+
+    def _allocate_arrays(self, deadlines):
+        """
+        'memmap' 저장: 카메라별 캡처 수만큼 (N, h, w, 3) 배열 파일 미리 생성
+
+        동시 캡처면 모든 카메라가 같은 deadline 목록을 쓰므로 칸 번호 = deadline 번호,
+        아니면 deadline 목록에서 해당 카메라(key) deadline 중 몇 번째인지
+
+        Args:
+            deadlines (list): DeadlineScheduler에 넘길 deadline 목록
+        """
+        if self.sync:
+            self._slots = list(range(len(deadlines)))
+            counts = [len(deadlines)] * len(self.cameras)
+        else:
+            counts = [0] * len(self.cameras)
+            self._slots = []
+            for _, _, key in deadlines:
+                self._slots.append(counts[key])
+                counts[key] += 1
+        for camera, count in zip(self.cameras, counts):
+            crop = camera['spec']['crop']
+            camera['array'] = SessionArray(camera['version_path'], count, (crop['height'], crop['width'], 3),
+                                           preallocate=camera['spec']['reserve_space'])
+            print(f"Camera {camera['source'].camera_id}: preallocated {count} frames ({camera['array'].nbytes / 1e6:.1f} MB) "
+                  f"in {os.path.join(camera['version_path'], FRAMES_NAME)}")
+
+    def _frame_rate(self):
+        """
+        카메라 fps (가장 빠른 카메라, 프레임 간격 측정값 우선), every_frame 구간 용량 계산용
+
+        Returns:
+            float: fps, 알 수 없으면 None (기본 fps 사용)
+        """
+        rates = []
+        for camera in self.cameras:
+            period_ns = camera['source'].frame_buffer.frame_period_ns()
+            rate = 1e9 / period_ns if period_ns else camera['source'].fps
+            if rate:
+                rates.append(rate)
+        return max(rates) if rates else None
+
+    def _benchmark_codecs(self, shared):
+        """
+        가장 큰 ROI 크기로 저장 형식별 속도 측정, 스케줄이 요구하는 속도와 함께 출력
+
+        측정 파일은 첫 번째 카메라 버전 폴더(저장할 디스크)에 쓰고 지움, 스케줄 시작 전에 실행
+
+        Args:
+            shared (dict): 저장 풀 설정을 가져올 세션 설정 (첫 번째 카메라)
+        """
+        width, height = max(((c['spec']['crop']['width'], c['spec']['crop']['height']) for c in self.cameras), key=lambda size: size[0] * size[1])
+        self.codec_report = benchmark_codecs((height, width, 3), options=benchmark_options(self.codec), workers=shared['writer_workers'],
+                                             out_dir=self.cameras[0]['version_path'])
+        required = required_rate(shared['cap_time'], cameras=len(self.cameras), frame_rate=self._frame_rate())
+        print(f"Output format benchmark ({width}x{height} ROI, {shared['writer_workers']} writer(s)):")
+        print(format_benchmark(self.codec_report, required=required, selected=self.codec.name))
+        selected = next((r for r in self.codec_report if r['name'] == self.codec.name), None)
+        if selected and selected['captures_per_s'] < required:
+            print(f"Warning: {self.codec.name} keeps up with about {selected['captures_per_s']:.1f} captures/s, "
+                  f"the schedule needs {required:.1f}; frames will queue up ({shared['writer_overflow']} policy)")
+
+    def run(self):
+        """
+        캡처 세션 실행 (끝날 때까지 반환하지 않음)
+
+        타이밍에 따라 프레임 캡처, 파일로 저장
+        각 구간(phase)별로 다른 간격으로 캡처 수행
+
+        Returns:
+            dict: 세션 통계 (stats() 참고)
+        """
+        self.is_capturing = True
+        shared = self.cameras[0]['spec']
+        writer = None
+        sync_file = None
+        try:
+            # 카메라별 준비 (버퍼 풀은 공유 저장 큐를 카메라 수로 나눈 만큼)
+            pool_size = shared['writer_queue_size'] // len(self.cameras) + shared['writer_workers'] + 1
+            for camera in self.cameras:
+                self._prepare_camera(camera, pool_size)
+
+            # 저장 형식, 선택한 형식이 스케줄을 따라갈 수 있는지 측정 (memmap은 인코딩 없음)
+            mode = shared['output_mode']
+            if mode != 'memmap':
+                self.codec = OutputCodec(shared['output_format'], shared['output_level'])
+                if shared['codec_benchmark']:
+                    self._benchmark_codecs(shared)
+
+            # 용량 계획: 구간별 캡처 수, 필요한 저장 속도/공간을 측정한 인코더/디스크 속도와 비교
+            # (여러 카메라면 첫 번째 카메라 설정 기준으로 카메라 수만큼)
+            if shared['capacity_check'] != 'off' or shared['reserve_space']:
+                self.plan = plan_session(shared, cameras=len(self.cameras), codec_report=self.codec_report,
+                                         measure=shared['capacity_check'] != 'off', frame_rate=self._frame_rate())
+            if shared['capacity_check'] != 'off':
+                print("Capacity plan:")
+                print(format_plan(self.plan))
+                if not self.plan['feasible'] and shared['capacity_check'] == 'strict':
+                    raise RuntimeError(f"Session is not feasible: {'; '.join(self.plan['problems'])}")
+
+            # 세션 크기만큼 디스크 공간 확보 (memmap은 배열 파일 자체를 확보)
+            if shared['reserve_space'] and mode != 'memmap':
+                self.reservation = SpaceReservation(self.cameras[0]['version_path'], self.plan['total_bytes'])
+                print(f"Reserved {self.reservation.size / 1e6:.1f} MB in {self.reservation.path}")
+
+            # 컨테이너 저장: 버전 폴더마다 파일 하나, 프레임 이름은 파일로 저장할 때와 같음
+            if mode == 'container':
+                self.container = ContainerSet(self.codec)
+                for camera in self.cameras:
+                    self.container.open(camera['version_path'])
+
+            # 비동기 저장 풀 시작 (인코딩/쓰기가 캡처 루프를 막지 않도록), memmap은 캡처 루프에서 바로 복사
+            if mode != 'memmap':
+                writer = CaptureWriter(num_workers=shared['writer_workers'], max_queue=shared['writer_queue_size'], overflow=shared['writer_overflow'],
+                                       spill_dir=os.path.join(self.cameras[0]['version_path'], '_spill'), codec=self.container or self.codec)
+                writer.start()
+                self.writer = writer
+
+            # 버스트 구간 스테이징: 구간 안 캡처는 메모리 칸에 두고 구간 밖/세션 종료 후 저장 풀로
+            # (동시 캡처면 첫 번째 카메라 타이밍, 아니면 카메라별 타이밍의 버스트 구간)
+            if mode != 'memmap' and any(self._burst_phases(camera) for camera in self.cameras):
+                # 칸 수는 카메라별 버스트 구간 캡처 수 (예산 burst_memory_mb 이내)
+                windows = []
+                for camera in ([self.cameras[0]] if self.sync else self.cameras):
+                    windows += burst_windows(camera['spec']['start_delay'], camera['spec']['cap_time'], self._burst_phases(camera))
+                shapes = {i: (c['spec']['crop']['height'], c['spec']['crop']['width'], 3) for i, c in enumerate(self.cameras)}
+                max_frames = {}
+                for i, camera in enumerate(self.cameras):
+                    timing = (self.cameras[0] if self.sync else camera)['spec']
+                    phases = phase_counts(timing['start_delay'], timing['cap_time'], self._frame_rate(), timing['dedupe_frames'])
+                    max_frames[i] = sum(p['captures'] for p in phases if p['phase'] in self._burst_phases(camera))
+                self.burst = BurstStage(shapes, shared['burst_memory_mb'] * 1e6, windows=windows, tmp_dir=shared['burst_dir'], max_frames=max_frames)
+                print(f"Burst staging: phases {', '.join(str(i + 1) for i in self._burst_phases(self.cameras[0]))} held in "
+                      f"{shared['burst_dir'] or 'memory'} ({self.burst.nbytes / 1e6:.1f} MB of {shared['burst_memory_mb']} MB budget, "
+                      f"{', '.join(str(n) for n in self.burst.capacity.values())} frame slots per camera)")
+
+            if self.sync:
+                # 동시 캡처: 첫 번째 카메라 타이밍 하나로 모든 카메라 캡처, 프레임 쌍 기록 파일 생성
+                deadlines = compile_deadlines(shared['start_delay'], shared['cap_time'])
+                self.sync_path = os.path.join(self.cameras[0]['version_path'], self.SYNC_RECORD)
+                sync_file = open(self.sync_path, 'w', newline='')
+                sync_writer = csv.writer(sync_file)
+                header = ['index', 'phase', 'scheduled_s']
+                for camera in self.cameras:
+                    camera_id = camera['source'].camera_id
+                    header += [f'cam{camera_id}_seq', f'cam{camera_id}_time_s', f'cam{camera_id}_path']
+                sync_writer.writerow(header + ['skew_ms'])
+            else:
+                # 캡처 구간 설정을 deadline 목록으로 변환 (세션 시작 기준, monotonic ns), 카메라 번호를 key로 합침
+                deadlines = sorted(
+                    (offset_ns, phase, i)
+                    for i, camera in enumerate(self.cameras)
+                    for offset_ns, phase in compile_deadlines(camera['spec']['start_delay'], camera['spec']['cap_time'])
+                )
+            if mode == 'memmap':
+                self._allocate_arrays(deadlines)
+            scheduler = DeadlineScheduler(deadlines, policy=shared['missed_deadline_policy'])
+            self.scheduler = scheduler
+            print(f"Scheduled {scheduler.total} {'synchronized ' if self.sync else ''}captures on {len(self.cameras)} camera(s) "
+                  f"(missed-deadline policy: {scheduler.policy})")
+
+            # 캡처 시작 시간 기록
+            scheduler.start()
+            if self.burst:
+                self.burst.start(writer, scheduler.t0_ns)
+
+            # 캡처 반복문: 다음 deadline까지 sleep 후 캡처
+            while True:
+                tick = scheduler.wait_next(lambda: self.is_capturing)
+                if tick is None:
+                    break
+                if not self.sync:
+                    self._capture(self.cameras[tick['key']], tick)
+                    continue
+
+                # 모든 카메라에서 같은 예정 시각의 프레임 선택 후 쌍 기록 (바로 기록해서 세션 중에도 읽을 수 있게)
+                picks = [self._capture(camera, tick) for camera in self.cameras]
+                row = [tick['index'], tick['phase'], f"{tick['scheduled_ns'] / 1e9:.6f}"]
+                for pick in picks:
+                    row += [pick[0], f"{(pick[1] - scheduler.t0_ns) / 1e9:.6f}", pick[2]] if pick else ['', '', '']
+                skew_ns = None
+                if all(picks):
+                    times = [pick[1] for pick in picks]
+                    skew_ns = max(times) - min(times)
+                    self.skews.append(skew_ns)
+                sync_writer.writerow(row + [f"{skew_ns / 1e6:.3f}" if skew_ns is not None else ''])
+                sync_file.flush()
+        except Exception as e:
+            self.error = e
+            print(f"An error occurred during capture: {e}")
+        finally:
+            # 남은 프레임 모두 저장될 때까지 대기 (스테이징한 프레임도 저장 풀로 넘긴 뒤)
+            if self.burst:
+                self.burst.flush(writer)
+            if writer:
+                writer.close()
+            if self.burst:
+                self.burst.close()
+            if self.container:
+                self.container.close()
+            if self.reservation:
+                self.reservation.close()
+            for camera in self.cameras:
+                if camera['array'] is not None:
+                    camera['array'].close()
+                if camera['manifest'] is not None:
+                    camera['manifest'].close()
+                if camera['roi_stats'] is not None:
+                    camera['roi_stats'].close()
+            if sync_file:
+                sync_file.close()
+            self.is_capturing = False
+
+            # 센서 측 crop 중이었으면 전체 프레임 파이프라인으로 복귀
+            for camera in self.cameras:
+                source = camera['source']
+                if source.roi is not None and source.running:
+                    source.restart(roi=None)
+
+            self.print_stats()
+            # 캡처 종료
+            print("---------- Capture End ----------")
+            if self.on_finished:
+                self.on_finished(self)
+        return self.stats()
+
+    def _burst_phases(self, camera):
+        """카메라의 버스트 구간 번호 (동시 캡처면 첫 번째 카메라 설정)"""
+        return (self.cameras[0] if self.sync else camera)['spec']['burst_phases']
+
+    def _capture(self, camera, tick):
+        """
+        deadline 하나 처리: 프레임 선택, ROI 복사, 저장 큐에 넣기
+        매니페스트 줄은 저장이 끝나면(저장 워커에서) 크기/체크섬과 함께 기록
+
+        every_frame 구간이면 구간 시작 이후 아직 저장하지 않은 프레임을 모두 저장
+
+        Returns:
+            tuple: (프레임 번호, 촬영 시각 ns, 파일명), 프레임이 없거나 덮어써졌으면 None
+                   (every_frame 구간이면 마지막으로 저장한 프레임)
+        """
+        frame_buffer = camera['source'].frame_buffer
+        scheduler = self.scheduler
+        timing = (self.cameras[0] if self.sync else camera)['spec']
+        period_ns = frame_buffer.frame_period_ns() or 50_000_000
+        target_ns = scheduler.t0_ns + tick['scheduled_ns']
+
+        if timing['cap_time'][tick['phase']].get('every_frame'):
+            # 구간 시작부터 지금까지(구간 끝 이내) 이미 들어온 새 프레임 모두 저장, 아직 안 들어온 프레임은 다음 deadline에서
+            # (스케줄러를 막지 않도록 기다리지 않음, 이미 저장한 프레임 번호 이하는 건너뜀, 링 버퍼에서 밀려난 프레임은 저장 못 함)
+            phase_data = timing['cap_time'][tick['phase']]
+            phase_start = timing['cap_time'][tick['phase'] - 1]['end_point'] if tick['phase'] else timing['start_delay']
+            end_ns = min(scheduler.clock(), scheduler.t0_ns + round(phase_data['end_point'] * 1e9))
+            last_seq = camera['last'][0] if camera['last'] else -1
+            pick = None
+            for slot, frame_seq, frame_ts_ns in frame_buffer.between(scheduler.t0_ns + round(phase_start * 1e9), end_ns):
+                if frame_seq > last_seq:
+                    pick = self._save(camera, tick, slot, frame_seq, frame_ts_ns, frame_ts_ns - target_ns) or pick
+            return pick
+
+        # 예정 시각에 촬영 시각이 가장 가까운 프레임 선택
+        # (예정 시각 이후 프레임이 아직 없으면 최대 1.5 프레임 주기만큼 대기, 단 다음 deadline을 늦추지 않도록
+        #  다음 deadline까지 남은 시간까지만: 간격이 프레임 주기보다 짧으면 이미 들어온 프레임에서 고름)
+        # (링 버퍼 전체에서 찾으므로 늦게 처리된 deadline도 그 시점 프레임 사용)
+        timeout_ns = min(1.5 * period_ns, 200_000_000)
+        next_ns = scheduler.next_deadline_ns()
+        if next_ns is not None:
+            timeout_ns = max(0, min(timeout_ns, next_ns - scheduler.clock()))
+        picked = frame_buffer.nearest(target_ns, timeout=timeout_ns / 1e9)
+
+        # 프레임이 없으면 이번 캡처 건너뜀
+        if picked is None:
+            return None
+        slot, frame_seq, frame_ts_ns = picked
+        residual_ns = frame_ts_ns - target_ns
+        camera['residuals'].append(residual_ns)
+
+        # triggered 구간: 색 변화가 없으면 sparse 간격이 될 때까지 저장하지 않음
+        extra = None
+        if timing['cap_time'][tick['phase']].get('triggered'):
+            decision = self._trigger(camera, tick, slot, frame_seq, frame_ts_ns)
+            if decision is None:
+                return None
+            save, rate, dense = decision
+            if not save:
+                return None
+            extra = {'trigger_rate': rate, 'dense': dense}
+        last = camera['last']
+        picked = self._save(camera, tick, slot, frame_seq, frame_ts_ns, residual_ns, extra)
+        # 실제로 저장했을 때만 sparse 간격 기준 시각 갱신 (중복/변화 없음이면 camera['last']가 그대로)
+        if extra and camera['trigger'] is not None and camera['last'] is not last:
+            camera['trigger'].mark_saved(frame_ts_ns)
+        return picked
+
+    def _trigger(self, camera, tick, slot, frame_seq, frame_ts_ns):
+        """
+        triggered 구간 저장 여부 (동시 캡처면 첫 번째 카메라의 판단을 같은 deadline의 다른 카메라도 사용)
+
+        Returns:
+            tuple: (저장 여부, 변화 속도, dense 여부), ROI를 읽지 못했으면 None
+        """
+        if self.sync and camera is not self.cameras[0]:
+            if self._trigger_tick is None or self._trigger_tick[0] != tick['index']:
+                return None
+            return self._trigger_tick[1:]
+        trigger = camera['trigger']
+        roi = camera['source'].frame_buffer.read(slot, frame_seq, region=camera['roi'], out=camera['trigger_buf'])
+        if roi is None:
+            return None
+        dense = trigger.dense
+        save, rate = trigger.check(roi, frame_ts_ns)
+        if trigger.dense != dense:
+            print(f"Camera {camera['source'].camera_id} trigger: {'dense' if trigger.dense else 'sparse'} capture "
+                  f"(colour change {rate:.2f}/s, threshold {trigger.threshold})")
+        self._trigger_tick = (tick['index'], save, rate, trigger.dense)
+        return save, rate, trigger.dense
+
+    def _save(self, camera, tick, slot, frame_seq, frame_ts_ns, residual_ns, extra=None):
+        """
+        고른 프레임 저장: ROI 복사 후 배열/스테이징 칸/저장 큐로
+
+        직전에 저장한 프레임과 같은 프레임(프레임 번호가 같음)이면 다시 저장하지 않고
+        매니페스트에 'duplicate'로 기록 (path는 처음 저장한 위치)
+        변화 감지를 켰으면 ROI 복사 후 마지막 저장 프레임과 비교해서 변화가 없으면 'unchanged'로 기록만
+
+        Args:
+            extra (dict): 매니페스트 줄에 더할 항목 (triggered 구간의 변화 속도 등)
+
+        Returns:
+            tuple: (프레임 번호, 촬영 시각 ns, 파일명), 덮어써졌으면 None
+        """
+        frame_buffer = camera['source'].frame_buffer
+        scheduler = self.scheduler
+
+        # elapsed_time은 시작 시점부터 프레임 촬영 시점까지의 경과 시간
+        # (시작 직후 deadline은 시작 전에 찍힌 프레임을 고를 수 있으므로 파일명은 0 이상으로)
+        elapsed_time = max(0.0, (frame_ts_ns - scheduler.t0_ns) / 1e9)
+
+        # 매니페스트 줄 (순번은 매니페스트에 기록하는 캡처마다 증가)
+        crop = camera['spec']['crop']
+        manifest = camera['manifest']
+        seq = camera['seq']
+        row = {'seq': seq, 'frame_seq': frame_seq, 'phase': tick['phase'], 'scheduled_ns': tick['scheduled_ns'],
+               'timestamp_ns': frame_ts_ns - scheduler.t0_ns, 'roi': [crop['xmin'], crop['ymin'], crop['width'], crop['height']],
+               'path': None, 'bytes': None, 'checksum': None, 'status': None, 'staged': False}
+        if extra:
+            row.update(extra)
+
+        # 같은 프레임 중복 저장 방지 (간격이 프레임 주기보다 짧으면 같은 프레임이 다시 골라짐)
+        if camera['spec']['dedupe_frames'] and camera['last'] and camera['last'][0] == frame_seq:
+            _, last_filename, last_path = camera['last']
+            camera['seq'] += 1
+            camera['duplicates'] += 1
+            manifest.append(dict(row, path=last_path, status='duplicate'))
+            print(f"Frame #{frame_seq} already saved as {last_filename}, skipped (Scheduled: {tick['scheduled_ns'] / 1e9:.2f}s) in Phase {tick['phase']+1}")
+            return frame_seq, frame_ts_ns, last_filename
+
+        # 'memmap' 저장: 링 버퍼에서 배열의 k번째 칸으로 ROI만 바로 복사 (인코딩/파일 생성 없음)
+        array = camera['array']
+        if array is not None:
+            k = self._slots[tick['index']]
+            if frame_buffer.read(slot, frame_seq, region=camera['roi'], out=array.slot(k)) is None:
+                print(f"Frame #{frame_seq} was overwritten before it could be copied, skipped")
+                return None
+            if self._unchanged(camera, array.slot(k), row, tick):
+                return frame_seq, frame_ts_ns, camera['last'][1]  # 칸은 저장 안 된 것으로 남김 (written = 0)
+            self._record_stats(camera, array.slot(k), row)
+            array.commit(k, tick['scheduled_ns'], frame_ts_ns - scheduler.t0_ns, frame_seq, tick['phase'])
+            camera['seq'] += 1
+            manifest.append(dict(row, path=f"{FRAMES_NAME}[{k}]", bytes=array.slot(k).nbytes, checksum=checksum(array.slot(k)), status='saved'))
+            filename = f"{os.path.join(camera['version_path'], FRAMES_NAME)}[{k}]"
+            camera['last'] = (frame_seq, filename, f"{FRAMES_NAME}[{k}]")
+            print(f"Captured {filename} (Scheduled: {tick['scheduled_ns'] / 1e9:.2f}s, jitter {tick['jitter_ns'] / 1e6:+.2f}ms, "
+                  f"frame #{frame_seq} residual {residual_ns / 1e6:+.2f}ms) in Phase {tick['phase']+1}")
+            return frame_seq, frame_ts_ns, filename
+
+        # 파일명 생성 (순번_경과시간.png, 같은 10ms 안에 캡처해도 겹치지 않게 순번을 붙임)
+        name = f"{seq:06d}_{elapsed_time:.3f}{self.codec.ext}"
+        filename = os.path.join(camera['version_path'], name)
+        row['path'] = f"{CONTAINER_NAME}[{name}]" if self.container else name
+
+        # 버스트 구간: 스테이징 칸으로 ROI만 복사해 두고 저장은 구간이 끝난 뒤 (칸이 모두 찼으면 바로 저장 큐로)
+        if self.burst and tick['phase'] in self._burst_phases(camera):
+            key = self.cameras.index(camera)
+            staged = self.burst.acquire(key)
+            if staged is not None:
+                k, stage_buf = staged
+                if frame_buffer.read(slot, frame_seq, region=camera['roi'], out=stage_buf) is None:
+                    self.burst.release(key, k)
+                    print(f"Frame #{frame_seq} was overwritten before it could be copied, skipped")
+                    return None
+                if self._unchanged(camera, stage_buf, row, tick):
+                    self.burst.release(key, k)
+                    return frame_seq, frame_ts_ns, camera['last'][1]
+                self._record_stats(camera, stage_buf, row)
+                row['staged'] = True
+                self.burst.stage(key, k, filename, frame_ts_ns, on_saved=lambda result: manifest.append(dict(row, **result)))
+                camera['seq'] += 1
+                camera['last'] = (frame_seq, filename, row['path'])
+                if self.reservation:
+                    self.reservation.release(self.plan['bytes_per_frame'])
+                print(f"Staged {filename} (Scheduled: {tick['scheduled_ns'] / 1e9:.2f}s, jitter {tick['jitter_ns'] / 1e6:+.2f}ms, "
+                      f"frame #{frame_seq} residual {residual_ns / 1e6:+.2f}ms) in Phase {tick['phase']+1} [staged {self.burst.pending}]")
+                return frame_seq, frame_ts_ns, filename
+
+        # ROI 영역만 재사용 버퍼로 복사 (전체 프레임은 복사하지 않음)
+        # 복사 중 프레임 읽기 스레드가 슬롯을 덮어썼으면 건너뜀
+        roi_pool = camera['pool']
+        roi_buf = roi_pool.acquire()
+        save_frame = frame_buffer.read(slot, frame_seq, region=camera['roi'], out=roi_buf)
+        if save_frame is None:
+            roi_pool.release(roi_buf)
+            print(f"Frame #{frame_seq} was overwritten before it could be copied, skipped")
+            return None
+        if self._unchanged(camera, save_frame, row, tick):
+            roi_pool.release(roi_buf)
+            return frame_seq, frame_ts_ns, camera['last'][1]
+        self._record_stats(camera, save_frame, row)
+
+        # 저장 큐에 넣기 (인코딩/쓰기는 워커 스레드에서, 끝나면 버퍼 반납)
+        self.writer.submit(filename, save_frame, on_done=roi_pool.release, timestamp_ns=frame_ts_ns,
+                           on_saved=lambda result: manifest.append(dict(row, **result)))
+        camera['seq'] += 1
+        camera['last'] = (frame_seq, filename, row['path'])
+        if self.reservation:
+            self.reservation.release(self.plan['bytes_per_frame'])  # 저장할 프레임만큼 확보한 공간 반납
+        print(f"Captured {filename} (Scheduled: {tick['scheduled_ns'] / 1e9:.2f}s, jitter {tick['jitter_ns'] / 1e6:+.2f}ms, "
+              f"frame #{frame_seq} residual {residual_ns / 1e6:+.2f}ms) in Phase {tick['phase']+1} [queue {self.writer.queue_depth}]")
+        return frame_seq, frame_ts_ns, filename
+
+    def _unchanged(self, camera, frame, row, tick):
+        """
+        변화 감지: 마지막으로 저장한 프레임과 비교해서 변화가 없으면 매니페스트에 'unchanged' 기록
+
+        row에 변화량 점수('change') 추가
+
+        Returns:
+            bool: 저장하지 않을 프레임이면 True
+        """
+        gate = camera['gate']
+        if gate is None:
+            return False
+        changed, score = gate.check(frame, row['timestamp_ns'])
+        row['change'] = score
+        if changed:
+            return False
+        camera['seq'] += 1
+        camera['unchanged'] += 1
+        camera['manifest'].append(dict(row, path=camera['last'][2], status='unchanged'))
+        print(f"Frame #{row['frame_seq']} unchanged ({gate.method} {score:.3f} < {gate.threshold}), not saved "
+              f"(Scheduled: {tick['scheduled_ns'] / 1e9:.2f}s) in Phase {tick['phase']+1}")
+        return True
+
+    def _record_stats(self, camera, frame, row):
+        """
+        저장할 ROI의 색 통계 기록 (인코딩 전, 저장 큐/스테이징 칸에 넘기기 전)
+        """
+        if camera['roi_stats'] is not None:
+            camera['roi_stats'].append(row['seq'], row['timestamp_ns'], frame)
+
+    def stats(self):
+        """
+        세션 통계
+
+        Returns:
+            dict: 'cameras'(카메라별 'camera_id', 'version_path', 'output'(컨테이너/배열 파일, 캡처마다 파일이면 None), 'manifest'(매니페스트 파일), 'duplicates'(같은 프레임이라 저장하지 않은 캡처 수), 'unchanged'(변화가 없어 저장하지 않은 캡처 수), 'trigger'(dense/sparse 전환 횟수, 마지막 변화 속도), 'roi_stats'(색 통계 파일, 없으면 None), 'residual'(촬영 시각 - 예정 시각 |r| 평균/최대 ms)),
+                  'writer'(CaptureWriter.stats), 'scheduler'(DeadlineScheduler.stats),
+                  'sync'(sync 모드: 기록 파일, 쌍 수, 카메라 간 skew 평균/p50/p95/최대 ms, 없으면 None),
+                  'codec'(저장 형식 이름, 시작 전 형식별 속도 측정 결과), 'plan'(용량 계획, 없으면 None),
+                  'burst'(버스트 스테이징 통계, 없으면 None), 'error'
+        """
+        cameras = []
+        for camera in self.cameras:
+            abs_residuals = sorted(abs(r) for r in camera['residuals'])
+            cameras.append({
+                'camera_id': camera['source'].camera_id,
+                'version_path': camera['version_path'],
+                'output': (os.path.join(camera['version_path'], CONTAINER_NAME) if self.container else
+                           os.path.join(camera['version_path'], FRAMES_NAME) if camera['array'] is not None else None),
+                'manifest': camera['manifest'].path if camera['manifest'] else None,
+                'duplicates': camera['duplicates'],
+                'unchanged': camera['unchanged'],
+                'trigger': {'switches': camera['trigger'].switches, 'rate': camera['trigger'].rate} if camera['trigger'] else None,
+                'roi_stats': os.path.join(camera['version_path'], STATS_NAME) if camera['roi_stats'] else None,
+                'residual': {
+                    'count': len(abs_residuals),
+                    'mean_abs_ms': sum(abs_residuals) / len(abs_residuals) / 1e6 if abs_residuals else 0.0,
+                    'max_abs_ms': abs_residuals[-1] / 1e6 if abs_residuals else 0.0,
+                },
+            })
+        sync = None
+        if self.sync:
+            skews = sorted(self.skews)
+            count = len(skews)
+            sync = {
+                'path': self.sync_path,
+                'pairs': count,
+                'mean_skew_ms': sum(skews) / count / 1e6 if count else 0.0,
+                'p50_skew_ms': skews[count // 2] / 1e6 if count else 0.0,
+                'p95_skew_ms': skews[min(count - 1, int(count * 0.95))] / 1e6 if count else 0.0,
+                'max_skew_ms': skews[-1] / 1e6 if count else 0.0,
+            }
+        return {
+            'cameras': cameras,
+            'sync': sync,
+            'writer': self.writer.stats() if self.writer else None,
+            'scheduler': self.scheduler.stats() if self.scheduler else None,
+            'codec': {'format': self.codec.name, 'benchmark': self.codec_report} if self.codec else None,
+            'plan': self.plan,
+            'burst': self.burst.stats() if self.burst else None,
+            'error': str(self.error) if self.error else None,
+        }
+
+    def print_stats(self):
+        """
+        저장/스케줄/프레임 선택 통계 출력
+        """
+        stats = self.stats()
+        if stats['writer']:
+            s = stats['writer']
+            print(f"Writer ({stats['codec']['format']}): {s['written']} written, {s['dropped']} dropped, {s['spilled']} spilled, {s['errors']} errors, "
+                  f"max queue {s['max_queue_depth']}, encode {s['mean_latency_ms']:.1f}ms avg / {s['max_latency_ms']:.1f}ms max")
+        if stats['burst']:
+            s = stats['burst']
+            print(f"Burst: {s['staged']} staged, {s['overflowed']} over budget (saved directly), max {s['max_used']} slots used")
+        if stats['scheduler']:
+            s = stats['scheduler']
+            print(f"Scheduler: {s['fired']}/{s['total']} fired, {s['skipped']} skipped, {s['reanchored']} re-anchored, "
+                  f"jitter {s['mean_jitter_ms']:.2f}ms avg / {s['p95_jitter_ms']:.2f}ms p95 / {s['max_jitter_ms']:.2f}ms max")
+        for camera in stats['cameras']:
+            s = camera['residual']
+            duplicates = f", {camera['duplicates']} duplicate frames not saved again" if camera['duplicates'] else ''
+            duplicates += f", {camera['unchanged']} unchanged frames not saved" if camera['unchanged'] else ''
+            if s['count']:
+                print(f"Camera {camera['camera_id']} frame residual: {s['mean_abs_ms']:.2f}ms avg |r|, {s['max_abs_ms']:.2f}ms max |r|{duplicates}")
+        if stats['sync']:
+            s = stats['sync']
+            print(f"Sync: {s['pairs']} pairs in {s['path']}, skew {s['mean_skew_ms']:.2f}ms avg / {s['p50_skew_ms']:.2f}ms p50 / "
+                  f"{s['p95_skew_ms']:.2f}ms p95 / {s['max_skew_ms']:.2f}ms max")
+
+
+def save_buffered_frames(frame_buffer, trigger_ns, seconds_before, seconds_after, crop, save_path, writer_workers=2, writer_queue_size=32, codec=None):
+    """
+    트리거 시점 전후 프레임 저장 (링 버퍼에서)
+
+    트리거 기준 seconds_before초 전부터 seconds_after초 후까지의 프레임을
+    save_path에 저장, 파일명은 트리거 기준 상대 시간 (예: -1.250.png)
+    트리거 이후 구간이 있으면 해당 프레임이 들어올 때까지 대기
+
+    Args:
+        frame_buffer (FrameRingBuffer): 프레임 링 버퍼
+        trigger_ns (int): 트리거 시각 (monotonic ns)
+        seconds_before (float): 트리거 이전 저장 구간 (초)
+        seconds_after (float): 트리거 이후 저장 구간 (초)
+        crop (tuple): (xmin, ymin, width, height), None이면 전체 프레임 저장
+        save_path (str): 저장 폴더
+        codec (OutputCodec): 저장 형식, None이면 PNG
+
+    Returns:
+        int: 저장한 프레임 수
+    """
+    start_ns = trigger_ns - round(seconds_before * 1e9)
+    end_ns = trigger_ns + round(seconds_after * 1e9)
+
+    # 트리거 이후 구간 프레임이 들어올 때까지 대기
+    if seconds_after > 0:
+        frame_buffer.wait_until(end_ns, timeout=seconds_after + 1.0)
+
+    frames = frame_buffer.between(start_ns, end_ns)
+    if not frames:
+        return 0
+
+    codec = codec or OutputCodec()
+    os.makedirs(save_path, exist_ok=True)
+    writer = CaptureWriter(num_workers=writer_workers, max_queue=writer_queue_size, codec=codec)
+    writer.start()
+    saved = 0
+    for slot, frame_seq, frame_ts_ns in frames:
+        frame = frame_buffer.read(slot, frame_seq, region=crop)
+        if frame is None:
+            continue # 이미 덮어써진 프레임
+        writer.submit(os.path.join(save_path, f"{(frame_ts_ns - trigger_ns) / 1e9:+.3f}{codec.ext}"), frame)
+        saved += 1
+    writer.close()
+    return saved
@@ -0,0 +1,216 @@
+import time
+
+NS_PER_SEC = 1_000_000_000
+DEFAULT_FRAME_RATE = 21  # 카메라 기본 fps (gst_pipeline framerate), every_frame 구간 캡처 수 추정용
+
+
+def phase_rate(phase_data, frame_rate=None):
+    """
+    구간의 초당 캡처 수
+
+    every_frame 구간은 새 프레임마다 저장하므로 카메라 fps, 아니면 1 / interval
+
+    Args:
+        phase_data (dict): 캡처 구간 설정 {'end_point', 'interval', 'every_frame'(선택)}
+        frame_rate (float): 카메라 fps, None이면 DEFAULT_FRAME_RATE
+    """
+    if phase_data.get('every_frame'):
+        return frame_rate or DEFAULT_FRAME_RATE
+    return 1.0 / phase_data['interval']
+
+
+def compile_deadlines(start_delay, cap_time):
+    """
+    캡처 구간 설정을 절대 deadline 목록으로 변환
+
+    각 구간은 [시작, 종료) 범위에서 interval 간격으로 캡처,
+    마지막 구간만 종료 시점 포함 [시작, 종료]
+    every_frame 구간은 interval 간격으로 그동안 들어온 새 프레임을 모두 저장하므로
+    구간 끝의 프레임까지 모으도록 종료 시점 포함
+    누적 오차가 없도록 정수 ns 단위로 start + k * interval 계산
+
+    Args:
+        start_delay (float): 캡처 시작 전 대기 시간 (초)
+        cap_time (list): [{'end_point': float, 'interval': float, 'every_frame': bool(선택)}, ...]
+
+    Returns:
+        list: [(세션 시작 기준 offset_ns, phase_index), ...] 시간순
+    """
+    deadlines = []
+    start_ns = round(start_delay * NS_PER_SEC)
+    num_phases = len(cap_time)
+
+    for i, phase_data in enumerate(cap_time):
+        end_ns = round(phase_data['end_point'] * NS_PER_SEC)
+        interval_ns = round(phase_data['interval'] * NS_PER_SEC)
+        include_end = (i == num_phases - 1) or phase_data.get('every_frame', False)
+
+        if interval_ns > 0:
+            k = 0
+            while True:
+                t = start_ns + k * interval_ns
+                if t > end_ns or (t == end_ns and not include_end):
+                    break
+                deadlines.append((t, i))
+                k += 1
+        start_ns = end_ns
+
+    return deadlines
+
+
+class DeadlineScheduler:
+    """
+    monotonic 시계 기반 deadline 스케줄러
+
+    미리 계산된 deadline까지 sleep 후 깨어나 캡처 시점을 알려줌 (polling 없음)
+    deadline을 놓쳤을 때 정책 선택 가능
+    - 'catchup': 놓친 deadline을 모두 순서대로 바로 실행
+    - 'skip': 이미 지난 deadline들은 건너뛰고 가장 최근 것 하나만 실행
+    - 'reanchor': 늦어진 만큼 이후 모든 deadline을 뒤로 밀어 간격 유지
+
+    여러 카메라의 deadline을 합쳐서 하나의 스케줄러로 돌릴 때는
+    (offset_ns, phase_index, key) 형식으로 카메라 key를 붙임
+    'skip'은 같은 key의 다음 deadline이 이미 지났을 때만 건너뜀
+    """
+    MISSED_POLICIES = ('catchup', 'skip', 'reanchor')
+
+    def __init__(self, deadlines, policy='catchup', reanchor_tolerance=0.01, max_sleep=0.05, clock=time.monotonic_ns):
+        """
+        Args:
+            deadlines (list): compile_deadlines() 결과, 또는 key를 붙인 (offset_ns, phase_index, key) 목록 (시간순)
+            policy (str): deadline 놓쳤을 때 정책 ('catchup', 'skip', 'reanchor')
+            reanchor_tolerance (float): 'reanchor'에서 이 시간(초) 이상 늦으면 재기준
+            max_sleep (float): 한 번에 sleep할 최대 시간 (초), 정지 요청 확인 주기
+            clock: ns 단위 monotonic 시계 함수
+        """
+        if policy not in self.MISSED_POLICIES:
+            raise ValueError(f"Unknown missed-deadline policy: {policy}")
+        self.deadlines = deadlines
+        self.policy = policy
+        self.reanchor_tolerance_ns = round(reanchor_tolerance * NS_PER_SEC)
+        self.max_sleep = max_sleep
+        self.clock = clock
+
+        # 같은 key의 다음 deadline 인덱스 ('skip' 정책용)
+        self._next_same = [len(deadlines)] * len(deadlines)
+        last_seen = {}
+        for i in range(len(deadlines) - 1, -1, -1):
+            key = self._key(deadlines[i])
+            self._next_same[i] = last_seen.get(key, len(deadlines))
+            last_seen[key] = i
+
+        self.t0_ns = None  # 세션 시작 시각 (monotonic ns)
+        self._index = 0  # 다음 deadline 인덱스
+        self._shift_ns = 0  # 'reanchor'로 밀린 누적 시간
+
+        # 통계
+        self._jitters = []  # 각 캡처의 (실제 - 예정) ns
+        self._skipped = 0
+        self._reanchored = 0
+
+    def start(self, t0_ns=None):
+        """
+        스케줄 시작 시각 설정
+
+        Args:
+            t0_ns (int): 세션 시작 시각 (monotonic ns), 없으면 현재 시각
+        """
+        self.t0_ns = self.clock() if t0_ns is None else t0_ns
+
+    @staticmethod
+    def _key(deadline):
+        return deadline[2] if len(deadline) > 2 else None
+
+    @property
+    def total(self):
+        """전체 deadline 수"""
+        return len(self.deadlines)
+
+    def next_deadline_ns(self):
+        """
+        아직 처리하지 않은 다음 deadline 시각 (monotonic ns), 없거나 시작 전이면 None
+        """
+        if self.t0_ns is None or self._index >= len(self.deadlines):
+            return None
+        return self.t0_ns + self.deadlines[self._index][0] + self._shift_ns
+
+    def wait_next(self, should_continue=lambda: True):
+        """
+        다음 deadline까지 대기 후 캡처 정보 반환
+
+        Args:
+            should_continue: False를 반환하면 대기 중단
+
+        Returns:
+            dict: 'index', 'phase', 'key', 'scheduled_ns'(세션 기준), 'actual_ns'(세션 기준), 'jitter_ns'
+            None: 모든 deadline 완료 또는 중단
+        """
+        if self.t0_ns is None:
+            self.start()
+
+        while self._index < len(self.deadlines):
+            offset_ns, phase = self.deadlines[self._index][:2]
+            deadline_ns = self.t0_ns + offset_ns + self._shift_ns
+
+            # deadline까지 sleep (정지 요청 확인을 위해 max_sleep 단위로 끊어서)
+            while True:
+                if not should_continue():
+                    return None
+                remaining = deadline_ns - self.clock()
+                if remaining <= 0:
+                    break
+                time.sleep(min(remaining / NS_PER_SEC, self.max_sleep))
+
+            now_ns = self.clock()
+            late_ns = now_ns - deadline_ns
+
+            if self.policy == 'skip':
+                # (같은 key의) 다음 deadline도 이미 지났으면 현재 것은 건너뜀
+                next_index = self._next_same[self._index]
+                if next_index < len(self.deadlines) and self.t0_ns + self.deadlines[next_index][0] + self._shift_ns <= now_ns:
+                    self._index += 1
+                    self._skipped += 1
+                    continue
+            elif self.policy == 'reanchor' and late_ns > self.reanchor_tolerance_ns:
+                # 늦어진 만큼 이후 deadline 모두 뒤로 이동
+                self._shift_ns += late_ns
+                deadline_ns += late_ns
+                self._reanchored += 1
+
+            self._index += 1
+            jitter_ns = now_ns - deadline_ns
+            self._jitters.append(jitter_ns)
+            return {
+                'index': self._index - 1,
+                'phase': phase,
+                'key': self._key(self.deadlines[self._index - 1]),
+                'scheduled_ns': deadline_ns - self.t0_ns,
+                'actual_ns': now_ns - self.t0_ns,
+                'jitter_ns': jitter_ns,
+            }
+        return None
+
+    def stats(self):
+        """
+        스케줄링 통계 반환
+
+        Returns:
+            dict: 캡처 수, 건너뛴 수, 재기준 횟수, jitter 평균/p95/최대 (ms)
+        """
+        jitters = sorted(self._jitters)
+        count = len(jitters)
+        if count:
+            mean_ms = sum(jitters) / count / 1e6
+            p95_ms = jitters[min(count - 1, int(count * 0.95))] / 1e6
+            max_ms = jitters[-1] / 1e6
+        else:
+            mean_ms = p95_ms = max_ms = 0.0
+        return {
+            'fired': count,
+            'total': len(self.deadlines),
+            'skipped': self._skipped,
+            'reanchored': self._reanchored,
+            'mean_jitter_ms': mean_ms,
+            'p95_jitter_ms': p95_ms,
+            'max_jitter_ms': max_ms,
+        }
@@ -0,0 +1,279 @@
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+class CaptureWriter:
+    """
+    캡처 프레임 비동기 저장 풀
+
+    캡처 루프는 프레임을 큐에 넣기만 하고,
+    인코딩 + 디스크 쓰기는 워커 스레드들이 처리 (저장 형식은 codec, 기본 PNG)
+    큐가 가득 찼을 때의 동작(overflow)을 선택 가능
+    - 'block': 자리가 날 때까지 대기 (프레임 손실 없음, 캡처 루프 지연 가능)
+    - 'drop_oldest': 가장 오래된 대기 프레임 버리고 새 프레임 넣음
+    - 'spill': 인코딩 없이 raw(.npy)로 디스크에 임시 저장, 여유 있을 때 인코딩
+    """
+    OVERFLOW_POLICIES = ('block', 'drop_oldest', 'spill')
+
+    def __init__(self, num_workers=2, max_queue=32, overflow='block', spill_dir=None, codec=None):
+        """
+        Args:
+            num_workers (int): 인코딩/쓰기 워커 스레드 개수
+            max_queue (int): 대기 큐 최대 길이
+            overflow (str): 큐가 가득 찼을 때 정책 ('block', 'drop_oldest', 'spill')
+            spill_dir (str): 'spill' 정책에서 raw 프레임 임시 저장 폴더
+            codec: 저장 형식 (capture_codecs.OutputCodec 또는 frame_container.ContainerSet), None이면 파일 확장자대로 cv2.imwrite 기본 설정
+        """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if overflow == 'spill' and not spill_dir:
+            raise ValueError("spill_dir is required for 'spill' overflow policy")
+
+        self.num_workers = max(1, int(num_workers))
+        self.overflow = overflow
+        self.spill_dir = spill_dir
+        self.codec = codec
+
+        self._queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._spilled = deque()  # (최종 파일명, spill 파일명, 촬영 시각, on_saved)
+        self._spill_ids = itertools.count()  # spill 파일명 중복 방지 (여러 카메라가 같은 파일명 사용 가능)
+        self._workers = []
+        self._stats_lock = threading.Lock()
+
+        # 통계
+        self._written = 0
+        self._dropped = 0
+        self._spill_count = 0
+        self._errors = 0
+        self._max_depth = 0
+        self._last_latency = 0.0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    def start(self):
+        """
+        워커 스레드 시작
+        """
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self._worker, name=f"capture-writer-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, filename, frame, on_done=None, timestamp_ns=None, on_saved=None):
+        """
+        저장할 프레임을 큐에 넣음
+
+        frame은 on_done이 호출될 때까지 수정되지 않아야 함 (복사본 전달)
+
+        Args:
+            filename (str): 저장할 파일 경로
+            frame (np.ndarray): 저장할 이미지
+            on_done: 프레임 사용이 끝나면(저장/버림/spill 후) frame을 인자로 호출, 버퍼 반납용
+            timestamp_ns (int): 프레임 촬영 시각 (컨테이너 인덱스에 기록)
+            on_saved: 저장 결과 dict ('status': 'saved'/'dropped'/'error', 'bytes', 'checksum')를 인자로 호출 (매니페스트 기록용)
+
+        Returns:
+            bool: 큐(또는 spill)에 들어갔으면 True, 버려졌으면 False
+        """
+        item = (filename, frame, on_done, timestamp_ns, on_saved)
+
+        if self.overflow == 'block':
+            self._queue.put(item)
+        elif self.overflow == 'drop_oldest':
+            while True:
+                try:
+                    self._queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    # 가장 오래된 프레임 버림
+                    try:
+                        dropped = self._queue.get_nowait()
+                        self._queue.task_done()
+                        with self._stats_lock:
+                            self._dropped += 1
+                        self._done(dropped)
+                        self._report(dropped[4], None, 'dropped')
+                    except queue.Empty:
+                        pass
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                ok = self._spill(filename, frame, timestamp_ns, on_saved)
+                self._done(item)
+                if not ok:
+                    self._report(on_saved, None, 'dropped')
+                return ok
+
+        with self._stats_lock:
+            self._max_depth = max(self._max_depth, self._queue.qsize())
+        return True
+
+    def _spill(self, filename, frame, timestamp_ns=None, on_saved=None):
+        """
+        큐가 가득 찼을 때 인코딩 없이 raw 프레임을 디스크에 임시 저장
+        """
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            spill_path = os.path.join(self.spill_dir, f"{next(self._spill_ids):06d}_{os.path.basename(filename)}.npy")
+            np.save(spill_path, frame)
+            self._spilled.append((filename, spill_path, timestamp_ns, on_saved))
+            with self._stats_lock:
+                self._spill_count += 1
+            return True
+        except Exception as e:
+            print(f"Spill failed for {filename}: {e}")
+            with self._stats_lock:
+                self._dropped += 1
+            return False
+
+    def _worker(self):
+        """
+        워커 스레드
+
+        큐에서 프레임 꺼내 인코딩/저장, 큐가 비어 있으면 spill된 프레임 처리
+        종료 신호(None)를 받으면 남은 spill 프레임 모두 처리 후 종료
+        """
+        while True:
+            try:
+                item = self._queue.get(timeout=0.05)
+            except queue.Empty:
+                self._drain_spilled(max_items=1)
+                continue
+
+            try:
+                if item is None:
+                    self._drain_spilled()
+                    return
+                result = self._write(item[0], item[1], item[3])
+                self._done(item)
+                self._report(item[4], result)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _done(item):
+        """
+        프레임 사용이 끝났음을 호출자에게 알림 (on_done 콜백)
+        """
+        filename, frame, on_done = item[:3]
+        if on_done is not None:
+            on_done(frame)
+
+    @staticmethod
+    def _report(on_saved, result, status='error'):
+        """
+        저장 결과를 호출자에게 알림 (on_saved 콜백), result가 None이면 status로 실패 종류 표시
+        """
+        if on_saved is None:
+            return
+        try:
+            on_saved(dict(result, status='saved') if result else {'status': status, 'bytes': None, 'checksum': None})
+        except Exception as e:
+            print(f"Save callback failed: {e}")
+
+    def _drain_spilled(self, max_items=None):
+        """
+        spill된 프레임들을 읽어서 최종 파일로 인코딩
+        """
+        count = 0
+        while max_items is None or count < max_items:
+            try:
+                filename, spill_path, timestamp_ns, on_saved = self._spilled.popleft()
+            except IndexError:
+                return
+            result = None
+            try:
+                frame = np.load(spill_path)
+                result = self._write(filename, frame, timestamp_ns)
+                if result:
+                    os.remove(spill_path)
+            except Exception as e:
+                print(f"Failed to restore spilled frame {spill_path}: {e}")
+            self._report(on_saved, result)
+            count += 1
+
+    def _write(self, filename, frame, timestamp_ns=None):
+        """
+        프레임 인코딩 + 파일 쓰기, 소요 시간 기록
+
+        Returns:
+            dict: 'bytes', 'checksum' (codec 없이 cv2.imwrite로 저장하면 체크섬 None), 실패하면 None
+        """
+        t0 = time.perf_counter()
+        try:
+            if self.codec:
+                result = self.codec.save(filename, frame, timestamp_ns)
+            else:
+                result = {'bytes': os.path.getsize(filename), 'checksum': None} if cv2.imwrite(filename, frame) else None
+        except Exception as e:
+            print(f"Write failed for {filename}: {e}")
+            result = None
+        ok = result is not None
+        latency = time.perf_counter() - t0
+
+        with self._stats_lock:
+            if ok:
+                self._written += 1
+                self._last_latency = latency
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+            else:
+                self._errors += 1
+        return result
+
+    @property
+    def max_queue(self):
+        """대기 큐 최대 길이"""
+        return self._queue.maxsize
+
+    @property
+    def queue_depth(self):
+        """현재 큐에 대기 중인 프레임 수"""
+        return self._queue.qsize()
+
+    def stats(self):
+        """
+        저장 통계 반환
+
+        Returns:
+            dict: 큐 깊이, 저장/버림/spill/오류 수, 인코딩 지연(ms)
+        """
+        with self._stats_lock:
+            mean_latency = self._total_latency / self._written if self._written else 0.0
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self._max_depth,
+                'pending_spill': len(self._spilled),
+                'written': self._written,
+                'dropped': self._dropped,
+                'spilled': self._spill_count,
+                'errors': self._errors,
+                'last_latency_ms': self._last_latency * 1000,
+                'mean_latency_ms': mean_latency * 1000,
+                'max_latency_ms': self._max_latency * 1000,
+            }
+
+    def close(self):
+        """
+        남은 프레임 모두 저장 후 워커 종료
+
+        큐에 쌓인 프레임과 spill된 프레임까지 모두 처리될 때까지 대기
+        """
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+
+        # 워커가 없을 때 남은 spill 프레임 처리
+        self._drain_spilled()
+        if self.spill_dir and os.path.isdir(self.spill_dir) and not os.listdir(self.spill_dir):
+            os.rmdir(self.spill_dir)
@@ -0,0 +1,116 @@
+"""
+변화 감지 저장 (change gate)
+
+오래 변화 없는 구간에서 같은 장면을 계속 인코딩/저장하지 않도록
+ROI를 간격(step)마다 건너뛰어 줄인 signature를 마지막으로 저장한 프레임의 signature와 비교
+- 'mad': 픽셀 평균 절대 차이 (0-255)
+- 'hist': 채널별 히스토그램(32구간) 차이, total variation 거리 (0-1)
+threshold 미만이면 저장하지 않음 (매니페스트에 'unchanged'로 기록), 방식마다 점수 범위가 달라서 기본값도 따로
+keyframe_s마다 한 번은 변화가 없어도 저장
+
+260x800 ROI, step 8 기준 signature는 약 100x33x3 = 1만 픽셀 (비교 1회 수십 µs)
+"""
+import numpy as np
+
+GATE_METHODS = ('off', 'mad', 'hist')
+GATE_THRESHOLDS = {'mad': 2.0, 'hist': 0.05}  # 방식별 기본 threshold (센서 노이즈만으로는 넘지 않는 값)
+GATE_MAX_SCORES = {'mad': 255.0, 'hist': 1.0}  # 방식별 점수 최댓값
+HIST_BINS = 32
+
+
+def roi_signature(frame, step=8):
+    """
+    ROI를 step 간격으로 건너뛴 작은 배열 (복사본)
+
+    Args:
+        frame (np.ndarray): (h, w, 3) uint8 ROI
+        step (int): 건너뛸 간격
+
+    Returns:
+        np.ndarray: (h/step, w/step, 3) int16
+    """
+    return frame[::step, ::step].astype(np.int16)
+
+
+def mad_score(signature, reference):
+    """
+    평균 절대 차이 (0-255)
+    """
+    return float(np.abs(signature - reference).mean())
+
+
+def channel_histograms(signature):
+    """
+    채널별 정규화 히스토그램
+
+    Returns:
+        np.ndarray: (채널 수, HIST_BINS), 각 행 합 1
+    """
+    channels = signature.shape[-1]
+    bins = (signature.reshape(-1, channels) * HIST_BINS) >> 8  # 0-255 → 0-(HIST_BINS-1)
+    bins += np.arange(channels) * HIST_BINS  # 채널별로 다른 구간 번호
+    counts = np.bincount(bins.ravel(), minlength=channels * HIST_BINS).reshape(channels, HIST_BINS)
+    return counts / counts.sum(axis=1, keepdims=True)
+
+
+def hist_score(histograms, reference):
+    """
+    채널별 히스토그램 total variation 거리의 평균 (0-1)
+    """
+    return float(np.abs(histograms - reference).sum(axis=1).mean() / 2)
+
+
+class ChangeGate:
+    """
+    카메라 하나의 변화 감지 (캡처 스레드에서만 사용)
+
+    check()가 True를 반환한 프레임(저장할 프레임)이 다음 비교 기준이 됨
+    """
+    def __init__(self, method='mad', threshold=None, step=8, keyframe_s=None):
+        """
+        Args:
+            method (str): 'mad' 또는 'hist'
+            threshold (float): 이 값 이상 달라지면 저장 ('mad': 0-255, 'hist': 0-1), None이면 GATE_THRESHOLDS
+            step (int): signature를 만들 때 건너뛸 간격
+            keyframe_s (float): 마지막 저장 후 이 시간(초)이 지나면 변화가 없어도 저장, None이면 안 함
+        """
+        if method not in GATE_METHODS[1:]:
+            raise ValueError(f"Unknown change gate method: {method}")
+        self.method = method
+        self.threshold = GATE_THRESHOLDS[method] if threshold is None else threshold
+        self.step = max(1, int(step))
+        self.keyframe_ns = round(keyframe_s * 1e9) if keyframe_s else None
+        self._reference = None  # 마지막으로 저장한 프레임의 signature (또는 히스토그램)
+        self._reference_ns = None  # 마지막으로 저장한 프레임 촬영 시각
+        self.passed = 0
+        self.blocked = 0
+
+    def check(self, frame, timestamp_ns):
+        """
+        저장할지 판단
+
+        Args:
+            frame (np.ndarray): ROI 프레임
+            timestamp_ns (int): 촬영 시각 (ns)
+
+        Returns:
+            tuple: (저장하면 True, 변화량 점수), 첫 프레임의 점수는 None
+        """
+        signature = roi_signature(frame, self.step)
+        if self.method == 'hist':
+            signature = channel_histograms(signature)
+        if self._reference is None:
+            score = None
+            changed = True
+        else:
+            score = mad_score(signature, self._reference) if self.method == 'mad' else hist_score(signature, self._reference)
+            changed = score >= self.threshold
+            if not changed and self.keyframe_ns is not None and timestamp_ns - self._reference_ns >= self.keyframe_ns:
+                changed = True
+        if changed:
+            self._reference = signature
+            self._reference_ns = timestamp_ns
+            self.passed += 1
+        else:
+            self.blocked += 1
+        return changed, score
@@ -0,0 +1,120 @@
+"""
+ROI 색 변화로 캡처 간격 조절 (event trigger)
+
+triggered 구간은 짧은(dense) interval로 deadline을 만들고, deadline마다 ROI 색 변화 속도를 보고 저장할지 정함
+- ROI를 step 간격으로 줄여 Lab(또는 HSV)으로 바꾸고, 긴 축(세로)을 따라 bands개 띠로 나눠 띠별 평균 색 계산
+  (Lab은 OpenCV 8비트 값을 L 0-100, a/b -128-127 단위로 바꿔서 거리가 ΔE(CIE76), HSV는 8비트 값 그대로)
+- 변화 속도 = 띠별 평균 색이 직전 측정에서 움직인 거리의 최댓값 / 경과 시간 (초당, 지수 평균으로 평활)
+- 속도가 threshold 이상이면 hold_s 동안 dense: 모든 deadline에서 저장
+- 아니면 sparse: 마지막으로 실제 저장한 뒤(mark_saved) sparse_interval이 지났을 때만 저장
+
+반응이 진행될 때만 촘촘하게, 나머지는 드물게 저장
+"""
+import cv2
+import numpy as np
+
+from roi_stats import warm_up_colour_conversions
+
+TRIGGER_SPACES = {'lab': cv2.COLOR_BGR2Lab, 'hsv': cv2.COLOR_BGR2HSV}  # hsv의 H는 빨강에서 0/180으로 넘어가므로 보통 lab 권장
+
+# OpenCV 8비트 Lab → L 0-100, a/b -128-127
+_LAB_SCALE = np.array([100 / 255, 1, 1], dtype=np.float32)
+_LAB_OFFSET = np.array([0, -128, -128], dtype=np.float32)
+
+
+class ColourTrigger:
+    """
+    카메라 하나의 색 변화 감시 (캡처 스레드에서만 사용)
+    """
+    def __init__(self, space='lab', bands=8, threshold=5.0, hold_s=5.0, sparse_interval=10.0, step=8, smoothing=0.5):
+        """
+        Args:
+            space (str): 색 공간 ('lab', 'hsv')
+            bands (int): ROI 긴 축을 나눌 띠 수
+            threshold (float): dense로 바꿀 변화 속도 (초당, Lab이면 ΔE/s, HSV면 8비트 HSV 단위/s)
+            hold_s (float): 마지막으로 threshold를 넘은 뒤 dense를 유지할 시간 (초)
+            sparse_interval (float): sparse일 때 저장 간격 (초)
+            step (int): 평균을 낼 때 건너뛸 픽셀 간격
+            smoothing (float): 변화 속도 지수 평균 가중치 (0-1, 클수록 최근 값 비중)
+        """
+        if space not in TRIGGER_SPACES:
+            raise ValueError(f"Unknown trigger colour space: {space}")
+        self.space = space
+        self.bands = max(1, int(bands))
+        self.threshold = threshold
+        self.hold_ns = round(hold_s * 1e9)
+        self.sparse_ns = round(sparse_interval * 1e9)
+        self.step = max(1, int(step))
+        self.smoothing = smoothing
+
+        self.rate = 0.0  # 평활한 변화 속도
+        self.dense = False
+        self.switches = 0  # dense ↔ sparse 전환 횟수
+        self._means = None  # 직전 측정의 띠별 평균 색
+        self._means_ns = None
+        self._dense_until_ns = None
+        self._saved_ns = None  # 마지막으로 실제 저장한 프레임 촬영 시각 (mark_saved)
+        warm_up_colour_conversions()
+
+    def band_means(self, frame):
+        """
+        띠별 평균 색
+
+        Args:
+            frame (np.ndarray): BGR ROI
+
+        Returns:
+            np.ndarray: (bands, 3) float32 (Lab이면 L 0-100, a/b -128-127)
+        """
+        small = np.ascontiguousarray(frame[::self.step, ::self.step])
+        converted = cv2.cvtColor(small, TRIGGER_SPACES[self.space])
+        if converted.shape[1] > converted.shape[0]:
+            converted = converted.transpose(1, 0, 2)  # 긴 축을 세로로
+        bands = min(self.bands, converted.shape[0])
+        rows = converted.shape[0] - converted.shape[0] % bands
+        means = converted[:rows].reshape(bands, -1, 3).mean(axis=1, dtype=np.float32)
+        if self.space == 'lab':
+            means *= _LAB_SCALE
+            means += _LAB_OFFSET
+        return means
+
+    def update(self, frame, timestamp_ns):
+        """
+        새 프레임으로 변화 속도 갱신
+
+        Returns:
+            float: 평활한 변화 속도 (초당)
+        """
+        means = self.band_means(frame)
+        if self._means is not None and timestamp_ns > self._means_ns:
+            distance = float(np.linalg.norm(means - self._means, axis=1).max())
+            instant = distance / ((timestamp_ns - self._means_ns) / 1e9)
+            self.rate = self.smoothing * instant + (1 - self.smoothing) * self.rate
+            if self.rate >= self.threshold:
+                self._dense_until_ns = timestamp_ns + self.hold_ns
+        self._means = means
+        self._means_ns = timestamp_ns
+
+        dense = self._dense_until_ns is not None and timestamp_ns < self._dense_until_ns
+        if dense != self.dense:
+            self.dense = dense
+            self.switches += 1
+        return self.rate
+
+    def check(self, frame, timestamp_ns):
+        """
+        변화 속도를 갱신하고 이번 프레임을 저장할지 판단
+        (sparse 간격 기준 시각은 실제로 저장했을 때 mark_saved로 갱신)
+
+        Returns:
+            tuple: (저장하면 True, 변화 속도)
+        """
+        rate = self.update(frame, timestamp_ns)
+        save = self.dense or self._saved_ns is None or timestamp_ns - self._saved_ns >= self.sparse_ns
+        return save, rate
+
+    def mark_saved(self, timestamp_ns):
+        """
+        저장하기로 한 프레임이 실제로 저장됐을 때 호출 (중복/변화 없음으로 건너뛰었으면 호출하지 않음)
+        """
+        self._saved_ns = timestamp_ns
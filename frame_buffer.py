@@ -0,0 +1,294 @@
+import threading
+import time
+
+import numpy as np
+
+
+class FrameStamper:
+    """
+    프레임 번호 및 촬영 시각 부여
+
+    GStreamer 버퍼 PTS(CAP_PROP_POS_MSEC)를 monotonic 시계 기준 ns로 변환
+    PTS가 없거나 증가하지 않으면 프레임을 읽은 monotonic 시각으로 대체
+    """
+    def __init__(self):
+        self.seq = -1  # 마지막으로 부여한 프레임 번호
+        self._offset_ns = None  # monotonic - PTS (관측된 최소값)
+        self._last_pts_ns = None
+
+    def stamp(self, pos_msec, read_ns):
+        """
+        새 프레임에 번호와 촬영 시각 부여
+
+        PTS 기준 시각은 (PTS + 관측된 최소 지연)으로 계산
+        읽은 시각은 항상 촬영 시각 이후이므로 최소 지연이 가장 정확한 추정값
+
+        Args:
+            pos_msec (float): VideoCapture.get(cv2.CAP_PROP_POS_MSEC) 값
+            read_ns (int): 프레임 읽은 직후 time.monotonic_ns()
+
+        Returns:
+            tuple: (프레임 번호, 촬영 시각 monotonic ns, 'pts' 또는 'read')
+        """
+        self.seq += 1
+        pts_ns = round(pos_msec * 1_000_000) if pos_msec and pos_msec > 0 else None
+
+        if pts_ns is None or (self._last_pts_ns is not None and pts_ns <= self._last_pts_ns):
+            return self.seq, read_ns, 'read'
+
+        self._last_pts_ns = pts_ns
+        offset_ns = read_ns - pts_ns
+        if self._offset_ns is None or offset_ns < self._offset_ns:
+            self._offset_ns = offset_ns
+        return self.seq, pts_ns + self._offset_ns, 'pts'
+
+
+class FrameRingBuffer:
+    """
+    미리 할당된 프레임 링 버퍼
+
+    최근 N개 프레임을 번호, 촬영 시각과 함께 하나의 NumPy 배열에 보관
+    첫 프레임(또는 해상도 변경) 때만 할당하고, 이후 프레임마다 새로 할당하지 않음
+    - 미리보기 스레드: begin_write()로 받은 슬롯에 직접 읽고 commit()
+    - 캡처 스레드: nearest()/between()으로 슬롯 선택 후 read()로 복사
+      (복사 중 슬롯이 덮어써지면 감지해서 None 반환)
+    """
+    def __init__(self, capacity=64, max_bytes=None):
+        """
+        Args:
+            capacity (int): 보관할 최대 프레임 수
+            max_bytes (int): 버퍼 최대 메모리 (bytes), capacity보다 우선
+        """
+        self.capacity = max(2, int(capacity))
+        self.max_bytes = max_bytes
+        self._frames = None  # (N, H, W, C) 프레임 배열
+        self._seq = None  # 슬롯별 프레임 번호 (-1: 비어 있음/쓰는 중)
+        self._ts = None  # 슬롯별 촬영 시각 (monotonic ns)
+        self._write_count = 0  # 지금까지 쓴 슬롯 수
+        self._cond = threading.Condition()
+
+    @property
+    def allocated(self):
+        """버퍼 할당 여부"""
+        return self._frames is not None
+
+    @property
+    def nbytes(self):
+        """버퍼가 차지하는 메모리 (bytes)"""
+        return self._frames.nbytes if self._frames is not None else 0
+
+    def allocate(self, shape, dtype=np.uint8):
+        """
+        프레임 크기에 맞게 버퍼 할당
+
+        max_bytes가 있으면 그 안에 들어가도록 슬롯 수를 줄임
+
+        Args:
+            shape (tuple): 프레임 shape (H, W, C)
+            dtype: 프레임 dtype
+        """
+        frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        slots = self.capacity
+        if self.max_bytes:
+            slots = max(2, min(slots, self.max_bytes // frame_bytes))
+        with self._cond:
+            self._frames = np.empty((slots,) + tuple(shape), dtype=dtype)
+            self._seq = np.full(slots, -1, dtype=np.int64)
+            self._ts = np.zeros(slots, dtype=np.int64)
+            self._write_count = 0
+
+    def matches(self, frame):
+        """frame이 현재 버퍼 슬롯과 같은 shape/dtype인지"""
+        return self._frames is not None and self._frames.shape[1:] == frame.shape and self._frames.dtype == frame.dtype
+
+    def begin_write(self):
+        """
+        다음에 쓸 슬롯(가장 오래된 슬롯) 반환
+
+        슬롯을 비어 있음으로 표시해서 읽는 쪽이 쓰는 중인 프레임을 고르지 않도록 함
+
+        Returns:
+            tuple: (슬롯 번호, 슬롯 배열 view)
+        """
+        with self._cond:
+            slot = self._write_count % len(self._frames)
+            self._seq[slot] = -1
+            return slot, self._frames[slot]
+
+    def commit(self, slot, seq, ts_ns):
+        """
+        슬롯 쓰기 완료 표시, 기다리는 스레드 깨움
+        """
+        with self._cond:
+            self._seq[slot] = seq
+            self._ts[slot] = ts_ns
+            self._write_count += 1
+            self._cond.notify_all()
+
+    def push(self, frame, seq, ts_ns):
+        """
+        프레임을 버퍼에 복사해서 추가 (직접 슬롯에 읽을 수 없는 경우)
+
+        shape이 다르면 버퍼를 새로 할당
+
+        Returns:
+            np.ndarray: 프레임이 저장된 슬롯 view
+        """
+        if not self.matches(frame):
+            self.allocate(frame.shape, frame.dtype)
+        slot, buf = self.begin_write()
+        np.copyto(buf, frame)
+        self.commit(slot, seq, ts_ns)
+        return buf
+
+    def _valid_slots(self):
+        return np.flatnonzero(self._seq >= 0) if self._seq is not None else np.empty(0, dtype=np.intp)
+
+    def latest(self):
+        """
+        가장 최근 프레임 정보
+
+        Returns:
+            tuple: (슬롯 번호, 프레임 번호, 촬영 시각 ns), 없으면 None
+        """
+        with self._cond:
+            valid = self._valid_slots()
+            if not len(valid):
+                return None
+            slot = valid[np.argmax(self._seq[valid])]
+            return int(slot), int(self._seq[slot]), int(self._ts[slot])
+
+    def frame_period_ns(self):
+        """
+        버퍼 안 프레임들로 추정한 프레임 간격 (ns), 프레임이 2개 미만이면 None
+        """
+        with self._cond:
+            valid = self._valid_slots()
+            if len(valid) < 2:
+                return None
+            ts = self._ts[valid]
+            return int(ts.max() - ts.min()) // (len(valid) - 1)
+
+    def nearest(self, target_ns, timeout=0.1):
+        """
+        target_ns에 촬영 시각이 가장 가까운 프레임 정보 반환
+
+        target 이후 프레임이 아직 없으면 최대 timeout초 동안 다음 프레임을 기다린 뒤 선택
+        버퍼 전체에서 찾으므로 늦게 처리된 deadline도 그 시점 프레임을 고를 수 있음
+
+        Args:
+            target_ns (int): 목표 시각 (monotonic ns)
+            timeout (float): target 이후 프레임을 기다릴 최대 시간 (초)
+
+        Returns:
+            tuple: (슬롯 번호, 프레임 번호, 촬영 시각 ns), 없으면 None
+        """
+        self.wait_until(target_ns, timeout)
+        with self._cond:
+            valid = self._valid_slots()
+            if not len(valid):
+                return None
+            slot = valid[np.argmin(np.abs(self._ts[valid] - target_ns))]
+            return int(slot), int(self._seq[slot]), int(self._ts[slot])
+
+    def between(self, start_ns, end_ns):
+        """
+        촬영 시각이 [start_ns, end_ns] 범위인 프레임 정보 목록 (시간순)
+
+        Returns:
+            list: [(슬롯 번호, 프레임 번호, 촬영 시각 ns), ...]
+        """
+        with self._cond:
+            valid = self._valid_slots()
+            ts = self._ts[valid]
+            picked = valid[(ts >= start_ns) & (ts <= end_ns)]
+            order = np.argsort(self._seq[picked])
+            return [(int(slot), int(self._seq[slot]), int(self._ts[slot])) for slot in picked[order]]
+
+    def wait_until(self, ts_ns, timeout):
+        """
+        촬영 시각이 ts_ns 이후인 프레임이 들어올 때까지 대기
+
+        Returns:
+            bool: 해당 프레임이 들어왔으면 True
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                valid = self._valid_slots()
+                if len(valid) and self._ts[valid].max() >= ts_ns:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+
+    def read(self, slot, seq, region=None, out=None):
+        """
+        슬롯의 프레임(또는 ROI 영역만) 복사해서 반환
+
+        복사 전후로 프레임 번호를 확인해서, 복사 도중 미리보기 스레드가
+        슬롯을 덮어썼으면 None 반환 (찢어진 프레임 방지)
+
+        Args:
+            slot (int): 슬롯 번호
+            seq (int): 기대하는 프레임 번호
+            region (tuple): (xmin, ymin, width, height), 있으면 해당 영역만 복사
+            out (np.ndarray): 복사할 대상 배열 (없으면 새로 할당)
+
+        Returns:
+            np.ndarray: 복사된 프레임, 덮어써졌으면 None
+        """
+        with self._cond:
+            if self._seq[slot] != seq:
+                return None
+            src = self._frames[slot]
+        if region is not None:
+            xmin, ymin, w, h = region
+            src = src[ymin:ymin+h, xmin:xmin+w]
+        if out is None:
+            out = np.ascontiguousarray(src) if region is not None else src.copy()
+        else:
+            np.copyto(out, src)
+        with self._cond:
+            if self._seq[slot] != seq:
+                return None
+        return out
+
+
+class RoiBufferPool:
+    """
+    ROI 복사용 재사용 버퍼 풀
+
+    캡처마다 ROI 크기의 연속 배열을 새로 할당하지 않고,
+    저장이 끝난 버퍼를 돌려받아 다시 사용
+    """
+    def __init__(self, shape, dtype=np.uint8, count=8):
+        """
+        Args:
+            shape (tuple): ROI 배열 shape (H, W, C)
+            dtype: 배열 dtype
+            count (int): 미리 할당할 버퍼 수
+        """
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self._free = [np.empty(self.shape, dtype=dtype) for _ in range(count)]
+        self._lock = threading.Lock()
+        self.allocated = count  # 지금까지 할당한 버퍼 수
+
+    def acquire(self):
+        """
+        빈 버퍼 하나 꺼냄 (없으면 새로 할당)
+        """
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+            self.allocated += 1
+        return np.empty(self.shape, dtype=self.dtype)
+
+    def release(self, buf):
+        """
+        다 쓴 버퍼 반납
+        """
+        with self._lock:
+            self._free.append(buf)
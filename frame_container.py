@@ -0,0 +1,350 @@
+"""
+세션 프레임 컨테이너 (파일 하나에 모든 캡처 프레임)
+
+캡처마다 작은 파일을 만드는 대신 세션의 ROI 프레임을 파일 하나에 이어서 씀
+- 파일 시스템 메타데이터 작업(파일 생성)이 없고, 큰 단위로 순차 쓰기 (SD 카드 단편화 감소)
+- 끝에 인덱스(오프셋, 길이, 촬영 시각, 이름)를 붙여서 k번째 프레임만 바로 읽기 가능
+- 인덱스가 없으면(비정상 종료) 프레임 레코드 헤더를 따라가며 복구
+
+파일 구조:
+    b'JFRAMES1' | u32 메타 길이 | 메타 JSON (형식, 수준, 확장자, 생성 시각)
+    레코드 반복: b'FRM1' | u32 데이터 길이 | i64 촬영 시각 ns | u16 이름 길이 | 이름 | 인코딩된 프레임
+    인덱스: (u64 오프셋, u32 길이, i64 촬영 시각 ns) × N | u32 이름 JSON 길이 | 이름 JSON
+    트레일러: b'JFINDEX1' | u64 인덱스 오프셋 | u64 프레임 수
+
+사용 예:
+    python frame_container.py info sample/target/titer/0/frames.jfc
+    python frame_container.py export sample/target/titer/0/frames.jfc ./png_out
+"""
+import argparse
+import io
+import json
+import os
+import struct
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from capture_codecs import OutputCodec, checksum
+
+FILE_MAGIC = b'JFRAMES1'
+RECORD_MAGIC = b'FRM1'
+INDEX_MAGIC = b'JFINDEX1'
+RECORD_HEADER = struct.Struct('<4sIqH')
+TRAILER = struct.Struct('<8sQQ')
+INDEX_DTYPE = np.dtype([('offset', '<u8'), ('length', '<u4'), ('timestamp_ns', '<i8')])
+CONTAINER_NAME = 'frames.jfc'  # 세션 폴더 안 컨테이너 파일 이름
+
+
+class ContainerWriter:
+    """
+    프레임 컨테이너 쓰기
+
+    인코딩은 호출한 스레드에서 병렬로, 파일에 붙이는 부분만 잠금
+    chunk_bytes만큼 모아서 한 번에 씀
+    """
+    def __init__(self, path, codec=None, chunk_bytes=4 * 1024 * 1024):
+        """
+        Args:
+            path (str): 컨테이너 파일 경로
+            codec (OutputCodec): 프레임 인코딩 형식, None이면 PNG
+            chunk_bytes (int): 한 번에 파일에 쓰는 크기
+        """
+        self.path = path
+        self.codec = codec or OutputCodec()
+        self.chunk_bytes = chunk_bytes
+
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+        meta = json.dumps({'format': self.codec.format, 'level': self.codec.level, 'ext': self.codec.ext, 'created': time.time()}).encode()
+        self._pending = [FILE_MAGIC + struct.pack('<I', len(meta)) + meta]  # 아직 안 쓴 chunk (복사 없이 모아 둠)
+        self._pending_bytes = len(self._pending[0])
+        self._size = self._pending_bytes  # 논리적 파일 크기 (아직 안 쓴 chunk 포함)
+        self._index = []  # (오프셋, 길이, 촬영 시각 ns)
+        self._names = []
+        self.closed = False
+
+    @property
+    def ext(self):
+        return self.codec.ext
+
+    def __len__(self):
+        return len(self._index)
+
+    def write(self, filename, frame, timestamp_ns=None):
+        """
+        프레임 인코딩 후 컨테이너에 추가 (CaptureWriter 워커에서 OutputCodec.write 대신 호출)
+
+        Args:
+            filename (str): 프레임 이름 (경로면 파일 이름만 사용)
+            frame (np.ndarray): BGR 이미지
+            timestamp_ns (int): 촬영 시각 (monotonic ns), 없으면 지금
+
+        Returns:
+            bool: 성공하면 True
+        """
+        return self.append(os.path.basename(filename), self.codec.encode(frame), timestamp_ns)
+
+    def save(self, filename, frame, timestamp_ns=None):
+        """
+        write()와 같지만 저장한 크기와 체크섬 반환 (매니페스트 기록용)
+
+        Returns:
+            dict: 'bytes', 'checksum'(crc32)
+        """
+        data = self.codec.encode(frame)
+        self.append(os.path.basename(filename), data, timestamp_ns)
+        return {'bytes': len(data), 'checksum': checksum(data)}
+
+    def append(self, name, data, timestamp_ns=None):
+        """
+        이미 인코딩된 프레임 추가
+
+        Returns:
+            bool: 성공하면 True
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        name_bytes = name.encode()
+        header = RECORD_HEADER.pack(RECORD_MAGIC, len(data), timestamp_ns, len(name_bytes))
+        with self._lock:
+            if self.closed:
+                raise ValueError(f"Container {self.path} is closed")
+            offset = self._size + len(header) + len(name_bytes)
+            self._pending += [header, name_bytes, data]
+            self._pending_bytes += len(header) + len(name_bytes) + len(data)
+            self._size = offset + len(data)
+            self._index.append((offset, len(data), timestamp_ns))
+            self._names.append(name)
+            if self._pending_bytes >= self.chunk_bytes:
+                self._flush_locked()
+        return True
+
+    def _flush_locked(self):
+        self._file.writelines(self._pending)
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def flush(self):
+        """
+        모아 둔 chunk를 파일에 씀
+        """
+        with self._lock:
+            self._flush_locked()
+            self._file.flush()
+
+    def close(self):
+        """
+        남은 chunk와 인덱스, 트레일러를 쓰고 닫음
+        """
+        with self._lock:
+            if self.closed:
+                return
+            index_offset = self._size
+            names = json.dumps(self._names).encode()
+            self._pending += [np.array(self._index, dtype=INDEX_DTYPE).tobytes(), struct.pack('<I', len(names)), names,
+                              TRAILER.pack(INDEX_MAGIC, index_offset, len(self._index))]
+            self._flush_locked()
+            self._file.close()
+            self.closed = True
+
+
+class ContainerSet:
+    """
+    폴더마다 컨테이너 하나 (여러 카메라가 저장 풀 하나를 공유할 때)
+
+    OutputCodec과 같은 write(filename, frame) 인터페이스, filename의 폴더로 컨테이너를 고름
+    """
+    def __init__(self, codec=None, chunk_bytes=4 * 1024 * 1024):
+        self.codec = codec or OutputCodec()
+        self.chunk_bytes = chunk_bytes
+        self.containers = {}  # 폴더 → ContainerWriter
+        self._lock = threading.Lock()
+
+    @property
+    def ext(self):
+        return self.codec.ext
+
+    @property
+    def name(self):
+        return f"{self.codec.name} container"
+
+    def open(self, folder):
+        """
+        폴더의 컨테이너 (없으면 생성)
+
+        Returns:
+            ContainerWriter: 컨테이너
+        """
+        with self._lock:
+            container = self.containers.get(folder)
+            if container is None:
+                container = ContainerWriter(os.path.join(folder, CONTAINER_NAME), codec=self.codec, chunk_bytes=self.chunk_bytes)
+                self.containers[folder] = container
+            return container
+
+    def write(self, filename, frame, timestamp_ns=None):
+        return self.open(os.path.dirname(filename)).write(filename, frame, timestamp_ns)
+
+    def save(self, filename, frame, timestamp_ns=None):
+        return self.open(os.path.dirname(filename)).save(filename, frame, timestamp_ns)
+
+    def close(self):
+        for container in self.containers.values():
+            container.close()
+
+
+class ContainerReader:
+    """
+    프레임 컨테이너 읽기
+
+    인덱스만 읽어 두고, 프레임은 요청할 때 해당 위치만 읽음
+    """
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 컨테이너 파일 경로
+
+        Raises:
+            ValueError: 컨테이너 파일이 아닐 때
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        magic = self._file.read(len(FILE_MAGIC))
+        if magic != FILE_MAGIC:
+            self._file.close()
+            raise ValueError(f"{path} is not a frame container")
+        meta_length, = struct.unpack('<I', self._file.read(4))
+        self.meta = json.loads(self._file.read(meta_length))
+        self._data_start = len(FILE_MAGIC) + 4 + meta_length
+        self.recovered = False  # 인덱스 없이 레코드를 따라가며 읽었는지
+        self._load_index()
+
+    def _load_index(self):
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size >= self._data_start + TRAILER.size:
+            self._file.seek(file_size - TRAILER.size)
+            magic, index_offset, count = TRAILER.unpack(self._file.read(TRAILER.size))
+            if magic == INDEX_MAGIC:
+                self._file.seek(index_offset)
+                self.index = np.frombuffer(self._file.read(count * INDEX_DTYPE.itemsize), dtype=INDEX_DTYPE)
+                names_length, = struct.unpack('<I', self._file.read(4))
+                self.names = json.loads(self._file.read(names_length))
+                return
+        self._scan(file_size)
+
+    def _scan(self, file_size):
+        """
+        인덱스가 없을 때 (세션 중 비정상 종료) 레코드 헤더를 따라가며 인덱스 복구
+        마지막 레코드가 잘렸으면 그 앞까지만 사용
+        """
+        entries, names = [], []
+        position = self._data_start
+        while position + RECORD_HEADER.size <= file_size:
+            self._file.seek(position)
+            magic, length, timestamp_ns, name_length = RECORD_HEADER.unpack(self._file.read(RECORD_HEADER.size))
+            offset = position + RECORD_HEADER.size + name_length
+            if magic != RECORD_MAGIC or offset + length > file_size:
+                break
+            names.append(self._file.read(name_length).decode())
+            entries.append((offset, length, timestamp_ns))
+            position = offset + length
+        self.index = np.array(entries, dtype=INDEX_DTYPE)
+        self.names = names
+        self.recovered = True
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, k):
+        return self.read(k)
+
+    @property
+    def timestamps_ns(self):
+        """프레임별 촬영 시각 (monotonic ns)"""
+        return self.index['timestamp_ns']
+
+    def read_bytes(self, k):
+        """
+        k번째 프레임의 인코딩된 데이터 (파일 그대로)
+
+        Returns:
+            bytes: 인코딩된 프레임
+        """
+        offset, length, _ = self.index[k]
+        return os.pread(self._file.fileno(), int(length), int(offset))
+
+    def read(self, k):
+        """
+        k번째 프레임 디코딩
+
+        Returns:
+            np.ndarray: BGR 이미지
+        """
+        data = self.read_bytes(k)
+        if self.meta['format'] == 'npy':
+            return np.load(io.BytesIO(data))
+        return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+
+    def export(self, out_dir, fmt='png', level=None):
+        """
+        프레임마다 파일 하나로 풀기 (캡처 폴더와 같은 이름)
+
+        저장 형식이 컨테이너 형식과 같으면 다시 인코딩하지 않고 그대로 씀
+
+        Args:
+            out_dir (str): 저장 폴더
+            fmt (str): 저장 형식 (capture_codecs.OUTPUT_FORMATS)
+            level (int): 압축 수준/품질
+
+        Returns:
+            int: 저장한 프레임 수
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        codec = OutputCodec(fmt, level)
+        same = codec.format == self.meta['format'] and (level is None or level == self.meta['level'])
+        for k, name in enumerate(self.names):
+            filename = os.path.join(out_dir, os.path.splitext(name)[0] + codec.ext)
+            if same:
+                with open(filename, 'wb') as f:
+                    f.write(self.read_bytes(k))
+            else:
+                codec.write(filename, self.read(k))
+        return len(self.names)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or unpack a session frame container")
+    sub = parser.add_subparsers(dest='command', required=True)
+    info = sub.add_parser('info', help="print format, frame count and time span")
+    info.add_argument('path')
+    export = sub.add_parser('export', help="write one file per frame")
+    export.add_argument('path')
+    export.add_argument('out_dir')
+    export.add_argument('--format', default='png', help="output format (default: png)")
+    export.add_argument('--level', type=int, help="png compression level or jpg/webp quality")
+    args = parser.parse_args()
+
+    with ContainerReader(args.path) as reader:
+        if args.command == 'info':
+            span = (reader.timestamps_ns[-1] - reader.timestamps_ns[0]) / 1e9 if len(reader) else 0.0
+            print(f"{args.path}: {len(reader)} frames, format {reader.meta['format']}, span {span:.2f}s"
+                  f"{' (recovered without index)' if reader.recovered else ''}")
+        else:
+            count = reader.export(args.out_dir, fmt=args.format, level=args.level)
+            print(f"Exported {count} frames to {args.out_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,566 @@
+"""
+프레임 소스
+
+모든 소스는 별도 스레드에서 프레임을 읽어 번호/촬영 시각을 붙여 링 버퍼에 보관하고,
+미리보기가 필요하면 on_preview 콜백으로 최신 프레임 정보(dict)를 넘김
+- 'frame', 'seq', 'frame_size', 'full_view', 'info' (실패 시 'frame'은 None)
+
+- CameraSource: Jetson CSI 카메라 (nvarguscamerasrc) 또는 videotestsrc GStreamer 파이프라인
+- V4L2Source: USB/V4L2 카메라 (/dev/videoN)
+- VideoFileSource: 동영상 파일 재생
+- ImageDirSource: 이미지 폴더 재생 (파일 이름순)
+- SyntheticSource: 합성 프레임 (해상도/fps 지정, 같은 설정이면 항상 같은 프레임 순서)
+
+CSI 카메라 없이도 미리보기/스케줄/저장 성능을 같은 조건으로 측정할 수 있음
+"""
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from frame_buffer import FrameRingBuffer, FrameStamper
+import gst_pipeline
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.ppm')
+
+
+class FrameSource:
+    """
+    프레임 소스 기본 클래스
+
+    하위 클래스는 _open(), _read(buf), _close()를 구현
+    fps가 있으면 k번째 프레임을 시작 + k/fps 시각에 내보냄 (누적 오차 없음), 없으면 _read()가 대기
+    파이프라인 안에서 crop할 수 없는 소스는 ROI를 CPU에서 잘라 링 버퍼에 넣음 (roi 동작은 모든 소스가 같음)
+    """
+    label = "Live Preview"  # 미리보기 정보 라벨 앞부분
+    pipeline_crop = False  # 소스가 ROI를 직접 잘라서 주는지 (CameraSource)
+
+    def __init__(self, camera_id=0, fps=None, ring_buffer_frames=64, ring_buffer_max_mb=256, on_preview=None):
+        """
+        Args:
+            camera_id (int): 카메라 식별자
+            fps (float): 프레임 내보내는 속도 (None이면 소스 속도 그대로)
+            ring_buffer_frames (int): 링 버퍼에 보관할 최대 프레임 수
+            ring_buffer_max_mb (int): 링 버퍼 최대 메모리 (MB)
+            on_preview: 미리보기 프레임 정보(dict)를 받을 콜백 (프레임 읽기 스레드에서 호출)
+        """
+        self.camera_id = camera_id
+        self.fps = fps
+        self.on_preview = on_preview
+
+        self.frame_stamper = FrameStamper()  # 프레임 번호/촬영 시각 부여
+        self.frame_buffer = FrameRingBuffer(capacity=ring_buffer_frames, max_bytes=ring_buffer_max_mb * 1024 * 1024)
+
+        self.preview_frame = None  # 현재 프레임 (링 버퍼 슬롯 view)
+        self.preview_seq = None  # 현재 프레임 번호
+        self.frame_size = None  # 전체 프레임 크기 (w, h), ROI 좌표 기준
+        self.roi = None  # 현재 잘라내는 ROI (None이면 전체 프레임)
+        self.running = False  # 프레임 읽기 스레드 실행 상태
+        self.finished = False  # 소스 끝 (반복 재생하지 않는 파일)
+        self.thread = None
+
+    def start(self, roi=None):
+        """
+        프레임 읽기 스레드 시작
+
+        Args:
+            roi (dict): 잘라낼 ROI, None이면 전체 프레임
+        """
+        self.roi = roi
+        self.running = True
+        self.finished = False
+        # 데몬 스레드로 생성 (메인 프로그램 종료시 자동 종료)
+        self.thread = threading.Thread(target=self._worker, name=f"camera-{self.camera_id}", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=5):
+        """
+        프레임 읽기 스레드 종료, 리소스 해제
+        """
+        self.running = False
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
+
+    def restart(self, roi=None):
+        """
+        소스 다시 열기
+
+        Args:
+            roi (dict): 잘라낼 ROI, None이면 전체 프레임
+        """
+        self.stop()
+        self.start(roi=roi)
+
+    def wait_for_frame(self, timeout=10):
+        """
+        지금 이후 촬영된 프레임이 링 버퍼에 들어올 때까지 대기
+
+        Returns:
+            bool: 프레임이 들어왔으면 True
+        """
+        return self.frame_buffer.wait_until(time.monotonic_ns(), timeout=timeout)
+
+    def _post(self, item):
+        if self.on_preview is not None:
+            self.on_preview(item)
+
+    def _open(self):
+        """
+        소스 열기
+
+        Returns:
+            bool: 성공하면 True
+        """
+        return True
+
+    def _read(self, buf):
+        """
+        프레임 하나 읽기
+
+        Args:
+            buf (np.ndarray): 링 버퍼 슬롯 (shape이 맞으면 여기에 바로 읽기, None일 수 있음)
+
+        Returns:
+            tuple: (성공 여부, BGR 프레임, 버퍼 PTS ms (없으면 0))
+        """
+        raise NotImplementedError
+
+    def _close(self):
+        """
+        소스 닫기
+        """
+
+    def _pace(self, t0_ns, count):
+        """
+        다음 프레임 시각(시작 + count/fps)까지 대기
+        """
+        if self.fps:
+            remaining = t0_ns + round(count * 1e9 / self.fps) - time.monotonic_ns()
+            if remaining > 0:
+                time.sleep(remaining / 1e9)
+
+    def _worker(self):
+        """
+        프레임 읽기 스레드
+
+        소스에서 계속 프레임 읽어서 링 버퍼 슬롯에 저장, 미리보기 콜백 호출
+        """
+        try:
+            if not self._open():
+                print(f"Camera {self.camera_id}: failed to open {type(self).__name__}")
+                self._post({'frame': None, 'info': "카메라 연결 실패"})
+                return
+
+            software_crop = self.roi is not None and not self.pipeline_crop
+            t0_ns = time.monotonic_ns()
+            count = 0
+            while self.running:
+                # 링 버퍼 슬롯에 직접 프레임 읽기 (프레임마다 새로 할당하지 않음)
+                # CPU에서 ROI를 잘라야 하면 전체 프레임을 읽은 뒤 ROI만 복사
+                slot, buf = self.frame_buffer.begin_write() if self.frame_buffer.allocated and not software_crop else (None, None)
+                ret, frame, pos_msec = self._read(buf)
+                read_ns = time.monotonic_ns()
+                if ret:
+                    if software_crop:
+                        frame = frame[self.roi['ymin']:self.roi['ymin'] + self.roi['height'], self.roi['xmin']:self.roi['xmin'] + self.roi['width']]
+                    elif self.roi is None:
+                        self.frame_size = (frame.shape[1], frame.shape[0])
+
+                    # 프레임 번호, 촬영 시각 부여
+                    seq, ts_ns, _ = self.frame_stamper.stamp(pos_msec, read_ns)
+                    if frame is buf:
+                        self.frame_buffer.commit(slot, seq, ts_ns)
+                    else:
+                        # 첫 프레임, 해상도 변경 또는 ROI 복사: 버퍼 (재)할당 후 복사
+                        frame = self.frame_buffer.push(frame, seq, ts_ns)
+
+                    self.preview_frame = frame
+                    self.preview_seq = seq
+                    self._on_frame(frame, seq)
+                elif self.finished:
+                    print(f"Camera {self.camera_id}: end of {type(self).__name__}")
+                    self._post({'frame': None, 'info': "재생 끝"})
+                    break
+                else:
+                    self._post({'frame': None, 'info': "프레임 읽기 실패"})
+
+                count += 1
+                self._pace(t0_ns, count)
+        finally:
+            # 소스 리소스 해제
+            self._close()
+            print("Preview thread finished.")
+
+    def _on_frame(self, frame, seq):
+        """
+        새 프레임을 링 버퍼에 넣은 뒤 호출 (미리보기 전달)
+        """
+        self._post({'frame': frame, 'seq': seq, 'frame_size': None, 'full_view': self.roi is None,
+                    'info': f"{self.label} - {frame.shape[1]}x{frame.shape[0]}"})
+
+
+class CameraSource(FrameSource):
+    """
+    Jetson CSI 카메라 프레임 소스 (GStreamer 파이프라인)
+
+    버퍼 PTS를 촬영 시각으로 사용, ROI는 파이프라인 안에서 잘라냄 (센서 측 crop)
+    dual_branch면 tee로 나눈 2갈래 파이프라인을 열고, 미리보기 갈래는 별도 스레드에서 읽음
+    """
+    pipeline_crop = True
+
+    def __init__(self, camera_id=0, camera_source='csi', dual_branch=False, capture_branch=None, preview_branch=None,
+                 ring_buffer_frames=64, ring_buffer_max_mb=256, on_preview=None):
+        """
+        Args:
+            camera_id (int): 카메라 센서 ID
+            camera_source (str): 영상 소스: 'csi'(nvarguscamerasrc), 'test'(videotestsrc)
+            dual_branch (bool): tee로 미리보기/캡처 갈래를 나눈 파이프라인 사용 (PyGObject 필요)
+            capture_branch (dict): 캡처 갈래 해상도/fps/큐 설정
+            preview_branch (dict): 미리보기 갈래 설정
+            ring_buffer_frames (int): 링 버퍼에 보관할 최대 프레임 수
+            ring_buffer_max_mb (int): 링 버퍼 최대 메모리 (MB)
+            on_preview: 미리보기 프레임 정보(dict)를 받을 콜백 (미리보기 스레드에서 호출)
+        """
+        super().__init__(camera_id=camera_id, ring_buffer_frames=ring_buffer_frames, ring_buffer_max_mb=ring_buffer_max_mb, on_preview=on_preview)
+        self.camera_source = camera_source
+        self.dual_branch = dual_branch
+        self.capture_branch = dict(capture_branch or gst_pipeline.CAPTURE_BRANCH)
+        self.preview_branch = dict(preview_branch or gst_pipeline.PREVIEW_BRANCH)
+
+        self.video_capture = None  # OpenCV VideoCapture 또는 AppSinkPipeline
+        self._dual = False  # 이번에 연 파이프라인이 2갈래인지
+        self._branch_thread = None  # 미리보기 갈래 스레드
+
+    def gstreamer_pipeline(self, sensor_id=0, capture_width=3280, capture_height=2464, display_width=720, display_height=958, framerate=21, flip_method=3, roi=None):
+        """
+        GStreamer 파이프라인 생성
+        CSI 카메라에서 영상을 캡처, OpenCV에서 사용할 수 있는 형식으로 변환
+        self.camera_source가 'test'면 CSI 카메라 대신 videotestsrc 사용
+
+        Args:
+            sensor_id (int): 카메라 센서 ID
+            capture_width (int): 센서에서 캡처할 원본 너비
+            capture_height (int): 센서에서 캡처할 원본 높이
+            display_width (int): 출력 영상 너비
+            display_height (int): 출력 영상 높이
+            framerate (int): 프레임 속도 (fps)
+            flip_method (int): 영상 회전 방법 (nvvidconv flip-method, gst_pipeline 참고)
+            roi (dict): 출력 좌표 ROI, 있으면 파이프라인 안에서 crop (출력 크기 = ROI 크기)
+
+        Returns:
+            str: GStreamer 파이프라인 문자열
+        """
+        if self.camera_source == 'test':
+            return gst_pipeline.test_pipeline(display_width=display_width, display_height=display_height, framerate=framerate, flip_method=flip_method, roi=roi)
+        return gst_pipeline.csi_pipeline(sensor_id=sensor_id, capture_width=capture_width, capture_height=capture_height, display_width=display_width, display_height=display_height, framerate=framerate, flip_method=flip_method, roi=roi)
+
+    def dual_gstreamer_pipeline(self, roi=None):
+        """
+        tee로 나눈 2갈래 파이프라인 생성 (appsink 'capture', 'preview')
+
+        Args:
+            roi (dict): 캡처 갈래에서 잘라낼 ROI (미리보기 갈래는 항상 전체 화면)
+
+        Returns:
+            str: GStreamer 파이프라인 문자열
+        """
+        if self.camera_source == 'test':
+            return gst_pipeline.dual_pipeline(capture_width=1640, capture_height=1232, capture_branch=self.capture_branch, preview_branch=self.preview_branch, roi=roi, test=True)
+        return gst_pipeline.dual_pipeline(sensor_id=self.camera_id, capture_branch=self.capture_branch, preview_branch=self.preview_branch, roi=roi)
+
+    def _open(self):
+        self._dual = self.dual_branch and gst_pipeline.Gst is not None
+        if self.dual_branch and not self._dual:
+            print("GStreamer Python bindings not available, using the single appsink pipeline")
+
+        # GStreamer 파이프라인으로 카메라 열기
+        if self._dual:
+            self.video_capture = gst_pipeline.AppSinkPipeline(self.dual_gstreamer_pipeline(roi=self.roi))
+        else:
+            self.video_capture = cv2.VideoCapture(self.gstreamer_pipeline(sensor_id=self.camera_id, roi=self.roi), cv2.CAP_GSTREAMER)
+
+        # 카메라 초기화 대기
+        time.sleep(2)
+
+        # 카메라 연결 확인
+        if not self.video_capture.isOpened():
+            return False
+
+        # 미리보기 갈래 스레드 시작
+        if self._dual:
+            self._branch_thread = threading.Thread(target=self._preview_branch_worker, args=(self.video_capture,), daemon=True)
+            self._branch_thread.start()
+        return True
+
+    def _read(self, buf):
+        if self._dual:
+            return self.video_capture.read('capture', timeout=1.0, out=buf)
+        ret, frame = self.video_capture.read(buf)
+        return ret, frame, self.video_capture.get(cv2.CAP_PROP_POS_MSEC) if ret else 0
+
+    def _pace(self, t0_ns, count):
+        # 60fps 목표 (2갈래 파이프라인은 appsink가 프레임 올 때까지 대기)
+        if not self._dual:
+            time.sleep(1/60)
+
+    def _close(self):
+        if self._branch_thread:
+            self._branch_thread.join(timeout=2)
+            self._branch_thread = None
+        if self.video_capture:
+            self.video_capture.release()
+
+    def _on_frame(self, frame, seq):
+        # 2갈래면 미리보기는 미리보기 갈래 스레드가 담당
+        if not self._dual:
+            super()._on_frame(frame, seq)
+
+    def _preview_branch_worker(self, pipeline):
+        """
+        미리보기 갈래 스레드 (2갈래 파이프라인)
+
+        저해상도 미리보기 프레임을 읽어서 콜백으로 넘김
+        ROI 좌표는 캡처 갈래 전체 프레임 크기(self.frame_size) 기준으로 표시
+
+        Args:
+            pipeline (gst_pipeline.AppSinkPipeline): 열린 2갈래 파이프라인
+        """
+        count = 0
+        while self.running:
+            ret, frame, _ = pipeline.read('preview', timeout=0.5)
+            if not ret or self.frame_size is None:
+                continue
+            count += 1
+            self._post({'frame': frame, 'seq': count, 'frame_size': self.frame_size, 'full_view': True,
+                        'info': f"Live Preview - {self.frame_size[0]}x{self.frame_size[1]} (preview {frame.shape[1]}x{frame.shape[0]})"})
+
+
+class V4L2Source(FrameSource):
+    """
+    USB/V4L2 카메라 프레임 소스
+
+    드라이버 버퍼 타임스탬프(CAP_PROP_POS_MSEC)를 촬영 시각으로 사용
+    """
+    def __init__(self, camera_id=0, device=None, width=None, height=None, fps=None, fourcc=None,
+                 ring_buffer_frames=64, ring_buffer_max_mb=256, on_preview=None):
+        """
+        Args:
+            camera_id (int): 카메라 식별자
+            device: 장치 번호 또는 경로 (예: 1, '/dev/video1'), 없으면 camera_id
+            width (int): 요청할 해상도 너비 (없으면 드라이버 기본값)
+            height (int): 요청할 해상도 높이
+            fps (float): 요청할 프레임 속도 (드라이버가 속도를 맞추므로 읽기 속도 제한은 하지 않음)
+            fourcc (str): 요청할 픽셀 형식 (예: 'MJPG')
+        """
+        super().__init__(camera_id=camera_id, ring_buffer_frames=ring_buffer_frames, ring_buffer_max_mb=ring_buffer_max_mb, on_preview=on_preview)
+        self.device = camera_id if device is None else device
+        self.width = width
+        self.height = height
+        self.request_fps = fps
+        self.fourcc = fourcc
+        self.video_capture = None
+
+    def _open(self):
+        self.video_capture = cv2.VideoCapture(self.device, cv2.CAP_V4L2)
+        if not self.video_capture.isOpened():
+            return False
+        if self.fourcc:
+            self.video_capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        if self.width and self.height:
+            self.video_capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            self.video_capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.request_fps:
+            self.video_capture.set(cv2.CAP_PROP_FPS, self.request_fps)
+        return True
+
+    def _read(self, buf):
+        ret, frame = self.video_capture.read(buf)
+        return ret, frame, self.video_capture.get(cv2.CAP_PROP_POS_MSEC) if ret else 0
+
+    def _close(self):
+        if self.video_capture:
+            self.video_capture.release()
+
+
+class VideoFileSource(FrameSource):
+    """
+    동영상 파일 프레임 소스
+
+    realtime이면 파일 fps 속도로 내보내고 (카메라처럼), 아니면 최대한 빠르게 읽음
+    촬영 시각은 내보낸 시각 (반복 재생해도 계속 증가)
+    """
+    label = "Video"
+
+    def __init__(self, path, camera_id=0, realtime=True, loop=True, fps=None,
+                 ring_buffer_frames=64, ring_buffer_max_mb=256, on_preview=None):
+        """
+        Args:
+            path (str): 동영상 파일 경로
+            camera_id (int): 카메라 식별자
+            realtime (bool): 파일 fps(또는 fps) 속도로 내보낼지
+            loop (bool): 끝나면 처음부터 반복
+            fps (float): 내보낼 속도 (없으면 파일 fps)
+        """
+        super().__init__(camera_id=camera_id, fps=fps, ring_buffer_frames=ring_buffer_frames, ring_buffer_max_mb=ring_buffer_max_mb, on_preview=on_preview)
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.video_capture = None
+
+    def _open(self):
+        self.video_capture = cv2.VideoCapture(self.path)
+        if not self.video_capture.isOpened():
+            return False
+        if not self.realtime:
+            self.fps = None
+        elif not self.fps:
+            self.fps = self.video_capture.get(cv2.CAP_PROP_FPS) or 30.0
+        return True
+
+    def _read(self, buf):
+        ret, frame = self.video_capture.read(buf)
+        if not ret and self.loop:
+            # 처음으로 되감기
+            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.video_capture.read(buf)
+        if not ret:
+            self.finished = True
+        return ret, frame, 0
+
+    def _close(self):
+        if self.video_capture:
+            self.video_capture.release()
+
+
+class ImageDirSource(FrameSource):
+    """
+    이미지 폴더 프레임 소스
+
+    폴더의 이미지를 파일 이름순으로 fps 속도로 내보냄
+    preload면 시작할 때 모두 디코딩해서 메모리에 보관 (디코딩 시간 제외하고 측정할 때)
+    """
+    label = "Images"
+
+    def __init__(self, path, camera_id=0, fps=21, loop=True, preload=False,
+                 ring_buffer_frames=64, ring_buffer_max_mb=256, on_preview=None):
+        """
+        Args:
+            path (str): 이미지 폴더 경로
+            camera_id (int): 카메라 식별자
+            fps (float): 내보낼 속도 (None이면 최대한 빠르게)
+            loop (bool): 끝나면 처음부터 반복
+            preload (bool): 시작할 때 모든 이미지 디코딩
+        """
+        super().__init__(camera_id=camera_id, fps=fps, ring_buffer_frames=ring_buffer_frames, ring_buffer_max_mb=ring_buffer_max_mb, on_preview=on_preview)
+        self.path = path
+        self.loop = loop
+        self.preload = preload
+        self.files = []
+        self._images = None
+        self._index = 0
+
+    def _open(self):
+        if not os.path.isdir(self.path):
+            return False
+        self.files = sorted(os.path.join(self.path, name) for name in os.listdir(self.path) if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not self.files:
+            return False
+        if self.preload:
+            self._images = [cv2.imread(f, cv2.IMREAD_COLOR) for f in self.files]
+        self._index = 0
+        return True
+
+    def _read(self, buf):
+        if self._index >= len(self.files):
+            if not self.loop:
+                self.finished = True
+                return False, None, 0
+            self._index = 0
+        if self._images is not None:
+            image = self._images[self._index]
+        else:
+            image = cv2.imread(self.files[self._index], cv2.IMREAD_COLOR)
+        self._index += 1
+        if image is None:
+            return False, None, 0
+        if buf is not None and buf.shape == image.shape:
+            np.copyto(buf, image)
+            return True, buf, 0
+        return True, image, 0
+
+    def _close(self):
+        self._images = None
+
+
+class SyntheticSource(FrameSource):
+    """
+    합성 프레임 소스 (카메라/GStreamer 없이 벤치마크, 테스트용)
+
+    그라데이션 배경 위에 프레임 번호에 따라 움직이는 막대를 그린 프레임을 설정한 fps로 만듦
+    같은 설정이면 항상 같은 프레임 순서가 나옴
+    """
+    label = "Synthetic"
+
+    def __init__(self, camera_id=0, width=720, height=958, fps=21, ring_buffer_frames=64, ring_buffer_max_mb=256, on_preview=None):
+        """
+        Args:
+            camera_id (int): 카메라 식별자 (배경 색이 카메라마다 다름)
+            width (int): 프레임 너비
+            height (int): 프레임 높이
+            fps (float): 프레임 생성 속도
+        """
+        super().__init__(camera_id=camera_id, fps=fps, ring_buffer_frames=ring_buffer_frames, ring_buffer_max_mb=ring_buffer_max_mb, on_preview=on_preview)
+        self.width = width
+        self.height = height
+        self._background = None
+        self._count = 0
+
+    def _open(self):
+        # 그라데이션 배경 (카메라마다 색이 다르게)
+        x = np.linspace(0, 255, self.width, dtype=np.float32)
+        y = np.linspace(0, 255, self.height, dtype=np.float32)[:, None]
+        background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        background[..., 0] = (x + 40 * self.camera_id) % 256
+        background[..., 1] = y
+        background[..., 2] = (x[::-1] + y) / 2
+        self._background = background
+        self._count = 0
+        return True
+
+    def _read(self, buf):
+        frame = buf if buf is not None and buf.shape == self._background.shape else np.empty_like(self._background)
+        np.copyto(frame, self._background)
+        bar = (self._count * 8) % self.width
+        frame[:, bar:bar + 8] = 255
+        self._count += 1
+        return True, frame, 0
+
+
+SOURCE_TYPES = ('csi', 'test', 'v4l2', 'video', 'images', 'synthetic')
+
+
+def make_source(camera_id=0, camera_source='csi', **kwargs):
+    """
+    프레임 소스 생성
+
+    Args:
+        camera_id (int): 카메라 식별자
+        camera_source (str): 'csi', 'test'(videotestsrc), 'v4l2', 'video'(동영상 파일), 'images'(이미지 폴더), 'synthetic'(합성 프레임)
+        **kwargs: 소스별 추가 인자 ('video', 'images'는 path 필요)
+
+    Returns:
+        FrameSource: 프레임 소스
+    """
+    if camera_source in ('csi', 'test'):
+        return CameraSource(camera_id=camera_id, camera_source=camera_source, **kwargs)
+    if camera_source == 'v4l2':
+        return V4L2Source(camera_id=camera_id, **kwargs)
+    if camera_source == 'video':
+        return VideoFileSource(camera_id=camera_id, **kwargs)
+    if camera_source == 'images':
+        return ImageDirSource(camera_id=camera_id, **kwargs)
+    if camera_source == 'synthetic':
+        return SyntheticSource(camera_id=camera_id, **kwargs)
+    raise ValueError(f"Unknown frame source: {camera_source}")
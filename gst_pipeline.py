@@ -0,0 +1,398 @@
+"""
+GStreamer 파이프라인 생성
+
+CSI 카메라(nvarguscamerasrc)와 테스트용(videotestsrc) 파이프라인 문자열을 만듦
+ROI를 주면 파이프라인 안에서 잘라내서(센서 측 crop) ROI 픽셀만 CPU로 넘어옴
+
+flip_method는 nvvidconv 기준 번호
+    - 0: 회전 없음
+    - 1: 90도 반시계 방향
+    - 2: 180도
+    - 3: 90도 시계 방향
+    - 4: 좌우 반전
+    - 5: 우상단-좌하단 대각선 기준 반전
+    - 6: 상하 반전
+    - 7: 좌상단-우하단 대각선 기준 반전 (transpose)
+
+crop은 flip/scale 이전(센서 원본 좌표)에 적용되므로,
+화면(출력) 좌표의 ROI를 센서 좌표로 역변환해서 넣어야 함
+
+tee로 나눈 2갈래 파이프라인(미리보기용 저해상도 + 캡처용 고해상도)은
+appsink가 2개라 OpenCV VideoCapture로 열 수 없어서 PyGObject(gi)로 직접 엶
+
+단독 실행 시 videotestsrc 파이프라인을 열어 프레임 크기/속도 확인:
+    python gst_pipeline.py --roi 240,100,260,800 --frames 60
+    python gst_pipeline.py --dual --frames 60
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+
+try:
+    import gi
+    gi.require_version('Gst', '1.0')
+    from gi.repository import Gst
+except (ImportError, ValueError):
+    Gst = None  # PyGObject GStreamer 바인딩 없음 (2갈래 파이프라인 사용 불가)
+
+# nvvidconv flip-method -> videoflip method 번호 (videoflip은 번호 체계가 다름)
+VIDEOFLIP_METHODS = {0: 0, 1: 3, 2: 2, 3: 1, 4: 4, 5: 7, 6: 5, 7: 6}
+
+
+def is_rotated(flip_method):
+    """가로/세로가 바뀌는 flip_method인지 (90도 회전, 대각선 반전)"""
+    return flip_method in (1, 3, 5, 7)
+
+
+def flipped_size(width, height, flip_method):
+    """
+    flip 이후 영상 크기
+
+    Returns:
+        tuple: (width, height)
+    """
+    return (height, width) if is_rotated(flip_method) else (width, height)
+
+
+def unflip_rect(rect, source_size, flip_method):
+    """
+    flip 이후 좌표의 사각형을 flip 이전(원본) 좌표로 역변환
+
+    Args:
+        rect (tuple): flip 이후 좌표 (x, y, w, h)
+        source_size (tuple): flip 이전 원본 크기 (width, height)
+        flip_method (int): nvvidconv flip-method
+
+    Returns:
+        tuple: 원본 좌표 (x, y, w, h)
+    """
+    x, y, w, h = rect
+    W, H = source_size
+    if flip_method == 0: return (x, y, w, h)
+    if flip_method == 1: return (W - y - h, x, h, w)
+    if flip_method == 2: return (W - x - w, H - y - h, w, h)
+    if flip_method == 3: return (y, H - x - w, h, w)
+    if flip_method == 4: return (W - x - w, y, w, h)
+    if flip_method == 5: return (W - y - h, H - x - w, h, w)
+    if flip_method == 6: return (x, H - y - h, w, h)
+    if flip_method == 7: return (y, x, h, w)
+    raise ValueError(f"Unknown flip_method: {flip_method}")
+
+
+def roi_to_source(roi, flip_method, display_size, capture_size):
+    """
+    출력(화면) 좌표 ROI를 센서 원본 좌표 crop 영역으로 변환
+
+    출력 영상 = 센서 영상 → flip → display 크기로 scale 이므로
+    scale 역변환 후 flip 역변환
+    하드웨어 변환기 정렬 제약 때문에 짝수 좌표로 맞춤
+
+    Args:
+        roi (dict): {'xmin', 'ymin', 'width', 'height'} 출력 좌표
+        flip_method (int): nvvidconv flip-method
+        display_size (tuple): 출력 영상 크기 (width, height)
+        capture_size (tuple): 센서 원본 크기 (width, height)
+
+    Returns:
+        tuple: 센서 좌표 (left, top, right, bottom), right/bottom은 끝 좌표(미포함)
+    """
+    flipped_w, flipped_h = flipped_size(*capture_size, flip_method)
+    sx = flipped_w / display_size[0]
+    sy = flipped_h / display_size[1]
+    rect = (roi['xmin'] * sx, roi['ymin'] * sy, roi['width'] * sx, roi['height'] * sy)
+    x, y, w, h = unflip_rect(rect, capture_size, flip_method)
+
+    def even(v, limit):
+        return max(0, min(limit, int(round(v / 2)) * 2))
+
+    left, top = even(x, capture_size[0]), even(y, capture_size[1])
+    right, bottom = even(x + w, capture_size[0]), even(y + h, capture_size[1])
+    return left, top, right, bottom
+
+
+def output_size(display_width, display_height, roi=None):
+    """
+    appsink로 나오는 프레임 크기 (ROI crop이면 ROI 크기)
+
+    Returns:
+        tuple: (width, height)
+    """
+    if roi is None:
+        return display_width, display_height
+    return roi['width'], roi['height']
+
+
+def csi_pipeline_elements(sensor_id=0, capture_width=3280, capture_height=2464, display_width=720, display_height=958, framerate=21, flip_method=3, roi=None):
+    """
+    CSI 카메라 파이프라인 요소 목록
+
+    roi가 있으면 nvvidconv의 left/right/top/bottom(센서 좌표, right/bottom은 끝 좌표)으로 crop하고
+    출력 크기를 ROI 크기로 설정해서 videoconvert/appsink가 ROI 픽셀만 처리
+
+    Returns:
+        list: ' ! '로 이으면 파이프라인 문자열이 되는 요소 목록
+    """
+    convert = f"nvvidconv flip-method={flip_method}"
+    if roi is not None:
+        left, top, right, bottom = roi_to_source(roi, flip_method, (display_width, display_height), (capture_width, capture_height))
+        convert += f" left={left} top={top} right={right} bottom={bottom}"
+    out_w, out_h = output_size(display_width, display_height, roi)
+    return [
+        f"nvarguscamerasrc sensor-id={sensor_id}",
+        f"video/x-raw(memory:NVMM), width=(int){capture_width}, height=(int){capture_height}, framerate=(fraction){framerate}/1",
+        convert,
+        f"video/x-raw, width=(int){out_w}, height=(int){out_h}, format=(string)BGRx",
+        "videoconvert",
+        "video/x-raw, format=(string)BGR",
+        "appsink",
+    ]
+
+
+def test_pipeline_elements(capture_width=1640, capture_height=1232, display_width=720, display_height=958, framerate=21, flip_method=3, roi=None, pattern='smpte'):
+    """
+    videotestsrc 테스트 파이프라인 요소 목록 (젯슨이 아닌 리눅스에서 실행 가능)
+
+    CSI 파이프라인과 같은 순서(crop → flip → scale)로 처리해서
+    ROI 좌표 변환을 그대로 검증할 수 있음
+    videocrop의 right/bottom은 가장자리에서 잘라낼 픽셀 수
+
+    Returns:
+        list: ' ! '로 이으면 파이프라인 문자열이 되는 요소 목록
+    """
+    elements = [
+        f"videotestsrc is-live=true pattern={pattern}",
+        f"video/x-raw, width=(int){capture_width}, height=(int){capture_height}, framerate=(fraction){framerate}/1",
+    ]
+    if roi is not None:
+        left, top, right, bottom = roi_to_source(roi, flip_method, (display_width, display_height), (capture_width, capture_height))
+        elements.append(f"videocrop left={left} top={top} right={capture_width - right} bottom={capture_height - bottom}")
+    out_w, out_h = output_size(display_width, display_height, roi)
+    elements += [
+        f"videoflip method={VIDEOFLIP_METHODS[flip_method]}",
+        "videoscale",
+        f"video/x-raw, width=(int){out_w}, height=(int){out_h}",
+        "videoconvert",
+        "video/x-raw, format=(string)BGR",
+        "appsink",
+    ]
+    return elements
+
+
+def build(elements):
+    """요소 목록을 파이프라인 문자열로"""
+    return " ! ".join(elements)
+
+
+def csi_pipeline(**kwargs):
+    """CSI 카메라 파이프라인 문자열 (인자는 csi_pipeline_elements 참고)"""
+    return build(csi_pipeline_elements(**kwargs))
+
+
+def test_pipeline(**kwargs):
+    """videotestsrc 파이프라인 문자열 (인자는 test_pipeline_elements 참고)"""
+    return build(test_pipeline_elements(**kwargs))
+
+
+# 2갈래 파이프라인 기본 설정
+# width/height: 출력 크기, framerate: None이면 센서 속도 그대로
+# leaky: 큐가 찼을 때 'downstream'(오래된 버퍼 버림) 또는 'no'(대기), max_buffers: 큐/appsink 길이
+CAPTURE_BRANCH = {'width': 720, 'height': 958, 'framerate': None, 'leaky': 'no', 'max_buffers': 4}
+PREVIEW_BRANCH = {'width': 264, 'height': 352, 'framerate': 10, 'leaky': 'downstream', 'max_buffers': 1}
+
+
+def _branch_elements(name, branch, flip_method, capture_size, roi, test):
+    """
+    tee 뒤 한 갈래의 요소 목록 (queue → crop/flip/scale → BGR → appsink)
+    """
+    leaky = branch.get('leaky', 'no')
+    max_buffers = branch.get('max_buffers', 1)
+    elements = [f"queue leaky={leaky} max-size-buffers={max_buffers} max-size-bytes=0 max-size-time=0"]
+    out_w, out_h = output_size(branch['width'], branch['height'], roi)
+    crop = roi_to_source(roi, flip_method, (branch['width'], branch['height']), capture_size) if roi is not None else None
+
+    if test:
+        if crop:
+            left, top, right, bottom = crop
+            elements.append(f"videocrop left={left} top={top} right={capture_size[0] - right} bottom={capture_size[1] - bottom}")
+        elements += [f"videoflip method={VIDEOFLIP_METHODS[flip_method]}", "videoscale", f"video/x-raw, width=(int){out_w}, height=(int){out_h}"]
+    else:
+        convert = f"nvvidconv flip-method={flip_method}"
+        if crop:
+            convert += " left={} top={} right={} bottom={}".format(*crop)
+        elements += [convert, f"video/x-raw, width=(int){out_w}, height=(int){out_h}, format=(string)BGRx"]
+
+    # 프레임 속도 줄이기는 CPU 색 변환(videoconvert) 전에
+    if branch.get('framerate'):
+        elements += ["videorate drop-only=true", f"video/x-raw, framerate=(fraction){branch['framerate']}/1"]
+    elements += [
+        "videoconvert",
+        "video/x-raw, format=(string)BGR",
+        f"appsink name={name} max-buffers={max_buffers} drop=true sync=false",
+    ]
+    return elements
+
+
+def dual_pipeline(sensor_id=0, capture_width=3280, capture_height=2464, framerate=21, flip_method=3, capture_branch=None, preview_branch=None, roi=None, test=False):
+    """
+    tee로 나눈 2갈래 파이프라인 문자열
+
+    - capture 갈래: 캡처용 (고해상도, 프레임 손실 최소)
+    - preview 갈래: 미리보기용 (캔버스 크기, 낮은 fps, 오래된 버퍼 버림)
+    roi는 capture 갈래에만 적용 (capture 갈래 출력 좌표)
+
+    Args:
+        capture_branch (dict): capture 갈래 설정 (CAPTURE_BRANCH 참고)
+        preview_branch (dict): preview 갈래 설정 (PREVIEW_BRANCH 참고)
+        test (bool): True면 nvarguscamerasrc 대신 videotestsrc
+
+    Returns:
+        str: 파이프라인 문자열 (appsink 이름: 'capture', 'preview')
+    """
+    capture_branch = dict(CAPTURE_BRANCH, **(capture_branch or {}))
+    preview_branch = dict(PREVIEW_BRANCH, **(preview_branch or {}))
+    capture_size = (capture_width, capture_height)
+
+    if test:
+        head = ["videotestsrc is-live=true pattern=smpte", f"video/x-raw, width=(int){capture_width}, height=(int){capture_height}, framerate=(fraction){framerate}/1"]
+    else:
+        head = [f"nvarguscamerasrc sensor-id={sensor_id}", f"video/x-raw(memory:NVMM), width=(int){capture_width}, height=(int){capture_height}, framerate=(fraction){framerate}/1"]
+    head.append("tee name=t")
+
+    branches = [
+        build(["t."] + _branch_elements('capture', capture_branch, flip_method, capture_size, roi, test)),
+        build(["t."] + _branch_elements('preview', preview_branch, flip_method, capture_size, None, test)),
+    ]
+    return " ".join([build(head)] + branches)
+
+
+class AppSinkPipeline:
+    """
+    appsink가 여러 개인 GStreamer 파이프라인 (PyGObject 필요)
+
+    VideoCapture와 비슷하게 read()로 프레임을 읽지만 appsink 이름을 지정
+    각 appsink는 서로 다른 스레드에서 읽어도 됨
+    """
+    def __init__(self, description, sink_names=('capture', 'preview')):
+        """
+        Args:
+            description (str): 파이프라인 문자열
+            sink_names (tuple): 읽을 appsink 이름들
+        """
+        if Gst is None:
+            raise RuntimeError("GStreamer Python bindings (PyGObject) are not available")
+        Gst.init(None)
+        self.description = description
+        self._pipeline = Gst.parse_launch(description)
+        self._sinks = {name: self._pipeline.get_by_name(name) for name in sink_names}
+        self._lock = threading.Lock()
+        self._opened = self._pipeline.set_state(Gst.State.PLAYING) != Gst.StateChangeReturn.FAILURE
+
+    def isOpened(self):
+        """파이프라인이 정상적으로 시작되었는지"""
+        return self._opened
+
+    def read(self, name, timeout=1.0, out=None):
+        """
+        appsink에서 프레임 하나 읽기
+
+        Args:
+            name (str): appsink 이름
+            timeout (float): 최대 대기 시간 (초)
+            out (np.ndarray): 같은 shape이면 이 배열에 복사 (없으면 새로 할당)
+
+        Returns:
+            tuple: (성공 여부, BGR 프레임, 버퍼 PTS ms)
+        """
+        sample = self._sinks[name].emit('try-pull-sample', int(timeout * Gst.SECOND))
+        if sample is None:
+            return False, None, 0.0
+
+        structure = sample.get_caps().get_structure(0)
+        width, height = structure.get_value('width'), structure.get_value('height')
+        buf = sample.get_buffer()
+        ok, info = buf.map(Gst.MapFlags.READ)
+        if not ok:
+            return False, None, 0.0
+        try:
+            # 행 끝 정렬(padding) 고려해서 stride 계산
+            stride = info.size // height
+            src = np.ndarray((height, width, 3), dtype=np.uint8, buffer=info.data, strides=(stride, 3, 1))
+            if out is not None and out.shape == src.shape:
+                np.copyto(out, src)
+                frame = out
+            else:
+                frame = src.copy()
+        finally:
+            buf.unmap(info)
+        pts_ms = buf.pts / 1e6 if buf.pts != Gst.CLOCK_TIME_NONE else 0.0
+        return True, frame, pts_ms
+
+    def release(self):
+        """파이프라인 정지"""
+        with self._lock:
+            if self._pipeline is not None:
+                self._pipeline.set_state(Gst.State.NULL)
+                self._pipeline = None
+
+
+def main():
+    import cv2
+
+    parser = argparse.ArgumentParser(description="Open a videotestsrc pipeline and report frame size and rate")
+    parser.add_argument('--roi', help="xmin,ymin,width,height in output coordinates (sensor-side crop)")
+    parser.add_argument('--flip-method', type=int, default=3)
+    parser.add_argument('--frames', type=int, default=60)
+    parser.add_argument('--dual', action='store_true', help="open the two-branch (capture + preview) pipeline")
+    args = parser.parse_args()
+
+    roi = None
+    if args.roi:
+        xmin, ymin, width, height = map(int, args.roi.split(','))
+        roi = {'xmin': xmin, 'ymin': ymin, 'width': width, 'height': height}
+
+    if args.dual:
+        pipeline = dual_pipeline(capture_width=1640, capture_height=1232, flip_method=args.flip_method, roi=roi, test=True)
+        print(pipeline)
+        cap = AppSinkPipeline(pipeline)
+        try:
+            t0 = time.perf_counter()
+            counts = {'capture': 0, 'preview': 0}
+            shapes = {}
+            while counts['capture'] < args.frames:
+                for name in counts:
+                    ret, frame, _ = cap.read(name, timeout=0.01)
+                    if ret:
+                        counts[name] += 1
+                        shapes[name] = frame.shape
+            elapsed = time.perf_counter() - t0
+            for name, count in counts.items():
+                shape = shapes.get(name, (0, 0))
+                print(f"{name}: {count} frames of {shape[1]}x{shape[0]} ({count / elapsed:.1f} fps)")
+        finally:
+            cap.release()
+        return
+
+    pipeline = test_pipeline(flip_method=args.flip_method, roi=roi)
+    print(pipeline)
+
+    cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+    if not cap.isOpened():
+        raise SystemExit("Failed to open pipeline (is OpenCV built with GStreamer?)")
+    try:
+        shape = None
+        t0 = time.perf_counter()
+        for _ in range(args.frames):
+            ret, frame = cap.read()
+            if not ret:
+                raise SystemExit("Failed to read frame")
+            shape = frame.shape
+        elapsed = time.perf_counter() - t0
+        print(f"{args.frames} frames of {shape[1]}x{shape[0]} in {elapsed:.2f}s ({args.frames / elapsed:.1f} fps)")
+    finally:
+        cap.release()
+
+
+if __name__ == '__main__':
+    main()
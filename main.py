@@ -0,0 +1,126 @@
+"""
+여러 카메라를 하나의 프로세스, 하나의 윈도우에서 실행
+
+카메라마다 CameraUI 패널을 나란히 배치 (카메라별 미리보기, ROI, 캡처 구간 설정)
+- Start All: 모든 카메라를 하나의 캡처 엔진으로 캡처 (스케줄러 1개, 저장 풀 1개 공유)
+  Synchronized를 켜면 첫 번째 카메라 타이밍으로 모든 카메라를 동시 캡처, 프레임 쌍/skew 기록
+- 각 패널의 Start Capture: 해당 카메라만 캡처
+
+사용 예:
+    python main.py                      # 카메라 0, 1
+    python main.py --cameras 0
+    python main.py --source synthetic   # 카메라 없이 합성 프레임
+"""
+import argparse
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from camera_ui import CameraUI
+from capture_engine import CaptureEngine
+from frame_sources import make_source
+
+
+class MultiCameraUI:
+    """
+    여러 카메라 제어 윈도우
+
+    카메라별 CameraUI 패널 + 전체 캡처 시작/정지 버튼
+    """
+    def __init__(self, camera_ids=(0, 1), camera_source='csi'):
+        """
+        Args:
+            camera_ids (tuple): 사용할 카메라 ID 목록
+            camera_source (str): 'csi', 'test'(videotestsrc), 'v4l2'(USB 카메라, camera_ids = /dev/videoN 번호), 'synthetic'(합성 프레임)
+        """
+        self.root = tk.Tk()
+        self.root.title("Camera " + ", ".join(map(str, camera_ids)) + " Control Panel")
+        self.root.geometry(f"{850 * len(camera_ids)}x850")
+        self.root.resizable(True, True)
+        self.root.minsize(800, 850)
+        self.engine = None  # Start All로 시작한 공유 캡처 엔진
+
+        # 상단: 전체 캡처 버튼
+        toolbar = ttk.Frame(self.root, padding=(10, 5))
+        toolbar.pack(fill=tk.X)
+        self.start_all_button = ttk.Button(toolbar, text="Start All", command=self.start_all)
+        self.start_all_button.pack(side=tk.LEFT)
+        self.stop_all_button = ttk.Button(toolbar, text="Stop All", command=self.stop_all, state=tk.DISABLED)
+        self.stop_all_button.pack(side=tk.LEFT, padx=(5, 0))
+        self.sync_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(toolbar, text="Synchronized (use the first camera's timing for all)", variable=self.sync_var).pack(side=tk.LEFT, padx=(10, 0))
+
+        # 카메라별 패널 (좌우로 나란히)
+        panes = ttk.PanedWindow(self.root, orient=tk.HORIZONTAL)
+        panes.pack(fill=tk.BOTH, expand=True)
+        self.panels = []
+        for camera_id in camera_ids:
+            frame = ttk.Frame(panes)
+            panes.add(frame, weight=1)
+            self.panels.append(CameraUI(camera_id=camera_id, master=frame, source=make_source(camera_id, camera_source)))
+
+    def start_all(self):
+        """
+        모든 카메라 캡처 시작 (하나의 캡처 엔진)
+        """
+        if self.engine is not None: return
+        if any(panel.is_capturing for panel in self.panels):
+            messagebox.showerror("Capture Running", "Stop the running captures before starting all cameras.")
+            return
+
+        # 모든 패널 입력값 검증 후 한꺼번에 시작
+        for panel in self.panels:
+            if not panel.validate_inputs(): return
+        for panel in self.panels:
+            panel.update_variables()
+
+        engine = CaptureEngine([(panel.source, panel.session_spec()) for panel in self.panels],
+                               on_finished=lambda engine: self.root.after(0, self._on_engine_finished), sync=self.sync_var.get())
+        for panel in self.panels:
+            panel.begin_capture(engine)
+        self.engine = engine
+        self.start_all_button.config(state=tk.DISABLED)
+        self.stop_all_button.config(state=tk.NORMAL)
+        engine.start()
+
+    def stop_all(self):
+        """
+        모든 카메라 캡처 중지
+        """
+        for panel in self.panels:
+            panel.stop_camera()
+
+    def _on_engine_finished(self):
+        """
+        공유 캡처 엔진 세션 종료 (메인 스레드)
+        """
+        self.engine = None
+        self.stop_all()
+        self.start_all_button.config(state=tk.NORMAL)
+        self.stop_all_button.config(state=tk.DISABLED)
+
+    def run(self):
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.mainloop()
+
+    def on_closing(self):
+        """
+        윈도우 종료 시 모든 패널 종료 후 윈도우 디스트로이
+        """
+        print("Closing application...")
+        for panel in self.panels:
+            panel.shutdown()
+        self.root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Control several cameras from one process and one window")
+    parser.add_argument('--cameras', type=int, nargs='+', default=[0, 1], help="camera sensor IDs (default: 0 1)")
+    parser.add_argument('--source', choices=('csi', 'test', 'v4l2', 'synthetic'), default='csi')
+    args = parser.parse_args()
+
+    app = MultiCameraUI(camera_ids=args.cameras, camera_source=args.source)
+    app.run()
+
+
+if __name__ == '__main__':
+    main()
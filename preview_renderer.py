@@ -0,0 +1,240 @@
+import threading
+import time
+import tkinter as tk
+
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class PreviewRenderer:
+    """
+    미리보기 캔버스 렌더러
+
+    카메라 프레임 속도와 관계없이 설정한 UI 프레임 속도로만 그림
+    - PhotoImage 하나와 캔버스 이미지/ROI 아이템을 계속 재사용 (픽셀만 갱신)
+    - 캔버스 크기가 바뀔 때까지 축소 비율/여백(letterbox) 계산 결과 캐시
+    - 화면에 표시되지 않을 프레임(다음 그리기 전에 새 프레임이 온 경우)은 처리하지 않음
+
+    모든 메서드는 Tk 메인 스레드에서 호출해야 함
+    """
+    def __init__(self, canvas, ui_fps=15):
+        """
+        Args:
+            canvas (tk.Canvas): 미리보기를 그릴 캔버스
+            ui_fps (float): 최대 그리기 속도 (fps)
+        """
+        self.canvas = canvas
+        self.ui_fps = ui_fps
+
+        self._photo = None  # 재사용하는 PhotoImage
+        self._image_item = None  # 캔버스 이미지 아이템
+        self._roi_item = None  # 캔버스 ROI 사각형 아이템
+        self._layout_key = None  # (캔버스 w, h, 프레임 w, h)
+        self._layout = None
+        self._resized = None  # 축소 결과 버퍼 (BGR)
+        self._rgb = None  # 색 변환 결과 버퍼 (RGB)
+
+        self._pending = None  # 다음에 그릴 (frame, frame_id, roi)
+        self._timer = None  # 예약된 after() id
+        self._last_render = 0.0
+        self._last_id = None
+        self._last_roi = None
+
+        # 통계
+        self.rendered = 0  # 실제로 그린 프레임 수
+        self.skipped = 0  # 그리기 전에 새 프레임으로 대체된 프레임 수
+        self.render_time = 0.0  # 그리기에 쓴 총 시간 (초)
+
+        self.canvas.bind("<Configure>", self._on_configure, add="+")
+
+    def _on_configure(self, event):
+        """캔버스 크기 변경 시 레이아웃 캐시 무효화"""
+        self._layout_key = None
+
+    def layout(self, frame_width, frame_height):
+        """
+        프레임을 캔버스 중앙에 비율 유지해서 표시할 때의 배치
+
+        캔버스/프레임 크기가 같으면 캐시된 값 반환
+
+        Returns:
+            dict: 'scale', 'width', 'height'(축소 크기), 'x_offset', 'y_offset'(캔버스 내 위치)
+                  캔버스가 아직 렌더링되지 않았으면 None
+        """
+        canvas_width, canvas_height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1:
+            return None
+        key = (canvas_width, canvas_height, frame_width, frame_height)
+        if key != self._layout_key:
+            scale = min(canvas_width / frame_width, canvas_height / frame_height)
+            new_width, new_height = max(1, int(frame_width * scale)), max(1, int(frame_height * scale))
+            self._layout = {
+                'scale': scale,
+                'width': new_width,
+                'height': new_height,
+                'x_offset': (canvas_width - new_width) / 2,
+                'y_offset': (canvas_height - new_height) / 2,
+            }
+            self._layout_key = key
+        return self._layout
+
+    def submit(self, frame, frame_id=None, roi=None):
+        """
+        새 프레임 그리기 요청
+
+        마지막으로 그린 뒤 1/ui_fps초가 지났으면 바로 그리고,
+        아니면 남은 시간 뒤에 (그때까지 들어온 가장 최신 프레임만) 그림
+
+        Args:
+            frame (np.ndarray): BGR 프레임
+            frame_id: 프레임 식별자 (같은 프레임 중복 그리기 방지)
+            roi (tuple): (xmin, ymin, width, height) 프레임 좌표, None이면 표시 안 함
+        """
+        if self._pending is not None:
+            self.skipped += 1
+        self._pending = (frame, frame_id, roi)
+        if self._timer is not None:
+            return
+
+        wait = self._last_render + 1.0 / self.ui_fps - time.perf_counter()
+        if wait <= 0:
+            self._flush()
+        else:
+            self._timer = self.canvas.after(int(wait * 1000) + 1, self._flush)
+
+    def _flush(self):
+        """예약된 최신 프레임 그리기"""
+        self._timer = None
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self.render(*pending)
+
+    def render(self, frame, frame_id=None, roi=None, frame_size=None):
+        """
+        프레임을 캔버스에 즉시 그림
+
+        Args:
+            frame (np.ndarray): BGR 프레임
+            frame_id: 프레임 식별자 (같은 프레임 중복 그리기 방지)
+            roi (tuple): (xmin, ymin, width, height) 프레임 좌표, None이면 표시 안 함
+            frame_size (tuple): ROI 좌표 기준 프레임 크기 (w, h)
+                미리보기용 저해상도 프레임을 그릴 때 원본 캡처 프레임 크기 지정 (없으면 frame 크기)
+
+        Returns:
+            bool: 그렸으면 True
+        """
+        if frame_id is not None and frame_id == self._last_id and roi == self._last_roi:
+            return False
+
+        width, height = frame_size if frame_size else frame.shape[1::-1]
+        layout = self.layout(width, height)
+        if layout is None:
+            return False
+
+        t0 = time.perf_counter()
+        size = (layout['width'], layout['height'])
+
+        # 축소/색 변환 결과 버퍼 재사용 (크기가 바뀔 때만 새로 할당)
+        if self._resized is None or self._resized.shape[1::-1] != size:
+            self._resized = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._rgb = np.empty_like(self._resized)
+        cv2.resize(frame, size, dst=self._resized)
+        cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        pil_image = Image.fromarray(self._rgb)
+
+        # PhotoImage는 크기가 바뀔 때만 새로 만들고 평소엔 픽셀만 갱신
+        if self._photo is None or (self._photo.width(), self._photo.height()) != size:
+            self._photo = ImageTk.PhotoImage(image=pil_image)
+            if self._image_item is None:
+                self._image_item = self.canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
+            else:
+                self.canvas.itemconfig(self._image_item, image=self._photo)
+        else:
+            self._photo.paste(pil_image)
+        self.canvas.coords(self._image_item, layout['x_offset'], layout['y_offset'])
+
+        # ROI 사각형은 캔버스 아이템으로 (픽셀에 직접 그리지 않음)
+        if self._roi_item is None:
+            self._roi_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="#00ff00", width=2)
+        if roi is not None:
+            xmin, ymin, roi_width, roi_height = roi
+            x0 = layout['x_offset'] + xmin * layout['scale']
+            y0 = layout['y_offset'] + ymin * layout['scale']
+            self.canvas.coords(self._roi_item, x0, y0, x0 + roi_width * layout['scale'], y0 + roi_height * layout['scale'])
+            self.canvas.itemconfig(self._roi_item, state=tk.NORMAL)
+            self.canvas.tag_raise(self._roi_item, self._image_item)
+        else:
+            self.canvas.itemconfig(self._roi_item, state=tk.HIDDEN)
+
+        self._last_id = frame_id
+        self._last_roi = roi
+        self._last_render = time.perf_counter()
+        self.rendered += 1
+        self.render_time += self._last_render - t0
+        return True
+
+    def stats(self):
+        """
+        렌더링 통계
+
+        Returns:
+            dict: 그린 프레임 수, 건너뛴 프레임 수, 프레임당 평균 그리기 시간(ms)
+        """
+        return {
+            'rendered': self.rendered,
+            'skipped': self.skipped,
+            'ms_per_frame': self.render_time / self.rendered * 1000 if self.rendered else 0.0,
+        }
+
+
+class FrameMailbox:
+    """
+    미리보기 스레드 → Tk 메인 루프 최신 프레임 전달함 (슬롯 1개)
+
+    미리보기 스레드는 post()로 최신 값만 덮어쓰고 Tk 이벤트를 만들지 않음
+    메인 루프의 주기적인 after() 펌프가 take()로 꺼내 감
+    메인 루프가 멈춰 있어도 대기 중인 프레임은 항상 1개 이하
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._item = None
+        self._dirty = False  # 아직 꺼내 가지 않은 새 값이 있는지
+
+        # 통계
+        self.posted = 0  # 들어온 값 수
+        self.delivered = 0  # 메인 루프가 꺼내 간 값 수
+        self.coalesced = 0  # 꺼내 가기 전에 새 값으로 덮어써진 값 수
+
+    def post(self, item):
+        """
+        새 값 넣기 (이전 값이 아직 안 꺼내졌으면 덮어씀)
+        """
+        with self._lock:
+            if self._dirty:
+                self.coalesced += 1
+            self._item = item
+            self._dirty = True
+            self.posted += 1
+
+    def take(self):
+        """
+        새 값 꺼내기
+
+        Returns:
+            마지막으로 넣은 값, 새 값이 없으면 None
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+            self._dirty = False
+            self.delivered += 1
+            return self._item
+
+    def stats(self):
+        """
+        Returns:
+            dict: 들어온/꺼내 간/덮어써진 값 수
+        """
+        with self._lock:
+            return {'posted': self.posted, 'delivered': self.delivered, 'coalesced': self.coalesced}
@@ -0,0 +1,201 @@
+"""
+ROI 색 통계 (캡처마다 인코딩 전에 메모리의 ROI로 계산, 버전 폴더에 열 단위로 기록)
+
+분석할 때 저장한 PNG를 다시 열지 않고 세션의 색 변화 곡선을 바로 읽도록
+캡처 스레드에서 ROI를 복사한 직후 계산해서 roi_stats.npy(구조체 배열)에 한 줄씩 이어서 씀
+- 'seq': 캡처 순번 (매니페스트 seq, 파일명 앞부분)
+- 'timestamp_ns': 촬영 시각 (세션 시작 기준)
+- 'mean', 'std': BGR 채널별 평균/표준편차 (전체 픽셀)
+- 'hsv': HSV 평균 (H는 원형 평균 0-180, S/V 0-255)
+- 'lab': Lab 평균 (L 0-100, a/b -128-127)
+HSV/Lab은 step 간격으로 건너뛴 픽셀로 계산
+
+profile=True면 ROI 긴 축(260x800 ROI는 세로)을 따라 줄별 BGR 평균을 roi_profile.npy((N, 긴 축, 3) float32)에 씀
+
+줄을 쓸 때마다 .npy 헤더의 줄 수를 고쳐 쓰므로 세션 중에도, 비정상 종료 뒤에도 표준 .npy로 열림:
+    stats = np.load('roi_stats.npy', mmap_mode='r')
+    stats['lab'][:, 0]  # L 곡선
+    profile = np.load('roi_profile.npy', mmap_mode='r')
+
+260x800 ROI 기준 통계 약 1ms, profile 약 1.3ms 추가 (benchmarks/bench_stages.py의 roi_stats)
+"""
+import os
+import struct
+
+import cv2
+import numpy as np
+
+STATS_NAME = 'roi_stats.npy'
+PROFILE_NAME = 'roi_profile.npy'
+STATS_DTYPE = np.dtype([('seq', '<i8'), ('timestamp_ns', '<i8'), ('mean', '<f4', (3,)), ('std', '<f4', (3,)),
+                        ('hsv', '<f4', (3,)), ('lab', '<f4', (3,))])
+HEADER_SIZE = 256  # 고정 크기 .npy 헤더 (줄 수가 바뀌어도 데이터 위치가 그대로)
+
+# OpenCV 8비트 H(0-179, 2도 단위)의 원형 평균용
+_HUE_ANGLES = np.arange(180) * (np.pi / 90)
+_HUE_COS = np.cos(_HUE_ANGLES)
+_HUE_SIN = np.sin(_HUE_ANGLES)
+
+
+def _npy_header(dtype, shape):
+    """
+    HEADER_SIZE 크기의 .npy 1.0 헤더
+    """
+    header = f"{{'descr': {np.lib.format.dtype_to_descr(dtype)!r}, 'fortran_order': False, 'shape': {tuple(shape)!r}, }}"
+    header = header.ljust(HEADER_SIZE - 10 - 1) + '\n'
+    if len(header) != HEADER_SIZE - 10:
+        raise ValueError(f"npy header longer than {HEADER_SIZE} bytes")
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+class _GrowingArray:
+    """
+    줄을 이어서 쓰는 .npy 파일 (첫 축 길이만 늘어남)
+    """
+    def __init__(self, path, dtype, shape):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)  # 한 줄의 shape
+        self.count = 0
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.pwrite(self._fd, _npy_header(self.dtype, (0,) + self.shape), 0)
+        self._row_bytes = self.dtype.itemsize * int(np.prod(self.shape, dtype=np.int64))
+
+    def append(self, row):
+        """
+        한 줄 쓰고 헤더의 줄 수 갱신 (데이터 먼저, 헤더 나중: 중간에 끊겨도 헤더의 줄은 모두 온전함)
+        """
+        os.pwrite(self._fd, np.ascontiguousarray(row, dtype=self.dtype).tobytes(), HEADER_SIZE + self.count * self._row_bytes)
+        self.count += 1
+        os.pwrite(self._fd, _npy_header(self.dtype, (self.count,) + self.shape), 0)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def hue_mean(hue):
+    """
+    H 채널 원형 평균 (빨강 근처에서 0과 179가 섞여도 평균이 90 근처로 가지 않게)
+
+    Args:
+        hue (np.ndarray): OpenCV 8비트 H (0-179)
+
+    Returns:
+        float: 0-180
+    """
+    counts = cv2.calcHist([np.ascontiguousarray(hue)], [0], None, [180], [0, 180]).ravel()  # 픽셀 대신 H 값별 개수로
+    angle = np.arctan2(counts @ _HUE_SIN, counts @ _HUE_COS)
+    return float(angle % (2 * np.pi) * (90 / np.pi))
+
+
+def warm_up_colour_conversions():
+    """
+    HSV/Lab 변환을 1x1 프레임으로 한 번 실행
+    첫 Lab 변환은 OpenCV가 변환표를 만드느라 약 100ms 걸리므로 캡처 스레드에서 처음 변환하기 전에 호출
+    (ColourTrigger, RoiStatsWriter 생성 시)
+    """
+    dummy = np.zeros((1, 1, 3), dtype=np.uint8)
+    cv2.cvtColor(dummy, cv2.COLOR_BGR2Lab)
+    cv2.cvtColor(dummy, cv2.COLOR_BGR2HSV)
+
+
+def colour_stats(frame, step=2):
+    """
+    ROI 한 장의 색 통계
+
+    Args:
+        frame (np.ndarray): (h, w, 3) BGR uint8 ROI
+        step (int): HSV/Lab 평균을 낼 때 건너뛸 픽셀 간격
+
+    Returns:
+        dict: 'mean', 'std', 'hsv', 'lab' (각각 길이 3)
+    """
+    mean, std = cv2.meanStdDev(frame)
+    small = frame
+    if step > 1:  # step 간격 픽셀만 (nearest 축소가 슬라이스 복사보다 빠름)
+        small = cv2.resize(frame, (max(1, frame.shape[1] // step), max(1, frame.shape[0] // step)), interpolation=cv2.INTER_NEAREST)
+    hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+    hsv_mean = cv2.mean(hsv)
+    lab = cv2.mean(cv2.cvtColor(small, cv2.COLOR_BGR2Lab))
+    return {
+        'mean': mean.ravel(),
+        'std': std.ravel(),
+        'hsv': (hue_mean(hsv[..., 0]), hsv_mean[1], hsv_mean[2]),
+        'lab': (lab[0] * 100 / 255, lab[1] - 128, lab[2] - 128),  # 8비트 Lab → L 0-100, a/b -128-127
+    }
+
+
+def row_profile(frame):
+    """
+    ROI 긴 축을 따라 줄별 BGR 평균
+
+    Returns:
+        np.ndarray: (긴 축 길이, 3) float32
+    """
+    if frame.shape[1] > frame.shape[0]:
+        return cv2.reduce(frame, 0, cv2.REDUCE_AVG, dtype=cv2.CV_32F).reshape(-1, 3)
+    return cv2.reduce(frame, 1, cv2.REDUCE_AVG, dtype=cv2.CV_32F).reshape(-1, 3)
+
+
+class RoiStatsWriter:
+    """
+    카메라 하나의 ROI 색 통계 기록 (캡처 스레드에서만 사용)
+    """
+    def __init__(self, folder, shape, profile=False, step=2):
+        """
+        Args:
+            folder (str): 버전 폴더
+            shape (tuple): ROI shape (h, w, 3)
+            profile (bool): 긴 축 줄별 평균도 기록
+            step (int): HSV/Lab 평균을 낼 때 건너뛸 픽셀 간격
+        """
+        self.step = max(1, int(step))
+        self.stats = _GrowingArray(os.path.join(folder, STATS_NAME), STATS_DTYPE, ())
+        self.profile = _GrowingArray(os.path.join(folder, PROFILE_NAME), np.float32, (max(shape[:2]), 3)) if profile else None
+        self._row = np.zeros((), dtype=STATS_DTYPE)
+        warm_up_colour_conversions()
+
+    @property
+    def count(self):
+        return self.stats.count
+
+    def append(self, seq, timestamp_ns, frame):
+        """
+        저장할 ROI 한 장의 통계 기록
+
+        Args:
+            seq (int): 캡처 순번
+            timestamp_ns (int): 촬영 시각 (세션 시작 기준)
+            frame (np.ndarray): ROI (저장 큐에 넣기 전 메모리의 프레임)
+        """
+        row = self._row
+        row['seq'] = seq
+        row['timestamp_ns'] = timestamp_ns
+        for name, value in colour_stats(frame, self.step).items():
+            row[name] = value
+        self.stats.append(row)
+        if self.profile is not None:
+            self.profile.append(row_profile(frame))
+
+    def close(self):
+        self.stats.close()
+        if self.profile is not None:
+            self.profile.close()
+
+
+def read_roi_stats(folder):
+    """
+    버전 폴더의 ROI 색 통계 읽기
+
+    Args:
+        folder (str): 버전 폴더
+
+    Returns:
+        tuple: (통계 구조체 배열, 줄별 평균 배열 또는 None), 둘 다 읽기 전용 메모리 맵
+    """
+    stats = np.load(os.path.join(folder, STATS_NAME), mmap_mode='r')
+    profile_path = os.path.join(folder, PROFILE_NAME)
+    profile = np.load(profile_path, mmap_mode='r') if os.path.exists(profile_path) else None
+    return stats, profile
@@ -0,0 +1,98 @@
+"""
+세션 배열 (메모리 맵 raw 저장)
+
+start_delay와 cap_time으로 세션의 캡처 수 N이 정해지고 ROI로 프레임 크기가 정해지므로
+세션 시작 전에 (N, h, w, 3) uint8 배열 파일(frames.npy)을 미리 만들어 두고
+캡처마다 링 버퍼에서 k번째 칸으로 ROI를 바로 복사 (인코딩/파일 생성 없음)
+
+프레임별 정보는 옆 파일(frames_index.npy, 구조체 배열)에 기록
+- 'scheduled_ns': 예정 시각 (세션 시작 기준)
+- 'timestamp_ns': 촬영 시각 (세션 시작 기준)
+- 'seq': 프레임 번호
+- 'phase': 캡처 구간
+- 'written': 저장됐는지 (세션을 중간에 멈췄거나 프레임을 못 고른 칸은 0)
+
+두 파일 모두 표준 .npy라서 분석할 때 복사 없이 열 수 있음:
+    frames = np.load('frames.npy', mmap_mode='r')
+    index = np.load('frames_index.npy', mmap_mode='r')
+    frames[index['written'] == 1]
+"""
+import os
+import shutil
+
+import numpy as np
+
+FRAMES_NAME = 'frames.npy'
+INDEX_NAME = 'frames_index.npy'
+INDEX_DTYPE = np.dtype([('scheduled_ns', '<i8'), ('timestamp_ns', '<i8'), ('seq', '<i8'), ('phase', '<i2'), ('written', 'u1')])
+
+
+class SessionArray:
+    """
+    세션 프레임 배열 파일 (np.lib.format.open_memmap)
+
+    캡처 스레드 하나에서만 쓰기 (칸마다 한 번)
+    """
+    def __init__(self, folder, count, shape, reserve=True, preallocate=False):
+        """
+        Args:
+            folder (str): 저장 폴더 (버전 폴더)
+            count (int): 캡처 수 N
+            shape (tuple): 프레임 shape (h, w, 3)
+            reserve (bool): 파일 크기만큼 디스크 공간이 남아 있는지 확인
+                (메모리 맵 파일은 실제로 쓸 때 공간을 할당하므로 디스크가 차면 캡처 중에 프로세스가 죽음)
+            preallocate (bool): 배열 파일의 디스크 블록을 미리 할당 (세션 중 다른 프로그램이 공간을 쓰지 못하게)
+
+        Raises:
+            RuntimeError: 디스크 공간이 부족할 때
+        """
+        self.folder = folder
+        self.count = count
+        self.shape = tuple(shape)
+        self.nbytes = count * int(np.prod(self.shape))
+        if reserve:
+            free = shutil.disk_usage(folder).free
+            if self.nbytes > free:
+                raise RuntimeError(f"Session array needs {self.nbytes / 1e9:.2f} GB but only {free / 1e9:.2f} GB is free in {folder}")
+
+        self.frames = np.lib.format.open_memmap(os.path.join(folder, FRAMES_NAME), mode='w+', dtype=np.uint8, shape=(count,) + self.shape)
+        self.index = np.lib.format.open_memmap(os.path.join(folder, INDEX_NAME), mode='w+', dtype=INDEX_DTYPE, shape=(count,))
+        if preallocate and hasattr(os, 'posix_fallocate'):
+            with open(os.path.join(folder, FRAMES_NAME), 'r+b') as f:
+                os.posix_fallocate(f.fileno(), 0, os.fstat(f.fileno()).st_size)
+        self.written = 0
+
+    def slot(self, k):
+        """
+        k번째 프레임 칸 (링 버퍼 read(out=...)로 바로 복사)
+
+        Returns:
+            np.ndarray: (h, w, 3) view
+        """
+        return self.frames[k]
+
+    def commit(self, k, scheduled_ns, timestamp_ns, seq, phase):
+        """
+        k번째 칸에 프레임을 복사한 뒤 정보 기록
+        """
+        self.index[k] = (scheduled_ns, timestamp_ns, seq, phase, 1)
+        self.written += 1
+
+    def close(self):
+        """
+        디스크에 반영하고 메모리 맵 해제
+        """
+        self.frames.flush()
+        self.index.flush()
+        self.frames = self.index = None  # 참조가 없어지면 메모리 맵 해제
+
+
+def open_session_array(folder):
+    """
+    저장된 세션 배열 읽기 전용으로 열기 (복사 없음)
+
+    Returns:
+        tuple: (frames (N, h, w, 3), index 구조체 배열)
+    """
+    return (np.load(os.path.join(folder, FRAMES_NAME), mmap_mode='r'),
+            np.load(os.path.join(folder, INDEX_NAME), mmap_mode='r'))
@@ -0,0 +1,127 @@
+"""
+세션 매니페스트 (버전 폴더의 manifest.jsonl)
+
+캡처마다 JSON 한 줄을 이어서 씀 (append-only, 줄 단위로 바로 flush)
+- 세션 중에도 tail로 따라 읽을 수 있음 (follow_manifest)
+- 분석할 때 파일 목록/파일명 파싱 없이 한 번에 순차로 읽음 (read_manifest)
+
+줄마다 항목:
+    'seq': 카메라별 캡처 순번 (0부터, 파일명 앞부분)
+    'frame_seq': 프레임 소스의 프레임 번호
+    'phase': 캡처 구간 (0부터)
+    'scheduled_ns': 예정 시각 (세션 시작 기준)
+    'timestamp_ns': 촬영 시각 (세션 시작 기준)
+    'roi': [xmin, ymin, width, height] (전체 프레임 기준)
+    'path': 버전 폴더 기준 저장 위치 (컨테이너/배열이면 'frames.jfc[이름]', 'frames.npy[칸]')
+    'bytes': 저장한 크기, 'checksum': 저장한 데이터 crc32 (16진수)
+    'status': 'saved', 'dropped'(저장 큐에서 버려짐), 'error'(저장 실패),
+              'duplicate'(직전에 저장한 프레임과 같은 프레임), 'unchanged'(변화 감지: 마지막 저장 프레임과 차이 없음)
+              (duplicate/unchanged는 저장하지 않고 path에 마지막으로 저장한 위치)
+    'staged': 버스트 구간에서 메모리에 모았다가 저장했는지
+    'change': 변화 감지를 켰을 때 마지막 저장 프레임과의 변화량 점수
+    'trigger_rate', 'dense': triggered 구간에서 ROI 색 변화 속도와 dense 간격으로 저장 중이었는지
+
+저장이 끝나는 순서대로 기록하므로 여러 저장 워커를 쓰면 줄 순서와 seq 순서가 다를 수 있음
+(read_manifest는 seq 순으로 정렬)
+"""
+import json
+import os
+import threading
+import time
+
+MANIFEST_NAME = 'manifest.jsonl'
+
+
+class SessionManifest:
+    """
+    매니페스트 파일 쓰기 (저장 워커 여러 개에서 동시에 append 가능)
+    """
+    def __init__(self, folder):
+        """
+        Args:
+            folder (str): 버전 폴더
+        """
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self._file = open(self.path, 'a', buffering=1)  # 줄 단위 버퍼 (tail로 바로 보이도록)
+        self._lock = threading.Lock()
+        self.rows = 0
+
+    def append(self, row):
+        """
+        한 줄 추가
+
+        Args:
+            row (dict): 캡처 정보 (모듈 설명 항목)
+        """
+        line = json.dumps(row, separators=(',', ':')) + '\n'
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self.rows += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_manifest(path):
+    """
+    매니페스트 읽기 (한 번 순차로 읽고 seq 순 정렬)
+
+    마지막 줄이 잘렸으면(세션 중이거나 비정상 종료) 그 줄은 건너뜀
+
+    Args:
+        path (str): manifest.jsonl 또는 버전 폴더
+
+    Returns:
+        list: 줄마다 dict
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, MANIFEST_NAME)
+    with open(path) as f:
+        data = f.read()
+    rows = []
+    for line in data.splitlines():
+        try:
+            rows.append(json.loads(line))
+        except ValueError:
+            continue
+    rows.sort(key=lambda row: row['seq'])
+    return rows
+
+
+def follow_manifest(path, should_continue=lambda: True, poll=0.2):
+    """
+    세션 중 매니페스트 따라 읽기 (tail -f)
+
+    Args:
+        path (str): manifest.jsonl 또는 버전 폴더
+        should_continue: False를 반환하면 종료
+        poll (float): 새 줄 확인 간격 (초)
+
+    Yields:
+        dict: 새로 추가된 줄 (기록된 순서)
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, MANIFEST_NAME)
+    while not os.path.exists(path):
+        if not should_continue():
+            return
+        time.sleep(poll)
+    with open(path) as f:
+        partial = ''
+        while True:
+            line = f.readline()
+            if not line:
+                if not should_continue():
+                    return
+                time.sleep(poll)
+                continue
+            partial += line
+            if not partial.endswith('\n'):
+                continue  # 아직 다 안 쓴 줄
+            yield json.loads(partial)
+            partial = ''
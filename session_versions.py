@@ -0,0 +1,61 @@
+"""
+세션 버전 폴더 번호 할당 (여러 프로세스에서 동시에 시작해도 안전)
+
+base_path/target/titer 아래 다음 버전 번호를 카운터 파일(.version)에서 읽고
+- 카운터 파일을 fcntl 잠금으로 보호 (main_0.py, main_1.py가 같은 titer로 동시에 시작해도 번호가 겹치지 않게)
+- 폴더는 os.mkdir로 만들어서 이미 있으면 다음 번호 (다른 프로그램이 만든 폴더, 잠금을 못 쓰는 OS)
+- 카운터 파일이 없거나 깨졌으면 한 번만 기존 숫자 폴더를 찾아서 다시 만듦
+기존 폴더 수와 관계없이 세션 시작마다 파일 하나 읽고 쓰기
+"""
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 mkdir만으로 중복 방지
+    fcntl = None
+
+COUNTER_NAME = '.version'
+
+
+def scan_next_version(save_path):
+    """
+    기존 숫자 폴더들 중 최대값 + 1 (없으면 0), 카운터 파일이 없을 때만 사용
+    """
+    existing_folders = [d for d in os.listdir(save_path) if d.isdigit() and os.path.isdir(os.path.join(save_path, d))]
+    return max(map(int, existing_folders)) + 1 if existing_folders else 0
+
+
+def next_version_path(save_path):
+    """
+    새 버전 폴더 생성
+
+    카운터 파일 잠금 → 번호 읽기 → 폴더 생성(이미 있으면 다음 번호) → 다음 번호 기록 → 잠금 해제
+
+    Args:
+        save_path (str): 버전 폴더들을 만들 폴더 (base_path/target/titer)
+
+    Returns:
+        str: 생성한 버전 폴더 경로
+    """
+    os.makedirs(save_path, exist_ok=True)
+    fd = os.open(os.path.join(save_path, COUNTER_NAME), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        data = os.pread(fd, 32, 0).strip()
+        version = int(data) if data.isdigit() else scan_next_version(save_path)
+
+        # 이미 있는 번호는 건너뜀 (mkdir은 원자적이라 같은 번호를 두 프로세스가 가질 수 없음)
+        while True:
+            version_path = os.path.join(save_path, str(version))
+            try:
+                os.mkdir(version_path)
+                break
+            except FileExistsError:
+                version += 1
+
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, f"{version + 1}\n".encode(), 0)
+        return version_path
+    finally:
+        os.close(fd)  # 파일을 닫으면 잠금도 해제
@@ -0,0 +1,66 @@
+"""
+change_gate 방식별 기본 threshold와 세션 설정 검증 테스트
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from capture_codecs import synthetic_frame
+from capture_engine import complete_session_spec, validate_session_spec
+from change_gate import GATE_THRESHOLDS, ChangeGate
+
+SHAPE = (800, 260, 3)  # 기본 ROI
+
+
+def changing_frames(count, step=12):
+    """밝기가 프레임마다 step씩 바뀌는 ROI (노이즈 포함)"""
+    base = synthetic_frame(SHAPE).astype(np.int16)
+    return [np.clip(base // 2 + i * step, 0, 255).astype(np.uint8) for i in range(count)]
+
+
+@pytest.mark.parametrize('method', ['mad', 'hist'])
+def test_default_threshold_saves_changing_frames(method):
+    """기본 설정으로 실제로 바뀌는 프레임은 모두 저장"""
+    gate = ChangeGate(method)
+    assert gate.threshold == GATE_THRESHOLDS[method]
+    results = [gate.check(frame, i * 100_000_000)[0] for i, frame in enumerate(changing_frames(10))]
+    assert all(results)
+    assert gate.blocked == 0
+
+
+@pytest.mark.parametrize('method', ['mad', 'hist'])
+def test_default_threshold_blocks_sensor_noise(method):
+    """같은 장면에 노이즈만 다르면 저장하지 않음"""
+    rng = np.random.default_rng(1)
+    base = synthetic_frame(SHAPE).astype(np.int16)
+    gate = ChangeGate(method)
+    for i in range(5):
+        frame = np.clip(base + rng.normal(0, 1, base.shape), 0, 255).astype(np.uint8)
+        gate.check(frame, i * 100_000_000)
+    assert gate.passed == 1
+    assert gate.blocked == 4
+
+
+def test_keyframe_saves_without_change():
+    gate = ChangeGate('hist', keyframe_s=1.0)
+    frame = synthetic_frame(SHAPE)
+    assert gate.check(frame, 0)[0]
+    assert not gate.check(frame, 500_000_000)[0]
+    assert gate.check(frame, 1_000_000_000)[0]
+
+
+@pytest.mark.parametrize('method, threshold', [('hist', 2.0), ('hist', -0.1), ('mad', 300.0)])
+def test_validate_rejects_threshold_out_of_range(method, threshold):
+    spec = complete_session_spec({'change_gate': method, 'change_threshold': threshold})
+    with pytest.raises(ValueError):
+        validate_session_spec(spec)
+
+
+@pytest.mark.parametrize('method', ['off', 'mad', 'hist'])
+def test_validate_accepts_default_threshold(method):
+    validate_session_spec(complete_session_spec({'change_gate': method}))
@@ -0,0 +1,113 @@
+"""
+gst_pipeline ROI/flip 좌표 변환과 파이프라인 문자열 테스트 (GStreamer 없이 실행)
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gst_pipeline  # test_pipeline*은 pytest가 테스트로 모으지 않도록 모듈로 사용
+from gst_pipeline import VIDEOFLIP_METHODS, build, csi_pipeline, csi_pipeline_elements, flipped_size, roi_to_source, unflip_rect
+
+FLIP_METHODS = range(8)
+CAPTURE_SIZE = (64, 48)  # (width, height), 가로 세로가 달라야 회전 오류가 드러남
+
+
+def flip_image(image, flip_method):
+    """nvvidconv flip-method와 같은 변환 (numpy로 따로 구현한 기준)"""
+    return {
+        0: lambda a: a,
+        1: lambda a: np.rot90(a, 1),  # 90도 반시계
+        2: lambda a: np.rot90(a, 2),
+        3: lambda a: np.rot90(a, -1),  # 90도 시계
+        4: lambda a: a[:, ::-1],
+        5: lambda a: np.rot90(a, 2).T,  # 우상단-좌하단 대각선
+        6: lambda a: a[::-1],
+        7: lambda a: a.T,  # 좌상단-우하단 대각선
+    }[flip_method](image)
+
+
+def bounding_rect(mask):
+    """mask에서 True인 영역의 (x, y, w, h)"""
+    ys, xs = np.nonzero(mask)
+    return int(xs.min()), int(ys.min()), int(xs.max() - xs.min() + 1), int(ys.max() - ys.min() + 1)
+
+
+@pytest.mark.parametrize('flip_method', FLIP_METHODS)
+def test_unflip_rect_round_trip(flip_method):
+    """원본 좌표로 역변환한 사각형을 다시 flip하면 처음 사각형"""
+    rect = (6, 10, 14, 20)  # flip 이후 좌표
+    x, y, w, h = unflip_rect(rect, CAPTURE_SIZE, flip_method)
+    source = np.zeros(CAPTURE_SIZE[::-1], dtype=bool)
+    source[y:y + h, x:x + w] = True
+
+    flipped = flip_image(source, flip_method)
+    assert flipped.shape[::-1] == flipped_size(*CAPTURE_SIZE, flip_method)
+    assert bounding_rect(flipped) == rect
+    assert flipped.sum() == w * h
+
+
+@pytest.mark.parametrize('flip_method', FLIP_METHODS)
+def test_roi_to_source_round_trip(flip_method):
+    """화면 좌표 ROI → 센서 crop → flip → scale하면 같은 ROI (짝수 좌표 ROI, 화면 크기 = flip 이후 크기의 절반)"""
+    capture_size = (128, 96)
+    display_size = tuple(v // 2 for v in flipped_size(*capture_size, flip_method))
+    roi = {'xmin': 4, 'ymin': 6, 'width': 10, 'height': 16}
+    left, top, right, bottom = roi_to_source(roi, flip_method, display_size, capture_size)
+    for v in (left, top, right, bottom):
+        assert v % 2 == 0
+
+    source = np.zeros(capture_size[::-1], dtype=bool)
+    source[top:bottom, left:right] = True
+    display = flip_image(source, flip_method)[::2, ::2]
+    assert bounding_rect(display) == (roi['xmin'], roi['ymin'], roi['width'], roi['height'])
+
+
+def test_roi_to_source_clamps_to_sensor():
+    """화면 밖으로 나가는 ROI는 센서 경계로 잘림"""
+    left, top, right, bottom = roi_to_source({'xmin': 0, 'ymin': 0, 'width': 1000, 'height': 1000}, 0, (64, 48), (64, 48))
+    assert (left, top, right, bottom) == (0, 0, 64, 48)
+
+
+def test_unflip_rect_unknown_method():
+    with pytest.raises(ValueError):
+        unflip_rect((0, 0, 1, 1), CAPTURE_SIZE, 8)
+
+
+def test_csi_pipeline_without_roi():
+    pipeline = csi_pipeline(sensor_id=1, capture_width=3280, capture_height=2464, display_width=720, display_height=958, framerate=21, flip_method=3)
+    assert pipeline == (
+        "nvarguscamerasrc sensor-id=1 ! "
+        "video/x-raw(memory:NVMM), width=(int)3280, height=(int)2464, framerate=(fraction)21/1 ! "
+        "nvvidconv flip-method=3 ! "
+        "video/x-raw, width=(int)720, height=(int)958, format=(string)BGRx ! "
+        "videoconvert ! video/x-raw, format=(string)BGR ! appsink"
+    )
+
+
+def test_csi_pipeline_with_roi():
+    """ROI crop은 nvvidconv의 센서 좌표 left/top/right/bottom, 출력은 ROI 크기"""
+    roi = {'xmin': 240, 'ymin': 100, 'width': 260, 'height': 800}
+    kwargs = dict(capture_width=3280, capture_height=2464, display_width=720, display_height=958, flip_method=3)
+    elements = csi_pipeline_elements(roi=roi, **kwargs)
+    left, top, right, bottom = roi_to_source(roi, 3, (720, 958), (3280, 2464))
+    assert elements[2] == f"nvvidconv flip-method=3 left={left} top={top} right={right} bottom={bottom}"
+    assert elements[3] == "video/x-raw, width=(int)260, height=(int)800, format=(string)BGRx"
+    assert csi_pipeline(roi=roi, **kwargs) == build(elements)
+
+
+@pytest.mark.parametrize('flip_method', FLIP_METHODS)
+def test_test_pipeline_with_roi(flip_method):
+    """videocrop right/bottom은 가장자리에서 잘라낼 픽셀 수, videoflip 번호는 변환표 사용"""
+    roi = {'xmin': 20, 'ymin': 30, 'width': 100, 'height': 200}
+    kwargs = dict(capture_width=1640, capture_height=1232, display_width=720, display_height=958, flip_method=flip_method)
+    elements = gst_pipeline.test_pipeline_elements(roi=roi, **kwargs)
+    left, top, right, bottom = roi_to_source(roi, flip_method, (720, 958), (1640, 1232))
+    assert f"videocrop left={left} top={top} right={1640 - right} bottom={1232 - bottom}" in elements
+    assert f"videoflip method={VIDEOFLIP_METHODS[flip_method]}" in elements
+    assert "video/x-raw, width=(int)100, height=(int)200" in elements
+    assert gst_pipeline.test_pipeline(roi=roi, **kwargs) == build(elements)